@@ -0,0 +1,4 @@
+"""Performance benchmarks for render and selection hot paths.
+
+Run ``python -m benchmarks.run --help`` from the repository root.
+"""
@@ -0,0 +1,252 @@
+"""Synthetic prompt libraries for load and scale testing.
+
+Generates a ``PROMPTS_DIR`` tree that follows the ``prompts/styles`` schema:
+numbered ``NN_slug.json`` templates with ``id``/``title``/``style``/
+``template``/``placeholders``/``metadata.path`` nested ``depth`` folders
+deep with ``fanout`` sub-folders per level, plus ``globals.json``,
+``Settings/settings.json``, optional (large) markdown reference files bound
+through ``type: file`` placeholders, and a ``placeholder-overrides.json``
+with entries for many template ids.
+
+Command line (from the repository root)::
+
+    python -m benchmarks.library /tmp/lib --templates 5000 --depth 3 \\
+        --fanout 6 --placeholders 8 --file-ratio 0.2 --reference-files 4 \\
+        --reference-kb 2048
+
+then point the app at it with ``PROMPT_AUTOMATION_PROMPTS=/tmp/lib/styles``
+and ``PROMPT_AUTOMATION_HOME=/tmp/lib``. Output is deterministic for a given
+``--seed``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+WORDS = (
+    "review plan refactor summarize draft verify outline compare estimate "
+    "triage release audit migrate document explain"
+).split()
+
+TOPICS = (
+    "api billing cache deploy search onboarding invoices metrics auth "
+    "payments scheduler exports reports sync alerts"
+).split()
+
+# Cycled through to build ``placeholders`` specs per template; mirrors the
+# shapes used by the shipped templates (multiline, list/bullet formatting,
+# remove_if_empty, defaults, options, reminders).
+_PLACEHOLDER_KINDS: Sequence[Dict[str, Any]] = (
+    {"label": "Context", "multiline": True},
+    {"label": "Goals", "multiline": True, "format": "list"},
+    {"label": "Constraints", "remove_if_empty": ["Constraints:"]},
+    {"label": "Output format", "default": "markdown"},
+    {"label": "Tasks", "multiline": True, "format": "bullet", "default": ""},
+    {"label": "Audience", "options": ["engineers", "managers", "customers"]},
+    {"label": "Notes", "multiline": True, "reminders": ["Keep it short"]},
+    {"label": "Priority", "default": "p2", "remove_if_empty": ["Priority:"]},
+)
+
+
+def _placeholders(count: int) -> List[Dict[str, Any]]:
+    specs = []
+    for i in range(count):
+        kind = _PLACEHOLDER_KINDS[i % len(_PLACEHOLDER_KINDS)]
+        name = kind["label"].lower().replace(" ", "_")
+        if i >= len(_PLACEHOLDER_KINDS):
+            name = f"{name}_{i // len(_PLACEHOLDER_KINDS)}"
+        specs.append({"name": name, **kind})
+    return specs
+
+
+def _template(
+    tid: int,
+    style: str,
+    rel: str,
+    placeholders: int,
+    with_files: bool,
+    rng: random.Random,
+) -> Dict[str, Any]:
+    word = WORDS[tid % len(WORDS)]
+    topic = rng.choice(TOPICS)
+    specs = _placeholders(placeholders)
+    if with_files:
+        specs.append({"name": "reference_file", "type": "file", "label": "Reference File", "render": "markdown", "default": ""})
+        specs.append({"name": "spec_file", "type": "file", "label": "Spec File"})
+    body = [f"# {word.title()} {topic} request {tid}"]
+    for spec in specs:
+        token = "{{" + spec["name"] + "}}"
+        prefix = (spec.get("remove_if_empty") or [f"{spec['label']}:"])[0]
+        if spec.get("type") == "file":
+            body += ["", token]
+        elif spec.get("format") in ("list", "bullet"):
+            body += [prefix, token]
+        else:
+            body.append(f"{prefix} {token}")
+    body.append("{{think_deeply}}")
+    return {
+        "schema": 1,
+        "id": tid,
+        "title": f"{word.title()} {topic} task {tid}",
+        "style": style,
+        "template": body,
+        "placeholders": specs,
+        "metadata": {
+            "path": rel,
+            "tags": [word, topic, style.lower()],
+            "version": 1,
+            "share_this_file_openly": rng.random() < 0.5,
+        },
+    }
+
+
+def _reference_text(kb: int, index: int) -> str:
+    section = (
+        f"## Section {{n}} of reference {index}\n\n"
+        "Paragraph describing the service contract, rollout notes and the\n"
+        "edge cases reviewers keep asking about. **Bold** and `code` spans.\n\n"
+        "- first bullet with a [link](https://example.com)\n"
+        "- second bullet\n\n"
+        "```python\nprint('example')\n```\n\n"
+    )
+    parts: List[str] = [f"# Reference {index}\n\n"]
+    size = len(parts[0])
+    n = 0
+    while size < kb * 1024:
+        n += 1
+        chunk = section.replace("{n}", str(n))
+        parts.append(chunk)
+        size += len(chunk)
+    return "".join(parts)
+
+
+def _folder(leaf: int, depth: int, fanout: int) -> Path:
+    """Map leaf folder number ``leaf`` onto a ``depth``-level tree."""
+    parts = [f"Style-{leaf // fanout ** (depth - 1):03d}"]
+    for level in range(depth - 2, -1, -1):
+        parts.append(f"group-{(leaf // fanout ** level) % fanout:02d}")
+    return Path(*parts)
+
+
+def build_library(
+    root: Path,
+    templates: int,
+    *,
+    per_folder: int = 25,
+    depth: int = 2,
+    fanout: int = 10,
+    placeholders: int = 4,
+    file_ratio: float = 0.0,
+    reference_files: int = 0,
+    reference_kb: int = 256,
+    override_ratio: float = 1.0,
+    seed: int = 0,
+) -> Path:
+    """Write ``templates`` templates under ``root/styles`` and return that dir.
+
+    ``file_ratio`` of the templates get ``reference_file``/``spec_file``
+    placeholders whose override paths point at one of ``reference_files``
+    markdown files of ``reference_kb`` KiB under ``root/references``.
+    ``override_ratio`` of the template ids receive ``placeholder-overrides.json``
+    entries (written to ``root``, i.e. ``PROMPT_AUTOMATION_HOME``).
+    """
+    if templates < 0 or per_folder < 1 or depth < 1 or fanout < 1 or placeholders < 0:
+        raise ValueError("templates must be >= 0 and per_folder/depth/fanout >= 1")
+    rng = random.Random(seed)
+    styles = root / "styles"
+    (styles / "Settings").mkdir(parents=True, exist_ok=True)
+    (styles / "Settings" / "settings.json").write_text("{}", encoding="utf-8")
+
+    refs: List[str] = []
+    if reference_files:
+        ref_dir = root / "references"
+        ref_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(reference_files):
+            path = ref_dir / f"reference-{i:02d}.md"
+            path.write_text(_reference_text(reference_kb, i), encoding="utf-8")
+            refs.append(str(path))
+
+    (styles / "globals.json").write_text(
+        json.dumps(
+            {
+                "schema": 1,
+                "type": "globals",
+                "global_placeholders": {"hallucinate": "", "think_deeply": "", "reference_file": "", "reminders": [""]},
+                "version": 1,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+    overrides: Dict[str, Dict[str, Any]] = {}
+    template_values: Dict[str, Dict[str, Any]] = {}
+    for i in range(templates):
+        tid = i + 1
+        rel_dir = _folder(i // per_folder, depth, fanout)
+        name = f"{(i % per_folder) + 1:02d}_{WORDS[tid % len(WORDS)]}-{tid}.json"
+        rel = (rel_dir / name).as_posix()
+        with_files = bool(refs) and rng.random() < file_ratio
+        data = _template(tid, rel_dir.parts[0], rel, placeholders, with_files, rng)
+        path = styles / rel_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        if rng.random() < override_ratio:
+            entry: Dict[str, Any] = {"constraints": {"skip": tid % 3 == 0}}
+            if with_files:
+                entry["spec_file"] = {"path": refs[tid % len(refs)], "skip": False}
+            overrides[str(tid)] = entry
+            template_values[str(tid)] = {"output_format": "markdown"}
+    (root / "placeholder-overrides.json").write_text(
+        json.dumps(
+            {
+                "templates": overrides,
+                "template_values": template_values,
+                "global_files": {"reference_file": refs[0]} if refs else {},
+            }
+        ),
+        encoding="utf-8",
+    )
+    return styles
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.library", description=__doc__.split("\n\n")[0])
+    parser.add_argument("root", type=Path, help="Output directory (styles/ and overrides are written inside)")
+    parser.add_argument("--templates", type=int, default=1000)
+    parser.add_argument("--per-folder", type=int, default=25, help="Templates per leaf folder")
+    parser.add_argument("--depth", type=int, default=2, help="Folder levels below the styles root")
+    parser.add_argument("--fanout", type=int, default=10, help="Sub-folders per level")
+    parser.add_argument("--placeholders", type=int, default=4, help="Regular placeholders per template")
+    parser.add_argument("--file-ratio", type=float, default=0.1, help="Share of templates with file placeholders")
+    parser.add_argument("--reference-files", type=int, default=2)
+    parser.add_argument("--reference-kb", type=int, default=256, help="Size of each reference file")
+    parser.add_argument("--override-ratio", type=float, default=1.0, help="Share of template ids with overrides")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    styles = build_library(
+        args.root,
+        args.templates,
+        per_folder=args.per_folder,
+        depth=args.depth,
+        fanout=args.fanout,
+        placeholders=args.placeholders,
+        file_ratio=args.file_ratio,
+        reference_files=args.reference_files,
+        reference_kb=args.reference_kb,
+        override_ratio=args.override_ratio,
+        seed=args.seed,
+    )
+    print(f"PROMPT_AUTOMATION_PROMPTS={styles}")
+    print(f"PROMPT_AUTOMATION_HOME={args.root}")
+    return 0
+
+
+__all__ = ["build_library", "main"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
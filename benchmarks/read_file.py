@@ -0,0 +1,72 @@
+"""Decode benchmark for ``file_reader.read_file_safe`` over mixed encodings.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.read_file                    # 4 MiB fixtures
+    python -m benchmarks.read_file --kb 16384 --output read-file.json
+
+Writes one reference-style fixture per encoding (``utf-8``, ``utf-8-sig``,
+``utf-16`` with BOM, BOM-less ``utf-16-le``/``utf-16-be`` and ``cp1252``)
+and times the uncached decode path (``cold``) plus a cached repeat read
+(``warm``). Results use the same JSON shape as ``benchmarks.run`` for trend
+tracking.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO = Path(__file__).resolve().parents[1]
+ENCODINGS = ("utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be", "cp1252")
+
+_UNICODE_LINE = "Résumé – naïve café “quoted” 👍 status: ok\n"
+_CP1252_LINE = "Résumé – naïve café “quoted” status: ok\n"
+
+
+def _fixture(root: Path, encoding: str, kb: int) -> Path:
+    line = _CP1252_LINE if encoding == "cp1252" else _UNICODE_LINE
+    raw = (line * (kb * 1024 // len(line.encode(encoding)) + 1)).encode(encoding)
+    path = root / f"reference-{encoding}.txt"
+    path.write_bytes(raw)
+    os.utime(path, (0, 0))  # old enough to be cacheable
+    return path
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.read_file", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--kb", type=int, default=4096, help="Approximate fixture size in KiB")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(REPO / "src"))
+    from benchmarks.run import _measure
+    from prompt_automation import file_reader
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="pa-bench-read-") as tmp:
+        for encoding in ENCODINGS:
+            path = _fixture(Path(tmp), encoding, args.kb)
+            cold = _measure(lambda: file_reader._read_file_uncached(path, str(path)), args.rounds)
+            results.append({"case": f"read_file_cold[{encoding}]", "size": args.kb, **cold})
+            file_reader.clear_file_cache()
+            warm = _measure(lambda: file_reader.read_file_safe(str(path)), args.rounds)
+            results.append({"case": f"read_file_warm[{encoding}]", "size": args.kb, **warm})
+            for row in results[-2:]:
+                print(f"{row['case']:<28} median {row['median_ms']:>10.3f} ms", file=sys.stderr)
+
+    report = {"results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,227 @@
+"""Benchmark runner for render and selection hot paths.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run                          # 100/1k/10k templates
+    python -m benchmarks.run --sizes 1000 --output results.json
+    python -m benchmarks.run --baseline results.json  # fail on >1.5x slowdowns
+
+Each library size is generated into a temporary directory and measured in a
+fresh interpreter with ``PROMPT_AUTOMATION_PROMPTS``/``PROMPT_AUTOMATION_HOME``
+pointing at it, so module-level path constants, caches and the user's real
+home directory are never shared between runs.
+
+Cases: ``fill_placeholders``, ``render_template`` (``values=`` mode),
+``render_capture`` (single-field capture template with a ``due:`` date),
+``hierarchy_scan`` (cold ``TemplateHierarchyScanner.scan``), ``filter_tree``,
+``browser_search`` (warm ``BrowserState.search``), ``load_overrides``
+(``storage._load_overrides``) and ``record_history``.
+
+Results are JSON (``--output``) for trend tracking. The exit status is 1 when
+a case exceeds its budget in ``benchmarks/thresholds.json`` (median ms per
+case and size) or is more than ``--max-ratio`` slower than ``--baseline``
+(slowdowns under ``--min-delta-ms`` are treated as noise).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO = Path(__file__).resolve().parents[1]
+THRESHOLDS = Path(__file__).resolve().parent / "thresholds.json"
+DEFAULT_SIZES = (100, 1000, 10000)
+
+
+# --- worker side (runs inside the per-size interpreter) ---------------------
+def _cases(styles: Path) -> Dict[str, Callable[[], Any]]:
+    from prompt_automation.gui.selector.model import BrowserState
+    from prompt_automation.history import record_history
+    from prompt_automation.menus import render_template
+    from prompt_automation.renderer import fill_placeholders, load_template
+    from prompt_automation.services.hierarchy import TemplateHierarchyScanner, filter_tree
+    from prompt_automation.variables import storage
+
+    sample = load_template(sorted(styles.rglob("01_*.json"))[0])
+    values: Dict[str, Any] = {
+        "context": "Background paragraph for the request.\n" * 6,
+        "goals": ["ship the fix", "keep tests green", "document it"],
+        "constraints": "",
+        "output_format": "markdown",
+    }
+
+    def _fresh() -> Dict[str, Any]:
+        return {**sample, "placeholders": [dict(p) for p in sample["placeholders"]]}
+
+    capture = {
+        "id": 900001,
+        "title": "Quick add",
+        "style": "Code",
+        "template": ["{{title}} — [{{priority}}]{{due_display}}", "{{acceptance_final}}"],
+        "placeholders": [{"name": "capture"}],
+        "logic": {"timezone": "UTC"},
+    }
+    capture_values = {"capture": "Email the board with Q3 forecast p1 due: tomorrow 4pm ac: Include runway"}
+
+    scanner = TemplateHierarchyScanner(styles)
+    tree = scanner.scan()
+    browser = BrowserState(styles)
+    browser.search("warm index")
+    text = render_template(_fresh(), values=dict(values))
+
+    def _scan() -> Any:
+        scanner.invalidate()
+        return scanner.scan()
+
+    return {
+        "fill_placeholders": lambda: fill_placeholders(sample["template"], values),
+        "render_template": lambda: render_template(_fresh(), values=dict(values)),
+        "render_capture": lambda: render_template(dict(capture), values=dict(capture_values)),
+        "hierarchy_scan": _scan,
+        "filter_tree": lambda: filter_tree(tree, "review"),
+        "browser_search": lambda: browser.search("review task"),
+        "load_overrides": storage._load_overrides,
+        "record_history": lambda: record_history(sample, rendered_text=text),
+    }
+
+
+def _measure(fn: Callable[[], Any], rounds: int, min_round_s: float = 0.02) -> Dict[str, Any]:
+    fn()  # warm-up
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_round_s or iterations >= 10_000:
+            break
+        iterations *= 10
+    samples = [elapsed / iterations]
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        samples.append((time.perf_counter() - start) / iterations)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "min_ms": round(min(samples) * 1000, 4),
+        "max_ms": round(max(samples) * 1000, 4),
+        "rounds": rounds,
+        "iterations": iterations,
+    }
+
+
+def _worker(size: int, styles: Path, rounds: int, only: List[str]) -> int:
+    results = []
+    for name, fn in _cases(styles).items():
+        if only and name not in only:
+            continue
+        results.append({"case": name, "size": size, **_measure(fn, rounds)})
+    json.dump(results, sys.stdout)
+    return 0
+
+
+# --- parent side ------------------------------------------------------------
+def _run_size(size: int, rounds: int, only: List[str]) -> List[Dict[str, Any]]:
+    from benchmarks.library import build_library
+
+    with tempfile.TemporaryDirectory(prefix=f"pa-bench-{size}-") as tmp:
+        root = Path(tmp)
+        styles = build_library(root, size)
+        env = dict(os.environ)
+        env.update(
+            {
+                "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO / "src"), str(REPO), env.get("PYTHONPATH")])),
+                "PROMPT_AUTOMATION_PROMPTS": str(styles),
+                "PROMPT_AUTOMATION_HOME": str(root),
+                "PROMPT_AUTOMATION_LOG_DIR": str(root / "logs"),
+                "PROMPT_AUTOMATION_DB": str(root / "usage.db"),
+                "PROMPT_AUTOMATION_HISTORY": "1",
+            }
+        )
+        cmd = [sys.executable, "-m", "benchmarks.run", "--worker", str(size), "--styles", str(styles), "--rounds", str(rounds)]
+        if only:
+            cmd += ["--cases", ",".join(only)]
+        proc = subprocess.run(cmd, env=env, cwd=REPO, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"benchmark worker for size {size} failed:\n{proc.stderr}")
+        return json.loads(proc.stdout)
+
+
+def _check(
+    results: List[Dict[str, Any]],
+    thresholds: Dict[str, Any],
+    baseline: List[Dict[str, Any]],
+    max_ratio: float,
+    min_delta_ms: float,
+) -> List[str]:
+    failures = []
+    prev = {(r["case"], r["size"]): r["median_ms"] for r in baseline}
+    for r in results:
+        budget = (thresholds.get(r["case"]) or {}).get(str(r["size"]))
+        if budget is not None and r["median_ms"] > budget:
+            failures.append(f"{r['case']}@{r['size']}: {r['median_ms']:.3f}ms > budget {budget}ms")
+        before = prev.get((r["case"], r["size"]))
+        if before and r["median_ms"] > before * max_ratio and r["median_ms"] - before > min_delta_ms:
+            failures.append(f"{r['case']}@{r['size']}: {r['median_ms']:.3f}ms > {max_ratio}x baseline {before:.3f}ms")
+    return failures
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated library sizes")
+    parser.add_argument("--cases", default="", help="Comma-separated subset of cases to run")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per case (median reported)")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--thresholds", type=Path, default=THRESHOLDS, help="Per-case budgets (median ms)")
+    parser.add_argument("--no-thresholds", action="store_true", help="Skip absolute budget checks")
+    parser.add_argument("--baseline", type=Path, help="Previous --output file to compare against")
+    parser.add_argument("--max-ratio", type=float, default=1.5, help="Allowed slowdown vs --baseline")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="Ignore baseline slowdowns smaller than this")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--styles", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    only = [c for c in args.cases.split(",") if c]
+
+    if args.worker is not None:
+        return _worker(args.worker, args.styles, args.rounds, only)
+
+    results: List[Dict[str, Any]] = []
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        for row in _run_size(size, args.rounds, only):
+            results.append(row)
+            print(f"{row['case']:<18} {size:>6}  median {row['median_ms']:>10.3f} ms  (x{row['iterations']})", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(report, indent=2))
+
+    thresholds = {}
+    if not args.no_thresholds and args.thresholds and args.thresholds.exists():
+        thresholds = json.loads(args.thresholds.read_text(encoding="utf-8"))
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"] if args.baseline else []
+    failures = _check(results, thresholds, baseline, args.max_ratio, args.min_delta_ms)
+    for f in failures:
+        print(f"REGRESSION {f}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,9 @@
 param(
   [Parameter(Mandatory=$false, Position=0)] [string] $Summary,
   [Parameter(Mandatory=$false, Position=1)] [string] $Note,
-  [switch] $DryRun
+  [switch] $DryRun,
+  # JSON array of {id, summary, note}; one "[RESULT] <id> ok|error <msg>" line per item
+  [Parameter(Mandatory=$false)] [string] $BatchFile
 )
 
 $ErrorActionPreference = 'Stop'
@@ -100,29 +102,24 @@ if ($env:NTSK_DISABLE -and ($env:NTSK_DISABLE -match '^(1|true|yes)$')) {
   exit 0
 }
 
-try {
-  $repoRoot = Get-RepoRoot
-  $inputs   = Parse-Inputs -SummaryArg $Summary -NoteArg $Note
-  $tokenObj = $null
-  try {
-    $tokenObj = Load-TodoistToken -RepoRoot $repoRoot
-  } catch {
-  throw
-  }
-
-  $payload = @{ content = $inputs.content }
-  if ($inputs.description) { $payload.description = $inputs.description }
+function Send-Task {
+  param(
+    [Parameter(Mandatory=$true)] $Inputs,
+    [Parameter(Mandatory=$true)] $TokenObj
+  )
+  $payload = @{ content = $Inputs.content }
+  if ($Inputs.description) { $payload.description = $Inputs.description }
 
   if ($DryRun -or ($env:TODOIST_DRY_RUN -as [int])) {
     Write-Info ("DRY RUN -> Would create Todoist task | content='{0}'{1} | tokenSource={2}" -f `
       $payload.content, `
       ($payload.ContainsKey('description') ? ("; description='" + $payload.description + "'") : ''), `
-      $tokenObj.source)
-    exit 0
+      $TokenObj.source)
+    return
   }
 
   # Real request
-  $headers = @{ Authorization = ("Bearer {0}" -f $tokenObj.token) }
+  $headers = @{ Authorization = ("Bearer {0}" -f $TokenObj.token) }
   $uri = 'https://api.todoist.com/rest/v2/tasks'
   $body = $payload | ConvertTo-Json -Depth 5
   $resp = Invoke-RestMethod -Method Post -Uri $uri -Headers $headers -Body $body -ContentType 'application/json'
@@ -132,6 +129,32 @@ try {
   } else {
     Write-Info ("Created Todoist task | content='{0}'" -f $payload.content)
   }
+}
+
+try {
+  $repoRoot = Get-RepoRoot
+  if (-not $BatchFile) { $inputs = Parse-Inputs -SummaryArg $Summary -NoteArg $Note }
+  $tokenObj = Load-TodoistToken -RepoRoot $repoRoot
+
+  if ($BatchFile) {
+    # One process (and one token lookup) for every queued task
+    $items = Get-Content -Raw -Encoding UTF8 -Path $BatchFile | ConvertFrom-Json
+    $failed = 0
+    foreach ($item in @($items)) {
+      try {
+        $inputs = Parse-Inputs -SummaryArg ([string]$item.summary) -NoteArg ([string]$item.note)
+        Send-Task -Inputs $inputs -TokenObj $tokenObj
+        Write-Output ("[RESULT] {0} ok" -f $item.id)
+      } catch {
+        $failed++
+        Write-Output ("[RESULT] {0} error {1}" -f $item.id, $_.Exception.Message)
+      }
+    }
+    if ($failed) { exit 1 }
+    exit 0
+  }
+
+  Send-Task -Inputs $inputs -TokenObj $tokenObj
   exit 0
 } catch {
   Write-Err $_.Exception.Message
@@ -10,5 +10,5 @@ from .cli.cli import main
 
 
 if __name__ == "__main__":  # pragma: no cover - module entry convenience
-    main()
+    raise SystemExit(main())
 
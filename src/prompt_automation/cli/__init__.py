@@ -1,20 +1,45 @@
 """CLI package providing the :class:`PromptCLI` entry point.
 
 This shim now re-exports PromptCLI from controller.py to keep file size small.
+Helpers re-exported for backwards compatibility are resolved on first access
+so ``prompt-automation --focus`` does not pay for importing them.
 """
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .controller import PromptCLI  # noqa: F401
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .dependencies import check_dependencies, dependency_status
+    from .. import updater, update
+    from ..menus import ensure_unique_ids
+
 # Backwards-compat re-exports used by tests and scripts that patch these
-# directly off the package module.
-from .dependencies import check_dependencies, dependency_status  # noqa: F401
-from .. import updater  # noqa: F401
-from .. import update as update  # noqa: F401
-from ..update import check_and_prompt as _check_and_prompt  # noqa: F401
-from ..menus import ensure_unique_ids  # noqa: F401
-
-# Back-compat aliases used in tests
-manifest_update = update  # type: ignore
+# directly off the package module: name -> (module, attribute or None).
+_LAZY = {
+    "check_dependencies": (".dependencies", "check_dependencies"),
+    "dependency_status": (".dependencies", "dependency_status"),
+    "updater": ("..updater", None),
+    "update": ("..update", None),
+    "manifest_update": ("..update", None),
+    "_check_and_prompt": ("..update", "check_and_prompt"),
+    "ensure_unique_ids": ("..menus", "ensure_unique_ids"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        target, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value: Any = importlib.import_module(target, __package__)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "PromptCLI",
@@ -4,9 +4,13 @@ from __future__ import annotations
 from . import PromptCLI
 
 
-def main(argv: list[str] | None = None) -> None:  # pragma: no cover - CLI entry
-    """Entry point for ``prompt-automation`` script."""
-    PromptCLI().main(argv)
+def main(argv: list[str] | None = None) -> int | None:  # pragma: no cover - CLI entry
+    """Entry point for ``prompt-automation`` script.
+
+    Returns the command's exit code (``None`` means success) so console
+    script shims propagate failures from subcommands such as ``render``.
+    """
+    return PromptCLI().main(argv)
 
 
 __all__ = ["main"]
@@ -5,41 +5,77 @@ Provides the PromptCLI class used by console entrypoints.
 from __future__ import annotations
 
 import argparse
+import importlib
 import json
 import logging
 import os
 import platform
+import sys
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass
 
-
-from .. import background_hotkey, logger, paste, update as manifest_update, updater
-from ..features import is_background_hotkey_enabled
-from ..menus import (
-    ensure_unique_ids,
-    list_styles,
-    list_prompts,
-    load_template,
-    PROMPTS_DIR,
-)
-from ..variables import (
-    reset_file_overrides,
-    reset_single_file_override,
-    list_file_overrides,
-    storage,
-)
-
-try:  # Optional background hotkey service
-    from ..services import global_shortcut_service  # type: ignore
-except Exception:  # pragma: no cover - service unavailable
-    global_shortcut_service = None
-
-from .dependencies import check_dependencies, dependency_status
-from .template_select import select_template_cli, pick_prompt_cli
-from .render import render_template_cli
-from ..gui.file_append import _append_to_files
-from .update import perform_update
+from .. import startup_profile
+
+
+# Everything beyond argument parsing and the singleton focus probe is resolved
+# on first use (PEP 562) so ``--focus``/``--version`` skip importing menus,
+# variables, the updaters and their third-party dependencies. Code below
+# reaches these through ``_deps`` so monkeypatched module attributes win.
+_LAZY: dict[str, tuple[str, str | None]] = {
+    "background_hotkey": ("..background_hotkey", None),
+    "logger": ("..logger", None),
+    "paste": ("..paste", None),
+    "manifest_update": ("..update", None),
+    "updater": ("..updater", None),
+    "render_stats": ("..render_stats", None),
+    "is_background_hotkey_enabled": ("..features", "is_background_hotkey_enabled"),
+    "ensure_unique_ids": ("..menus", "ensure_unique_ids"),
+    "list_styles": ("..menus", "list_styles"),
+    "list_prompts": ("..menus", "list_prompts"),
+    "load_template": ("..menus", "load_template"),
+    "PROMPTS_DIR": ("..menus", "PROMPTS_DIR"),
+    "reset_file_overrides": ("..variables", "reset_file_overrides"),
+    "reset_single_file_override": ("..variables", "reset_single_file_override"),
+    "list_file_overrides": ("..variables", "list_file_overrides"),
+    "storage": ("..variables", "storage"),
+    "global_shortcut_service": ("..services.global_shortcut_service", None),
+    "check_dependencies": (".dependencies", "check_dependencies"),
+    "dependency_status": (".dependencies", "dependency_status"),
+    "select_template_cli": (".template_select", "select_template_cli"),
+    "pick_prompt_cli": (".template_select", "pick_prompt_cli"),
+    "render_template_cli": (".render", "render_template_cli"),
+    "_append_to_files": ("..gui.file_append", "_append_to_files"),
+}
+
+_deps = sys.modules[__name__]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        target, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    try:
+        value: Any = importlib.import_module(target, __package__)
+    except Exception:
+        if name != "global_shortcut_service":
+            raise
+        value = None  # Optional background hotkey service unavailable
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def _deferred(name: str) -> staticmethod:
+    """Static method forwarding to the lazily imported helper ``name``."""
+
+    def _call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(_deps, name)(*args, **kwargs)
+
+    _call.__name__ = _call.__qualname__ = name
+    return staticmethod(_call)
 
 
 @dataclass
@@ -82,49 +118,49 @@ class PromptCLI:
                 self._log.addHandler(logging.StreamHandler())
 
     # Expose helper functions as methods for convenience
-    check_dependencies = staticmethod(check_dependencies)
-    dependency_status = staticmethod(dependency_status)
-    select_template_cli = staticmethod(select_template_cli)
-    pick_prompt_cli = staticmethod(pick_prompt_cli)
-    render_template_cli = staticmethod(render_template_cli)
-    _append_to_files = staticmethod(_append_to_files)
+    check_dependencies = _deferred("check_dependencies")
+    dependency_status = _deferred("dependency_status")
+    select_template_cli = _deferred("select_template_cli")
+    pick_prompt_cli = _deferred("pick_prompt_cli")
+    render_template_cli = _deferred("render_template_cli")
+    _append_to_files = _deferred("_append_to_files")
 
     def _maybe_register_background_hotkey(self) -> None:
         """Best-effort background hotkey registration."""
-        if not global_shortcut_service:
+        if not _deps.global_shortcut_service:
             return
         try:
-            if not storage.get_background_hotkey_enabled():
+            if not _deps.storage.get_background_hotkey_enabled():
                 return
-            if not is_background_hotkey_enabled():
+            if not _deps.is_background_hotkey_enabled():
                 try:
                     self._log.warning("background_hotkey_env_disabled")
                 except Exception:
                     pass
                 return
-            payload = storage._load_settings_payload()
+            payload = _deps.storage._load_settings_payload()
             settings = payload.get("background_hotkey") or {}
-            settings["espanso_enabled"] = storage.get_espanso_enabled()
-            background_hotkey.ensure_registered(settings, global_shortcut_service)
+            settings["espanso_enabled"] = _deps.storage.get_espanso_enabled()
+            _deps.background_hotkey.ensure_registered(settings, _deps.global_shortcut_service)
 
             def _toggle_bg_hotkey(enabled: bool) -> None:
-                if not global_shortcut_service:
+                if not _deps.global_shortcut_service:
                     return
                 try:
                     if enabled:
-                        if is_background_hotkey_enabled():
-                            payload = storage._load_settings_payload()
+                        if _deps.is_background_hotkey_enabled():
+                            payload = _deps.storage._load_settings_payload()
                             s = payload.get("background_hotkey") or {}
-                            s["espanso_enabled"] = storage.get_espanso_enabled()
-                            background_hotkey.ensure_registered(s, global_shortcut_service)
+                            s["espanso_enabled"] = _deps.storage.get_espanso_enabled()
+                            _deps.background_hotkey.ensure_registered(s, _deps.global_shortcut_service)
                         else:
                             try:
                                 self._log.warning("background_hotkey_env_disabled")
                             except Exception:
                                 pass
-                            background_hotkey.unregister(global_shortcut_service)
+                            _deps.background_hotkey.unregister(_deps.global_shortcut_service)
                     else:
-                        background_hotkey.unregister(global_shortcut_service)
+                        _deps.background_hotkey.unregister(_deps.global_shortcut_service)
                 except Exception as exc:
                     try:
                         self._log.error("background_hotkey_toggle_failed error=%s", exc)
@@ -132,49 +168,77 @@ class PromptCLI:
                         pass
 
             def _toggle_espanso(enabled: bool) -> None:
-                if not global_shortcut_service:
+                if not _deps.global_shortcut_service:
                     return
                 try:
-                    if storage.get_background_hotkey_enabled():
-                        if is_background_hotkey_enabled():
-                            payload = storage._load_settings_payload()
+                    if _deps.storage.get_background_hotkey_enabled():
+                        if _deps.is_background_hotkey_enabled():
+                            payload = _deps.storage._load_settings_payload()
                             s = payload.get("background_hotkey") or {}
                             s["espanso_enabled"] = enabled
-                            background_hotkey.ensure_registered(s, global_shortcut_service)
+                            _deps.background_hotkey.ensure_registered(s, _deps.global_shortcut_service)
                         else:
                             try:
                                 self._log.warning("background_hotkey_env_disabled")
                             except Exception:
                                 pass
-                            background_hotkey.unregister(global_shortcut_service)
+                            _deps.background_hotkey.unregister(_deps.global_shortcut_service)
                     else:
-                        background_hotkey.unregister(global_shortcut_service)
+                        _deps.background_hotkey.unregister(_deps.global_shortcut_service)
                 except Exception as exc:
                     try:
                         self._log.error("espanso_toggle_failed error=%s", exc)
                     except Exception:
                         pass
 
-            storage.add_boolean_setting_observer(
+            _deps.storage.add_boolean_setting_observer(
                 "background_hotkey_enabled", _toggle_bg_hotkey
             )
-            storage.add_boolean_setting_observer("espanso_enabled", _toggle_espanso)
+            _deps.storage.add_boolean_setting_observer("espanso_enabled", _toggle_espanso)
         except Exception as e:
             try:
                 self._log.error("background_hotkey_init_failed error=%s", e)
             except Exception:
                 pass
 
-    def main(self, argv: list[str] | None = None) -> None:
+    def _focus_running_instance(self) -> bool:
+        """Ask a running GUI instance to focus itself; ``True`` when it did."""
+        try:
+            with startup_profile.phase("singleton_probe"):
+                from ..gui.single_window import singleton as _sw_singleton
+
+                self._log.debug("hotkey_handler_invoked action=focus_app_attempt")
+                focused = _sw_singleton.connect_and_focus_if_running()
+        except Exception:
+            return False
+        if not focused:
+            return False
+        try:
+            self._log.debug("hotkey_handler_invoked action=focus_app")
+        except Exception:
+            pass
+        return True
+
+    def main(self, argv: list[str] | None = None) -> int | None:
         """Program entry point."""
+        startup_profile.reset()
+        try:
+            return self._main(argv)
+        finally:
+            # No-op unless profiling is enabled or when already emitted at
+            # first paint / first prompt.
+            startup_profile.emit()
+
+    def _main(self, argv: list[str] | None) -> int | None:
         # Load environment from config file if it exists
-        config_dir = Path.home() / ".prompt-automation"
-        env_file = config_dir / "environment"
-        if env_file.exists():
-            for line in env_file.read_text().splitlines():
-                if "=" in line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+        with startup_profile.phase("env_file"):
+            config_dir = Path.home() / ".prompt-automation"
+            env_file = config_dir / "environment"
+            if env_file.exists():
+                for line in env_file.read_text().splitlines():
+                    if "=" in line and not line.startswith("#"):
+                        key, value = line.split("=", 1)
+                        os.environ.setdefault(key.strip(), value.strip())
 
         parser = argparse.ArgumentParser(prog="prompt-automation")
         parser.add_argument(
@@ -229,6 +293,11 @@ class PromptCLI:
         parser.add_argument(
             "--focus", action="store_true", help="Focus existing GUI instance if running (no new window)"
         )
+        parser.add_argument(
+            "--show",
+            metavar="TEMPLATE",
+            help="Open TEMPLATE (id or path) in the GUI, reusing a running instance when present",
+        )
         parser.add_argument(
             "--update", "-u", action="store_true", help="Check for and apply updates"
         )
@@ -333,6 +402,22 @@ class PromptCLI:
             action="store_true",
             help="Persist the provided --hierarchy value to settings.json",
         )
+        parser.add_argument(
+            "--profile-startup",
+            action="store_true",
+            help=(
+                "Print per-phase startup timings as JSON to stderr "
+                f"(set {startup_profile.ENV_VAR}=FILE to append them to FILE instead)"
+            ),
+        )
+        parser.add_argument(
+            "--render-stats",
+            action="store_true",
+            help=(
+                "Print per-stage render timings, sizes and cache hits as JSON to stderr "
+                "(set PROMPT_AUTOMATION_RENDER_STATS=FILE to append them to FILE instead)"
+            ),
+        )
         parser.add_argument(
             "--show-reminders",
             action="store_true",
@@ -374,18 +459,65 @@ class PromptCLI:
             action="store_true",
             help="Prompt before removing orphan executables",
         )
+        render = sub.add_parser(
+            "render",
+            help="Render templates headlessly from supplied values",
+            description=(
+                "Render templates without interactive collection. Requests are "
+                'JSON lines: {"template": <id|path>, "values": {...}, "id": <any>}.'
+            ),
+        )
+        render.add_argument(
+            "--serve", action="store_true", help="Answer JSON-lines requests on stdin/stdout"
+        )
+        render.add_argument(
+            "--socket", metavar="PATH", help="Serve render requests on a UNIX socket at PATH"
+        )
+        render.add_argument(
+            "--batch",
+            metavar="FILE",
+            help="Render every request in a JSON-lines FILE ('-' for stdin) and stream results in input order",
+        )
+        render.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes for --batch (default: CPU count; 1 renders in-process)",
+        )
+        render.add_argument(
+            "--output", metavar="FILE", help="Write --batch results to FILE instead of stdout"
+        )
         args = parser.parse_args(argv)
+        if args.profile_startup and not os.environ.get(startup_profile.ENV_VAR):
+            os.environ[startup_profile.ENV_VAR] = "1"
+        if args.render_stats and not os.environ.get(_deps.render_stats.ENV_VAR):
+            os.environ[_deps.render_stats.ENV_VAR] = "1"
         # Register background hotkey if configured
         self._maybe_register_background_hotkey()
 
         if args.enable_background_hotkey:
-            storage.set_background_hotkey_enabled(True)
+            _deps.storage.set_background_hotkey_enabled(True)
         if args.disable_background_hotkey:
-            storage.set_background_hotkey_enabled(False)
+            _deps.storage.set_background_hotkey_enabled(False)
         if args.enable_espanso:
-            storage.set_espanso_enabled(True)
+            _deps.storage.set_espanso_enabled(True)
         if args.disable_espanso:
-            storage.set_espanso_enabled(False)
+            _deps.storage.set_espanso_enabled(False)
+
+        # Observability: log the incoming event and intended mode
+        try:
+            self._log.debug(
+                "hotkey_event_received source=CLI focus=%s gui=%s terminal=%s",
+                bool(args.focus), bool(args.gui), bool(args.terminal),
+            )
+        except Exception:
+            pass
+
+        # Hotkey fast path: an explicit ``--focus`` only needs the singleton
+        # probe, so try it before template scans and dependency checks.
+        focus_probed = bool(args.focus and args.command is None and not (args.terminal or args.show))
+        if focus_probed and self._focus_running_instance():
+            return
 
         if args.command == "uninstall":
             if os.environ.get("UNINSTALL_FEATURE_FLAG", "1") == "0":
@@ -423,6 +555,11 @@ class PromptCLI:
             os.environ["PROMPT_AUTOMATION_PROMPTS"] = str(path)
             self._log.info("using custom prompt directory %s", path)
 
+        if args.command == "render":
+            from .render_cmds import run_render
+
+            return run_render(args)
+
         if args.assign_hotkey:
             from .. import hotkeys
 
@@ -440,6 +577,11 @@ class PromptCLI:
             return
 
         if args.update:
+            from .update import perform_update
+
+            # Importing the ``cli.update`` submodule rebinds the package
+            # attribute; keep the historical ``cli.update`` manifest alias.
+            setattr(sys.modules[__package__], "update", _deps.manifest_update)
             perform_update(args)
             return
 
@@ -474,9 +616,11 @@ class PromptCLI:
 
         try:
             # Use importlib to load package module for stable patching/import behavior
-            import importlib
             _cli_pkg = importlib.import_module('prompt_automation.cli')
-            _cli_pkg.ensure_unique_ids(PROMPTS_DIR)
+            with startup_profile.phase("config_discovery"):
+                prompts_dir = _deps.PROMPTS_DIR
+            with startup_profile.phase("ensure_unique_ids"):
+                _cli_pkg.ensure_unique_ids(prompts_dir)
         except ValueError as e:
             print(f"[prompt-automation] {e}")
             return
@@ -534,8 +678,8 @@ class PromptCLI:
                 _print(tree)
             else:
                 pat = args.filter.lower() if args.filter else None
-                for style in list_styles():
-                    items = [p for p in list_prompts(style) if not pat or pat in p.name.lower()]
+                for style in _deps.list_styles():
+                    items = [p for p in _deps.list_prompts(style) if not pat or pat in p.name.lower()]
                     if not items:
                         continue
                     print(style)
@@ -548,50 +692,49 @@ class PromptCLI:
                 "Troubleshooting tips:\n- Ensure dependencies are installed.\n- Logs stored at",
                 self.log_dir,
                 "\n- Usage DB:",
-                logger.DB_PATH,
+                _deps.logger.DB_PATH,
             )
             return
 
         gui_mode = not args.terminal and (
-            args.gui or os.environ.get("PROMPT_AUTOMATION_GUI") != "0" or args.focus
+            args.gui or os.environ.get("PROMPT_AUTOMATION_GUI") != "0" or args.focus or args.show
         )
 
-        # Observability: log the incoming event and intended mode
-        try:
-            self._log.debug(
-                "hotkey_event_received source=CLI focus=%s gui=%s terminal=%s",
-                bool(args.focus), bool(args.gui), bool(args.terminal),
-            )
-        except Exception:
-            pass
-
         self._log.info("running on %s", platform.platform())
 
         # Fast path: try to focus existing GUI instance before any dependency checks
         if gui_mode:
             try:
                 from ..gui.single_window import singleton as _sw_singleton
-                self._log.debug("hotkey_handler_invoked action=focus_app_attempt")
-                if _sw_singleton.connect_and_focus_if_running():
-                    try:
-                        self._log.debug("hotkey_handler_invoked action=focus_app")
-                    except Exception:
-                        pass
-                    return
+                if args.show:
+                    with startup_profile.phase("singleton_probe"):
+                        reply = _sw_singleton.send_command("SHOW", template=args.show)
+                    if reply is not None:
+                        if not reply.get("ok"):
+                            print(f"[prompt-automation] {reply.get('error')}")
+                        return
+                    # No instance yet: the new window opens the template itself.
+                    os.environ["PROMPT_AUTOMATION_SHOW_TEMPLATE"] = str(args.show)
             except Exception:
                 pass
+            if not (args.show or focus_probed) and self._focus_running_instance():
+                return
 
-        import importlib
         _cli_pkg = importlib.import_module('prompt_automation.cli')
-        if not _cli_pkg.check_dependencies(require_fzf=not gui_mode):
+        with startup_profile.phase("check_dependencies"):
+            deps_ok = _cli_pkg.check_dependencies(require_fzf=not gui_mode)
+        if not deps_ok:
             return
         from ..dev import is_dev_mode
-        if not is_dev_mode():
-            try:  # never block startup
-                updater.check_for_update()
-            except Exception:
-                pass
-            manifest_update.check_and_prompt()
+        # The GUI runs update checks on a worker after its first frame is
+        # painted; only terminal mode checks (and may prompt) up front.
+        if not gui_mode and not is_dev_mode():
+            with startup_profile.phase("update_checks"):
+                try:  # never block startup
+                    _deps.updater.check_for_update()
+                except Exception:
+                    pass
+                _deps.manifest_update.check_and_prompt()
         # Theme resolution: allow CLI override and optional persistence
         try:
             if args.theme:
@@ -628,7 +771,8 @@ class PromptCLI:
         except Exception:
             pass
 
-        tmpl: dict[str, Any] | None = select_template_cli()
+        startup_profile.emit()
+        tmpl: dict[str, Any] | None = _deps.select_template_cli()
         if not tmpl:
             return
 
@@ -656,7 +800,7 @@ class PromptCLI:
                 print(f"[prompt-automation] Failed to print reminders: {e}")
                 return
 
-        res = render_template_cli(tmpl)
+        res = _deps.render_template_cli(tmpl)
         if res:
             text, var_map = res
             print("\n" + "=" * 60)
@@ -680,14 +824,16 @@ class PromptCLI:
                 pass
 
             if input("\nProceed with clipboard copy? [Y/n]: ").lower() not in {"n", "no"}:
-                paste.copy_to_clipboard(text)
+                _deps.paste.copy_to_clipboard(text)
                 print(
                     "\n[prompt-automation] Text copied to clipboard. Press Ctrl+V to paste where needed."
                 )
-                _append_to_files(var_map, text)
-                logger.log_usage(tmpl, len(text))
+                _deps._append_to_files(var_map, text)
+                _deps.logger.log_usage(tmpl, len(text))
 
                 # Optional Todoist post-action (non-blocking). Uses same omission rules as GUI.
+                # Sent inline rather than queued: the CLI exits right away, before the
+                # queue worker could deliver, and a failure is reported here directly.
                 try:
                     from ..services.todoist_action import build_summary_and_note, send_to_todoist
                     summary, note = build_summary_and_note(
@@ -1,19 +1,36 @@
-"""Dependency checking helpers for the CLI."""
+"""Dependency checking helpers for the CLI.
+
+Successful :func:`check_dependencies` results are cached in
+``HOME_DIR/dependency-cache.json`` keyed on ``PATH``, the interpreter and the
+OS build, so normal launches skip importing tkinter/pyperclip and (under WSL)
+spawning ``powershell.exe``. Failures are never cached: a failing probe runs
+again on the next launch, as does one that passed with a WSL interop warning.
+``PROMPT_AUTOMATION_DEPENDENCY_CACHE_TTL`` sets the cache lifetime in seconds
+(default one week; ``0`` disables the cache).
+"""
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import platform
 import shutil
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
+from ..config import HOME_DIR
 from ..utils import safe_run
 
 
 _log = logging.getLogger("prompt_automation.cli.dependencies")
 
+_CACHE_FILE = HOME_DIR / "dependency-cache.json"
+_CACHE_TTL_ENV = "PROMPT_AUTOMATION_DEPENDENCY_CACHE_TTL"
+_DEFAULT_CACHE_TTL = 7 * 24 * 3600
+
 
 def _is_wsl() -> bool:
     if os.environ.get("WSL_DISTRO_NAME"):
@@ -36,10 +53,84 @@ def _run_cmd(cmd: list[str]) -> bool:
         return False
 
 
+def _cache_ttl() -> float:
+    try:
+        return float(os.environ.get(_CACHE_TTL_ENV, _DEFAULT_CACHE_TTL))
+    except ValueError:
+        return float(_DEFAULT_CACHE_TTL)
+
+
+def _os_build() -> str:
+    """Cheap OS build fingerprint (``platform.version`` may spawn ``ver``)."""
+    if hasattr(os, "uname"):
+        u = os.uname()
+        return f"{u.sysname} {u.release} {u.version} {u.machine}"
+    try:
+        w = sys.getwindowsversion()  # type: ignore[attr-defined]
+        return f"Windows {w.major}.{w.minor}.{w.build}"
+    except Exception:
+        return sys.platform
+
+
+def _cache_key(require_fzf: bool) -> str:
+    parts = {
+        "path": os.environ.get("PATH", ""),
+        "python": sys.executable,
+        "version": sys.version,
+        "os": _os_build(),
+        "require_fzf": require_fzf,
+        "gui": os.environ.get("PROMPT_AUTOMATION_GUI") != "0",
+        "wsl": bool(os.environ.get("WSL_DISTRO_NAME")),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _load_cache() -> dict[str, float]:
+    try:
+        data = json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
+        entries = data.get("ok") if isinstance(data, dict) else None
+        return {k: float(v) for k, v in entries.items()} if isinstance(entries, dict) else {}
+    except Exception:
+        return {}
+
+
+def _store_cache(key: str, ttl: float) -> None:
+    now = time.time()
+    entries = {k: v for k, v in _load_cache().items() if now - v < ttl}
+    entries[key] = now
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"ok": entries}, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(_CACHE_FILE)
+    except Exception as e:  # pragma: no cover - read-only home etc.
+        _log.debug("dependency cache write failed: %s", e)
+
+
 def check_dependencies(require_fzf: bool = True) -> bool:
-    """Verify required dependencies; attempt install if possible."""
+    """Verify required dependencies; attempt install if possible.
+
+    A previous successful probe for the same environment within the cache
+    TTL short-circuits to ``True``.
+    """
+    ttl = _cache_ttl()
+    key = _cache_key(require_fzf) if ttl > 0 else ""
+    if key:
+        checked_at = _load_cache().get(key)
+        if checked_at is not None and 0 <= time.time() - checked_at < ttl:
+            _log.debug("dependency probe cache hit")
+            return True
+    ok, cacheable = _probe_dependencies(require_fzf)
+    if ok and cacheable and key:
+        _store_cache(key, ttl)
+    return ok
+
+
+def _probe_dependencies(require_fzf: bool) -> tuple[bool, bool]:
+    """Return ``(ok, cacheable)``; degraded WSL interop is not cacheable."""
     os_name = platform.system()
     missing: list[str] = []
+    cacheable = True
 
     if require_fzf and not _check_cmd("fzf"):
         missing.append("fzf")
@@ -70,8 +161,10 @@ def check_dependencies(require_fzf: bool = True) -> bool:
     if _is_wsl():
         if not _check_cmd("clip.exe"):
             _log.warning("WSL clipboard integration missing (clip.exe not found)")
+            cacheable = False
         if not _run_cmd(["powershell.exe", "-Command", ""]):
             _log.warning("WSL unable to run Windows executables")
+            cacheable = False
 
     if missing:
         msg = "Missing dependencies: " + ", ".join(missing)
@@ -90,9 +183,9 @@ def check_dependencies(require_fzf: bool = True) -> bool:
                 if dep != "tkinter":
                     _run_cmd(["brew", "install", dep])
         print("[prompt-automation] Re-run after installing missing dependencies.")
-        return False
+        return False, False
 
-    return True
+    return True, cacheable
 
 
 def dependency_status(gui_mode: bool) -> dict[str, dict[str, str]]:
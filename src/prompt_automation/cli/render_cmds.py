@@ -0,0 +1,64 @@
+"""Headless render commands (``prompt-automation render ...``)."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+
+def run_render(args) -> int:
+    """Dispatch the ``render`` subcommand; returns a process exit code."""
+    from ..services.render_service import RenderService, serve_stdio, serve_unix
+
+    if getattr(args, "batch", None):
+        return _run_batch(args)
+    service = RenderService()
+    if args.socket:
+        try:
+            serve_unix(args.socket, service)
+        except KeyboardInterrupt:
+            pass
+        except (OSError, RuntimeError) as e:
+            print(f"[prompt-automation] render server failed: {e}", file=sys.stderr)
+            return 1
+        return 0
+    if args.serve:
+        try:
+            serve_stdio(service)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    print("[prompt-automation] render: choose --batch FILE, --serve or --socket PATH", file=sys.stderr)
+    return 1
+
+
+def _run_batch(args) -> int:
+    from ..services.batch_render import run_batch
+
+    try:
+        src = sys.stdin.buffer if args.batch == "-" else open(Path(args.batch).expanduser(), "rb")
+    except OSError as e:
+        print(f"[prompt-automation] cannot read batch file: {e}", file=sys.stderr)
+        return 1
+    try:
+        out = open(Path(args.output).expanduser(), "wb") if args.output else sys.stdout.buffer
+    except OSError as e:
+        print(f"[prompt-automation] cannot write output file: {e}", file=sys.stderr)
+        if src is not sys.stdin.buffer:
+            src.close()
+        return 1
+    try:
+        total, failed = run_batch(src, out, workers=args.workers)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if out is not sys.stdout.buffer:
+            out.close()
+    if failed:
+        print(f"[prompt-automation] {failed} of {total} render request(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+__all__ = ["run_render"]
@@ -6,6 +6,8 @@ Currently supports:
   - hierarchical_templates: enable hierarchical template browsing in UI/CLI.
   - reminders: enable read-only reminders parsing and rendering.
   - background_hotkey: enable background hotkey integration.
+  - context_recent_blocks / append_file_max_mb: context-file tail loading and
+    append-file rotation (numeric settings).
 
 Resolution order for hierarchical_templates (mimics theme behavior):
   1. Environment variable PROMPT_AUTOMATION_HIERARCHICAL_TEMPLATES
@@ -211,3 +213,54 @@ def is_placeholder_fastpath_enabled() -> bool:
 
 
 __all__.append("is_placeholder_fastpath_enabled")
+
+
+def _int_setting(env_name: str, key: str, default: int) -> int:
+    """Non-negative integer from env ``env_name``, then settings ``key``."""
+    raw: Any = os.environ.get(env_name)
+    if raw is None:
+        try:
+            settings = PROMPTS_DIR / "Settings" / "settings.json"
+            if settings.exists():
+                raw = json.loads(settings.read_text()).get(key)
+        except Exception:
+            raw = None
+    try:
+        value = int(float(raw)) if raw is not None and not isinstance(raw, bool) else default
+    except (TypeError, ValueError):
+        value = default
+    return max(0, value)
+
+
+def get_context_recent_blocks() -> int:
+    """How many ``--- timestamp ---`` entries of a context file to inject.
+
+    Env ``PROMPT_AUTOMATION_CONTEXT_RECENT_BLOCKS`` or settings key
+    ``context_recent_blocks``; ``0`` (default) injects the whole file. A
+    ``recent_blocks`` value on the template's ``context`` placeholder wins.
+    """
+    return _int_setting("PROMPT_AUTOMATION_CONTEXT_RECENT_BLOCKS", "context_recent_blocks", 0)
+
+
+def get_append_rotation() -> tuple[int, int]:
+    """``(max_bytes, backups)`` for append-file rotation; ``max_bytes`` 0 = off.
+
+    Env ``PROMPT_AUTOMATION_APPEND_MAX_MB`` / settings ``append_file_max_mb``
+    (default 0, no rotation) and ``PROMPT_AUTOMATION_APPEND_BACKUPS`` /
+    ``append_file_backups`` (default 3).
+    """
+    raw = os.environ.get("PROMPT_AUTOMATION_APPEND_MAX_MB")
+    mb: float = 0.0
+    try:
+        if raw is None:
+            settings = PROMPTS_DIR / "Settings" / "settings.json"
+            if settings.exists():
+                raw = json.loads(settings.read_text()).get("append_file_max_mb")
+        mb = float(raw) if raw is not None and not isinstance(raw, bool) else 0.0
+    except Exception:
+        mb = 0.0
+    backups = _int_setting("PROMPT_AUTOMATION_APPEND_BACKUPS", "append_file_backups", 3)
+    return max(0, int(mb * 1024 * 1024)), backups
+
+
+__all__ += ["get_context_recent_blocks", "get_append_rotation"]
@@ -0,0 +1,420 @@
+"""Reading reference files for the render pipeline and the GUI viewers.
+
+:func:`read_file_safe` decodes a file best-effort and keeps the result in a
+bounded LRU content cache, revalidated with ``stat`` on every call, so the
+pipeline and the viewers share one decode per file version. The codec is
+picked from a BOM or the NUL-byte layout of the first few KB
+(:func:`_sniff_encoding`). :func:`read_file_window` reads only the head
+and/or tail of a file that a size-bounded placeholder needs.
+"""
+from __future__ import annotations
+
+import codecs
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List
+
+from . import render_stats, wsl_paths
+from .errorlog import get_logger
+
+_log = get_logger(__name__)
+
+FILE_CACHE_ENV = "PROMPT_AUTOMATION_FILE_CACHE_MB"
+_FILE_CACHE_DEFAULT_MB = 64
+# Files modified this recently are read but not cached: filesystem mtimes can
+# be coarse enough that a quick same-size rewrite keeps the same signature.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class _ContentCache:
+    """LRU of decoded file contents bounded by total on-disk bytes.
+
+    Entries are keyed by absolute path and validated against
+    ``(st_mtime_ns, st_size, st_ino)`` on every lookup, so edited files are
+    re-read transparently.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple[tuple[int, int, int], int, str]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, sig: tuple[int, int, int]) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == sig:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: str, sig: tuple[int, int, int], size: int, text: str) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (sig, size, text)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key: str) -> None:
+        _sig, size, _text = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def _file_cache_budget() -> int:
+    try:
+        mb = float(os.environ.get(FILE_CACHE_ENV, _FILE_CACHE_DEFAULT_MB))
+    except ValueError:
+        mb = _FILE_CACHE_DEFAULT_MB
+    return max(0, int(mb * 1024 * 1024))
+
+
+_CONTENT_CACHE = _ContentCache(_file_cache_budget())
+
+
+def file_cache_stats() -> Dict[str, int]:
+    """Hit/miss/eviction counters and current size of the content cache."""
+    return _CONTENT_CACHE.stats()
+
+
+def clear_file_cache() -> None:
+    _CONTENT_CACHE.clear()
+
+
+def read_file_safe(path: str) -> str:
+    """Return file contents (best‑effort) or empty string.
+
+    Decoded contents are cached (LRU, ``PROMPT_AUTOMATION_FILE_CACHE_MB``
+    budget, default 64; ``0`` disables) and revalidated with ``stat`` on each
+    call, so the pipeline and GUI viewers share one decode per file version.
+    Under WSL, Windows paths are translated and ``/mnt/<drive>`` files are
+    read from :mod:`wsl_paths` local snapshots; the signature check always
+    uses a fresh ``stat``.
+
+    Why rewrite? Previously we relied on ``Path.read_text()`` raising to
+    try alternative encodings; on Windows a UTF‑8 file with emoji could be
+    decoded as cp1252 *without error*, producing mojibake like ``ðŸ‘—``.
+    We now always read bytes first, pick the codec from the first few KB
+    (:func:`_sniff_encoding`) and decode the full buffer once:
+
+      1. BOM → utf-8-sig / utf-16 (BOM stripped)
+      2. NUL-byte pattern → utf-16-le / utf-16-be (BOM-less exports)
+      3. otherwise utf-8 (most common; UTF‑8 wins whenever valid)
+      4. cp1252 (legacy Windows fallback), then utf-16 as a last resort
+
+    If all fail we log and return an empty string.
+    """
+    p = Path(wsl_paths.to_local_path(str(path))).expanduser()
+    try:
+        st = wsl_paths.stat(p, fresh=True)
+    except (OSError, ValueError):
+        return ""
+    cacheable = _CONTENT_CACHE.max_bytes > 0 and time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS
+    if not cacheable:
+        return _read_file_uncached(p, path) or ""
+    key = os.path.abspath(p)
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    text = _CONTENT_CACHE.get(key, sig)
+    if text is not None:
+        render_stats.cache_hit()
+        return text
+    render_stats.cache_miss()
+    snap = wsl_paths.local_snapshot(p, st) if p.suffix.lower() != ".docx" else None
+    text = _read_file_uncached(snap or p, path)
+    if text is None:
+        return ""
+    _CONTENT_CACHE.put(key, sig, st.st_size, text)
+    return text
+
+
+_SNIFF_BYTES = 4096
+_BOMS = (
+    (b"\xef\xbb\xbf", "utf-8-sig"),
+    (b"\xff\xfe", "utf-16"),
+    (b"\xfe\xff", "utf-16"),
+)
+
+
+def _sniff_encoding(data: bytes) -> str | None:
+    """Guess the codec from a BOM or the NUL layout of the first few KB.
+
+    Returns ``None`` when nothing points away from the utf-8 → cp1252 chain.
+    BOM-less UTF-16 text puts a NUL in every other byte for ASCII characters;
+    at least a third of the sampled code units must follow that pattern (and
+    the opposite byte lane must stay NUL-free) to avoid misreading binary.
+    """
+    for bom, enc in _BOMS:
+        if data.startswith(bom):
+            return enc
+    head = data[:_SNIFF_BYTES]
+    units = len(head) // 2
+    if units < 2 or head.count(0) == 0:
+        return None
+    even_nuls = head[0 : units * 2 : 2].count(0)
+    odd_nuls = head[1 : units * 2 : 2].count(0)
+    if odd_nuls * 3 >= units and even_nuls * 10 < odd_nuls:
+        return "utf-16-le"
+    if even_nuls * 3 >= units and odd_nuls * 10 < even_nuls:
+        return "utf-16-be"
+    return None
+
+
+def _read_file_uncached(p: Path, path: str) -> str | None:
+    """Decode ``p``; ``None`` when it cannot be read (never cached)."""
+    try:
+        if p.suffix.lower() == ".docx":  # optional dependency branch
+            try:
+                import docx  # type: ignore
+                return "\n".join(par.text for par in docx.Document(p).paragraphs)
+            except Exception as e:  # pragma: no cover - optional dependency
+                _log.error("cannot read Word file %s: %s", path, e)
+                return None
+        data = p.read_bytes()
+        sniffed = _sniff_encoding(data)
+        for enc in (sniffed, "utf-8", "cp1252", "utf-16"):
+            if enc is None:
+                continue
+            try:
+                return data.decode(enc)
+            except UnicodeDecodeError:
+                continue
+        _log.error("cannot decode file %s with fallback set", path)
+        return None
+    except Exception as e:
+        _log.error("cannot read file %s: %s", path, e)
+        return None
+
+
+_NEWLINES = {"utf-16-le": b"\n\x00", "utf-16-be": b"\x00\n"}
+
+
+def _file_codec(head: bytes) -> tuple[str | None, int]:
+    """Concrete codec and BOM length for decoding slices of a file."""
+    enc = _sniff_encoding(head)
+    if enc == "utf-8-sig":
+        return "utf-8", 3
+    if enc == "utf-16":
+        return ("utf-16-le" if head.startswith(b"\xff\xfe") else "utf-16-be"), 2
+    return enc, 0
+
+
+def _decode_fragment(data: bytes, encoding: str | None, *, cut_start: bool, cut_end: bool) -> str:
+    """Decode a slice that may begin or end in the middle of a character."""
+    if encoding in _NEWLINES:
+        return codecs.getincrementaldecoder(encoding)("replace").decode(data, final=not cut_end)
+    for enc in ([encoding] if encoding else ["utf-8", "cp1252"]):
+        chunk = data
+        if enc == "utf-8" and cut_start:
+            skip = 0
+            while skip < min(3, len(chunk)) and 0x80 <= chunk[skip] <= 0xBF:
+                skip += 1
+            chunk = chunk[skip:]
+        try:
+            return codecs.getincrementaldecoder(enc)().decode(chunk, final=not cut_end)
+        except UnicodeDecodeError:
+            continue
+    return data.decode("cp1252", errors="replace")
+
+
+
+FILE_WINDOWS = ("head", "tail", "both")
+_STREAM_BLOCK = 64 * 1024
+
+
+def _read_head(fh: Any, start: int, end: int, nbytes: int | None, nlines: int | None, newline: bytes, unit: int) -> bytes:
+    fh.seek(start)
+    limit = end - start if nbytes is None else min(nbytes, end - start)
+    limit -= limit % unit
+    if nlines is None:
+        return fh.read(limit)
+    buf = bytearray()
+    while len(buf) < limit:
+        chunk = fh.read(min(_STREAM_BLOCK, limit - len(buf)))
+        if not chunk:
+            break
+        buf += chunk
+        if buf.count(newline) >= nlines:
+            break
+    return bytes(buf)
+
+
+def _read_tail(fh: Any, start: int, end: int, nbytes: int | None, nlines: int | None, newline: bytes, unit: int) -> tuple[int, bytes]:
+    limit = end - start if nbytes is None else min(nbytes, end - start)
+    limit -= limit % unit
+    if nlines is None:
+        fh.seek(end - limit)
+        return end - limit, fh.read(limit)
+    pos = end
+    chunks: List[bytes] = []
+    newlines = 0
+    while end - pos < limit:
+        step = min(_STREAM_BLOCK, limit - (end - pos))
+        pos -= step
+        fh.seek(pos)
+        chunk = fh.read(step)
+        chunks.insert(0, chunk)
+        newlines += chunk.count(newline)
+        if newlines > nlines:
+            break
+    return pos, b"".join(chunks)
+
+
+def _cut(text: str, side: str, lines: int | None, chars: int | None) -> tuple[str, bool]:
+    cut = False
+    if lines is not None:
+        parts = text.splitlines(keepends=True)
+        if len(parts) > lines:
+            parts = parts[:lines] if side == "head" else parts[len(parts) - lines:]
+            text = "".join(parts)
+            cut = True
+    if chars is not None and len(text) > chars:
+        text = text[:chars] if side == "head" else text[len(text) - chars:]
+        cut = True
+    return text, cut
+
+
+def _join_marker(before: str, marker: str, after: str) -> str:
+    if before and not before.endswith("\n"):
+        before += "\n"
+    if after:
+        marker += "\n"
+    return before + marker + after
+
+
+def _human_size(size: int) -> str:
+    for unit in ("bytes", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size} {unit}" if unit == "bytes" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"  # pragma: no cover - loop always returns
+
+
+def read_file_window(
+    path: str,
+    *,
+    max_bytes: int | None = None,
+    max_lines: int | None = None,
+    max_chars: int | None = None,
+    window: str = "head",
+    marker: str | None = None,
+) -> str:
+    """Return at most the ``window`` slice of ``path`` within the given limits.
+
+    ``window`` is ``head`` (start of the file), ``tail`` (end) or ``both``
+    (limits split between start and end). Only the bytes needed for the
+    limits are read and decoded. Files that already fit go through
+    :func:`read_file_safe`, and its cache. When content is dropped a visible
+    marker line is inserted where the gap is (``marker`` overrides its text).
+    Without limits this is :func:`read_file_safe`.
+    """
+    if not (max_bytes or max_lines or max_chars):
+        return read_file_safe(path)
+    if window not in FILE_WINDOWS:
+        window = "head"
+    p = Path(wsl_paths.to_local_path(str(path))).expanduser()
+    try:
+        size = wsl_paths.stat(p, fresh=True).st_size
+    except (OSError, ValueError):
+        return ""
+    docx = p.suffix.lower() == ".docx"
+    if docx and max_bytes:  # not streamable; treat the byte limit as characters
+        max_chars = min(max_chars or max_bytes, max_bytes)
+    budgets = [b for b in (max_bytes, max_chars * 4 if max_chars else None) if b]
+    budget = min(budgets) if budgets else None
+    half = window == "both"
+    head_lines = -(-max_lines // 2) if half and max_lines else max_lines
+    tail_lines = max_lines // 2 if half and max_lines else max_lines
+    head_chars = -(-max_chars // 2) if half and max_chars else max_chars
+    tail_chars = max_chars // 2 if half and max_chars else max_chars
+    if docx or (budget is not None and size <= budget and not max_lines):
+        head = tail = read_file_safe(path)
+        partial = False
+    else:
+        try:
+            with p.open("rb") as fh:
+                enc, bom = _file_codec(fh.read(_SNIFF_BYTES))
+                unit = 2 if enc in _NEWLINES else 1
+                newline = _NEWLINES.get(enc or "", b"\n")
+                side_budget = (budget // 2 if half else budget) if budget else None
+                head_bytes = tail_bytes = b""
+                head_end = tail_start = bom
+                if window in ("head", "both"):
+                    head_bytes = _read_head(fh, bom, size, side_budget, head_lines, newline, unit)
+                    head_end = bom + len(head_bytes)
+                if window in ("tail", "both"):
+                    tail_start, tail_bytes = _read_tail(fh, bom, size, side_budget, tail_lines, newline, unit)
+                if half and head_end >= tail_start:
+                    fh.seek(bom)
+                    head_bytes, head_end, tail_bytes, tail_start = fh.read(), size, b"", size
+        except Exception as e:
+            _log.error("cannot read file %s: %s", path, e)
+            return ""
+        partial = (head_end - bom) + (size - tail_start if window != "head" else 0) < size - bom
+        head = _decode_fragment(head_bytes, enc, cut_start=False, cut_end=head_end < size)
+        tail = _decode_fragment(tail_bytes, enc, cut_start=tail_start > bom, cut_end=False)
+        if not tail_bytes:
+            tail = head
+        if window == "tail" and not head_bytes:
+            head = tail
+    if not partial and not _cut(head, "head", max_lines, max_chars)[1]:
+        return head  # the whole file was read and fits
+    head_text = _cut(head, "head", head_lines, head_chars)[0]
+    tail_text = _cut(tail, "tail", tail_lines, tail_chars)[0]
+    if marker is None:
+        shown = ", ".join(
+            part
+            for part in (
+                f"{max_lines} lines" if max_lines else "",
+                f"{max_chars} characters" if max_chars else "",
+                _human_size(max_bytes) if max_bytes else "",
+            )
+            if part
+        )
+        where = {"head": "first", "tail": "last", "both": "first and last"}[window]
+        marker = f"[... truncated {p.name} ({_human_size(size)}): showing the {where} {shown} ...]"
+    if window == "head":
+        return _join_marker(head_text, marker, "")
+    if window == "tail":
+        return _join_marker("", marker, tail_text)
+    return _join_marker(head_text, marker, tail_text)
+
+
+__all__ = [
+    "FILE_CACHE_ENV",
+    "FILE_WINDOWS",
+    "read_file_safe",
+    "read_file_window",
+    "file_cache_stats",
+    "clear_file_cache",
+]
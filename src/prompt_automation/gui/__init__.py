@@ -8,11 +8,31 @@ The project previously had an empty top-level module ``gui.py`` which
 shadowed this package, causing ``AttributeError: module 'prompt_automation.gui' has no attribute 'run'``.
 That file has been removed; ``run`` is now exposed here to keep the CLI
 call ``from .. import gui; gui.run()`` working.
+
+Exports resolve lazily so light submodules (e.g. ``single_window.singleton``
+used by the CLI focus fast path) import without pulling in the Tk workflow.
 """
 from __future__ import annotations
 
-from .controller import PromptGUI  # noqa: F401
-from .gui import run  # re-export wrapper function
-from . import constants
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from . import constants
+    from .controller import PromptGUI
+    from .gui import run
+
+_LAZY = {"PromptGUI": ".controller", "run": ".gui"}
 
 __all__ = ["PromptGUI", "run", "constants"]
+
+
+def __getattr__(name: str):
+    if name == "constants":
+        return importlib.import_module(".constants", __package__)
+    target = _LAZY.get(name)
+    if target is None:
+        raise AttributeError(name)
+    value = getattr(importlib.import_module(target, __package__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,178 @@
+"""Viewport-driven markdown highlighting for read-only ``tk.Text`` viewers.
+
+Tagging a whole file up front walks every line and converts regex offsets
+into ``"1.0+Nc"`` indices that Tk resolves from the start of the buffer,
+which is quadratic on large files. :class:`MarkdownHighlighter` instead tags
+only the visible lines plus a margin, ``chunk_lines`` lines per
+``after_idle`` callback, and picks up newly exposed lines whenever Tk
+reports a view change through ``yscrollcommand``. Fenced code blocks are
+located with a single pass over the lines so any line can be classified
+without scanning from the top.
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import Any, List, Optional, Tuple
+
+RE_BOLD = re.compile(r"\*\*(.+?)\*\*")
+RE_INLINE_CODE = re.compile(r"`([^`]+?)`")
+
+CHUNK_LINES = 200
+MARGIN_LINES = 100
+
+
+def line_tags(line: str, in_code: bool = False) -> List[Tuple[str, int, int]]:
+    """Return ``(tag, start_col, end_col)`` spans for one line of markdown.
+
+    ``end_col`` of ``-1`` means "to the end of the line".
+    """
+    if in_code or line.strip().startswith("```"):
+        return [("codeblock", 0, -1)]
+    spans: List[Tuple[str, int, int]] = []
+    if line.startswith("### "):
+        spans.append(("h3", 0, -1))
+    elif line.startswith("## "):
+        spans.append(("h2", 0, -1))
+    elif line.startswith("# "):
+        spans.append(("h1", 0, -1))
+    elif line.strip() in {"---", "***"}:
+        spans.append(("hr", 0, -1))
+    if "**" in line:
+        spans.extend(("bold", m.start(1), m.end(1)) for m in RE_BOLD.finditer(line))
+    if "`" in line:
+        spans.extend(("inlinecode", m.start(1), m.end(1)) for m in RE_INLINE_CODE.finditer(line))
+    return spans
+
+
+def code_fences(lines: List[str]) -> List[int]:
+    """0-based indices of paired ```` ``` ```` fence lines (unclosed fence dropped)."""
+    fences = [i for i, ln in enumerate(lines) if "```" in ln and ln.strip().startswith("```")]
+    if len(fences) % 2:
+        fences.pop()
+    return fences
+
+
+class MarkdownHighlighter:
+    """Tag the visible part of ``text`` lazily; see the module docstring."""
+
+    def __init__(
+        self,
+        text: Any,
+        raw: str,
+        *,
+        chunk_lines: int = CHUNK_LINES,
+        margin: int = MARGIN_LINES,
+    ) -> None:
+        self.text = text
+        self.lines = raw.split("\n")
+        self.chunk_lines = max(1, chunk_lines)
+        self.margin = max(0, margin)
+        self._fences = code_fences(self.lines)
+        self._done = bytearray(len(self.lines))
+        self._remaining = len(self.lines)
+        self._after: Optional[str] = None
+        self._closed = False
+        self._scrollbar: Any = None
+
+    # --- classification -----------------------------------------------------
+    def in_code(self, index: int) -> bool:
+        """Whether 0-based line ``index`` lies inside a fenced block."""
+        k = bisect_right(self._fences, index)
+        return k % 2 == 1 or (k > 0 and self._fences[k - 1] == index)
+
+    # --- scheduling ---------------------------------------------------------
+    def attach(self, scrollbar: Any = None) -> "MarkdownHighlighter":
+        """Route the widget's y-scroll updates (scrolling, resizing, edits)
+        through :meth:`refresh`, forwarding them to ``scrollbar``."""
+        self._scrollbar = scrollbar
+        try:
+            self.text.configure(yscrollcommand=self._on_yscroll)
+        except Exception:
+            pass
+        self.refresh()
+        return self
+
+    def _on_yscroll(self, *args: Any) -> None:
+        if self._scrollbar is not None:
+            try:
+                self._scrollbar.set(*args)
+            except Exception:
+                pass
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Schedule highlighting of the current viewport on idle."""
+        if self._closed or self._after is not None or not self._remaining:
+            return
+        try:
+            self._after = self.text.after_idle(self._pump)
+        except Exception:
+            self._after = None
+
+    def close(self) -> None:
+        """Stop highlighting (e.g. before the content is replaced)."""
+        self._closed = True
+        if self._after is not None:
+            try:
+                self.text.after_cancel(self._after)
+            except Exception:
+                pass
+            self._after = None
+
+    # --- work ---------------------------------------------------------------
+    def _visible(self) -> Tuple[int, int]:
+        first = int(str(self.text.index("@0,0")).split(".")[0])
+        last = int(str(self.text.index(f"@0,{self.text.winfo_height()}")).split(".")[0])
+        return first, last
+
+    def _pump(self) -> None:
+        self._after = None
+        if self._closed:
+            return
+        try:
+            first, last = self._visible()
+        except Exception:
+            return  # widget destroyed
+        lo = max(1, first - self.margin)
+        hi = min(len(self.lines), last + self.margin)
+        budget = self.chunk_lines
+        done = self._done
+        for lineno in range(lo, hi + 1):
+            if done[lineno - 1]:
+                continue
+            if budget == 0:
+                self.refresh()  # more to tag in this viewport: next idle slice
+                return
+            self._tag_line(lineno)
+            budget -= 1
+
+    def _tag_line(self, lineno: int) -> None:
+        idx = lineno - 1
+        self._done[idx] = 1
+        self._remaining -= 1
+        for tag, start, end in line_tags(self.lines[idx], self.in_code(idx)):
+            stop = f"{lineno}.0 lineend" if end < 0 else f"{lineno}.{end}"
+            try:
+                self.text.tag_add(tag, f"{lineno}.{start}", stop)
+            except Exception:
+                pass
+
+    def highlight_all(self) -> None:
+        """Tag every line synchronously (small documents, tests)."""
+        for lineno in range(1, len(self.lines) + 1):
+            if not self._done[lineno - 1]:
+                self._tag_line(lineno)
+
+
+def highlight_markdown(text: Any, raw: str, scrollbar: Any = None) -> MarkdownHighlighter:
+    """Start viewport-driven highlighting of ``raw`` already inserted in ``text``."""
+    return MarkdownHighlighter(text, raw).attach(scrollbar)
+
+
+__all__ = [
+    "MarkdownHighlighter",
+    "code_fences",
+    "highlight_markdown",
+    "line_tags",
+]
@@ -4,6 +4,8 @@ from __future__ import annotations
 from pathlib import Path
 
 from .ui import create_window
+from .markdown_view import highlight_markdown
+from ...text_loader import insert_progressively, title_progress
 from .formatting import (
     format_list_input,
     load_file_with_limit,
@@ -70,7 +72,8 @@ def collect_file_variable_gui(template_id: int, placeholder: dict, globals_map:
         return fname or None
 
     def _show_viewer(path: str):
-        viewer = create_window(f"File: {Path(path).name}")
+        title = f"File: {Path(path).name}"
+        viewer = create_window(title)
         viewer.geometry("900x680")
         viewer.resizable(True, True)
         viewer.lift(); viewer.focus_force(); viewer.attributes("-topmost", True); viewer.after(100, lambda: viewer.attributes("-topmost", False))
@@ -90,10 +93,14 @@ def collect_file_variable_gui(template_id: int, placeholder: dict, globals_map:
         text.pack(side="left", fill="both", expand=True)
         scroll.pack(side="right", fill="y")
 
+        loader = {"value": None}
+
         def render():
             content = load_file_with_limit(path, size_limit=SIZE_LIMIT)
+            if loader["value"] is not None:
+                loader["value"].cancel()
             text.delete("1.0", "end")
-            text.insert("1.0", content)
+            loader["value"] = insert_progressively(text, content, on_progress=title_progress(viewer, title))
 
         render()
 
@@ -173,7 +180,8 @@ def collect_reference_file_variable_gui(template_id: int, placeholder: dict):
             save_overrides(ov)
 
     def _show_viewer(path: str):
-        viewer = create_window(f"Reference File: {Path(path).name}")
+        title = f"Reference File: {Path(path).name}"
+        viewer = create_window(title)
         viewer.geometry("900x680")
         viewer.resizable(True, True)
         viewer.lift(); viewer.focus_force(); viewer.attributes("-topmost", True); viewer.after(100, lambda: viewer.attributes("-topmost", False))
@@ -193,10 +201,14 @@ def collect_reference_file_variable_gui(template_id: int, placeholder: dict):
         text.pack(side="left", fill="both", expand=True)
         scroll.pack(side="right", fill="y")
 
+        loader = {"value": None}
+
         def render():
             content = load_file_with_limit(path, size_limit=SIZE_LIMIT)
+            if loader["value"] is not None:
+                loader["value"].cancel()
             text.delete("1.0", "end")
-            text.insert("1.0", content)
+            loader["value"] = insert_progressively(text, content, on_progress=title_progress(viewer, title))
 
         render()
 
@@ -286,7 +298,8 @@ def collect_global_reference_file_gui(placeholder: dict):
         return None
 
     def _show_viewer(path: str) -> str:
-        viewer = create_window(f"Reference File: {Path(path).name}")
+        title = f"Reference File: {Path(path).name}"
+        viewer = create_window(title)
         viewer.geometry("900x680")
         viewer.resizable(True, True)
         viewer.lift(); viewer.focus_force(); viewer.attributes("-topmost", True); viewer.after(100, lambda: viewer.attributes("-topmost", False))
@@ -311,29 +324,9 @@ def collect_global_reference_file_gui(placeholder: dict):
         text.tag_configure("inlinecode", background="#eee")
         text.tag_configure("hr", foreground="#666")
 
-        def _apply_markdown(text_widget, raw: str):
-            lines = raw.splitlines(); cursor = 1; in_code = False; code_start_index = None
-            for ln in lines:
-                line_index = f"{cursor}.0"
-                if ln.strip().startswith("```"):
-                    if not in_code:
-                        in_code = True; code_start_index = line_index
-                    else:
-                        try: text_widget.tag_add("codeblock", code_start_index, f"{cursor}.0 lineend")
-                        except Exception: pass
-                        in_code = False; code_start_index = None
-                elif not in_code:
-                    if ln.startswith("### "): text_widget.tag_add("h3", line_index, f"{cursor}.0 lineend")
-                    elif ln.startswith("## "): text_widget.tag_add("h2", line_index, f"{cursor}.0 lineend")
-                    elif ln.startswith("# "): text_widget.tag_add("h1", line_index, f"{cursor}.0 lineend")
-                    elif ln.strip() in {"---", "***"}: text_widget.tag_add("hr", line_index, f"{cursor}.0 lineend")
-                cursor += 1
-            import re
-            full = text_widget.get("1.0", "end-1c")
-            for m in re.finditer(r"\*\*(.+?)\*\*", full): text_widget.tag_add("bold", f"1.0+{m.start(1)}c", f"1.0+{m.end(1)}c")
-            for m in re.finditer(r"`([^`]+?)`", full): text_widget.tag_add("inlinecode", f"1.0+{m.start(1)}c", f"1.0+{m.end(1)}c")
-
         wants_md = (placeholder.get("render") == "markdown")
+        highlighter = {"value": None}
+        loader = {"value": None}
 
         def render(markdown: bool = True):
             content = load_file_with_limit(path, size_limit=SIZE_LIMIT).replace("\r", "")
@@ -347,10 +340,21 @@ def collect_global_reference_file_gui(placeholder: dict):
                 content_to_insert = "\n".join(new_lines)
             else:
                 content_to_insert = content
-            text.delete("1.0", "end"); text.insert("1.0", content_to_insert)
-            if markdown and wants_md:
-                try: _apply_markdown(text, content_to_insert)
-                except Exception: pass
+            if highlighter["value"] is not None:
+                highlighter["value"].close(); highlighter["value"] = None
+            if loader["value"] is not None:
+                loader["value"].cancel()
+            text.delete("1.0", "end")
+
+            def _highlight():
+                # Tag only once every line exists in the widget
+                if markdown and wants_md:
+                    try: highlighter["value"] = highlight_markdown(text, content_to_insert, scroll)
+                    except Exception: pass
+
+            loader["value"] = insert_progressively(
+                text, content_to_insert, on_progress=title_progress(viewer, title), on_done=_highlight
+            )
 
         render()
 
@@ -478,7 +482,8 @@ def show_reference_file_content(path: str) -> None:
     import tkinter as tk
 
     root = tk.Tk()
-    root.title(f"Reference: {Path(path).name}")
+    title = f"Reference: {Path(path).name}"
+    root.title(title)
     root.geometry("900x680")
     root.resizable(True, True)
     root.lift()
@@ -499,51 +504,30 @@ def show_reference_file_content(path: str) -> None:
     scroll.pack(side="right", fill="y")
 
     content = load_file_with_limit(path)
-    text.insert("1.0", content)
     text.config(state="disabled")
+    loader = {"value": insert_progressively(text, content, on_progress=title_progress(root, title))}
 
     toolbar = tk.Frame(main_frame)
     toolbar.pack(fill="x")
 
     show_raw = {"value": False}
 
-    def _apply_markdown(text_widget, raw: str):
-        lines = raw.splitlines(); cursor = 1
-        in_code = False; code_start = None
-        for ln in lines:
-            idx = f"{cursor}.0"
-            if ln.strip().startswith("```"):
-                if not in_code:
-                    in_code = True; code_start = idx
-                else:
-                    try: text_widget.tag_add("codeblock", code_start, f"{cursor}.0 lineend")
-                    except Exception: pass
-                    in_code = False; code_start = None
-            elif not in_code:
-                if ln.startswith("### "):
-                    text_widget.tag_add("h3", idx, f"{cursor}.0 lineend")
-                elif ln.startswith("## "):
-                    text_widget.tag_add("h2", idx, f"{cursor}.0 lineend")
-                elif ln.startswith("# "):
-                    text_widget.tag_add("h1", idx, f"{cursor}.0 lineend")
-            cursor += 1
-        import re
-        full = text_widget.get("1.0", "end-1c")
-        for m in re.finditer(r"\*\*(.+?)\*\*", full):
-            start = f"1.0+{m.start(1)}c"; end = f"1.0+{m.end(1)}c"; text_widget.tag_add("bold", start, end)
-        for m in re.finditer(r"`([^`]+?)`", full):
-            start = f"1.0+{m.start(1)}c"; end = f"1.0+{m.end(1)}c"; text_widget.tag_add("inlinecode", start, end)
+    highlighter = {"value": None}
 
     def render(markdown: bool = True):
-        if markdown:
-            try:
-                text.config(state="normal"); text.delete("1.0", "end"); text.insert("1.0", content)
-                _apply_markdown(text, content)
-                text.config(state="disabled")
-            except Exception:
-                text.config(state="normal"); text.delete("1.0", "end"); text.insert("1.0", content); text.config(state="disabled")
-        else:
-            text.config(state="normal"); text.delete("1.0", "end"); text.insert("1.0", content); text.config(state="disabled")
+        if highlighter["value"] is not None:
+            highlighter["value"].close(); highlighter["value"] = None
+        loader["value"].cancel()
+        text.config(state="normal"); text.delete("1.0", "end"); text.config(state="disabled")
+
+        def _highlight():
+            if markdown:
+                try: highlighter["value"] = highlight_markdown(text, content, scroll)
+                except Exception: pass
+
+        loader["value"] = insert_progressively(
+            text, content, on_progress=title_progress(root, title), on_done=_highlight
+        )
 
     def toggle_view():
         show_raw["value"] = not show_raw["value"]
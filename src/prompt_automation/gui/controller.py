@@ -11,7 +11,8 @@ from __future__ import annotations
 import os
 import sys
 
-from .. import logger, update, updater
+from .. import logger, startup_profile
+from .. import update, updater  # noqa: F401 - back-compat: patched by callers/tests
 from ..errorlog import get_logger
 from .selector import open_template_selector
 from .collector import collect_variables_gui
@@ -28,14 +29,12 @@ class PromptGUI:
         self._log = get_logger("prompt_automation.gui")
 
     def run(self) -> None:
-        """Launch the GUI using Tkinter. Falls back to CLI if GUI fails."""
-        # Perform background silent pipx upgrade (non-blocking) then existing
-        # manifest-based interactive update (retained behaviour)
-        try:  # never block GUI startup
-            updater.check_for_update()
-        except Exception:
-            pass
-        update.check_and_prompt()
+        """Launch the GUI using Tkinter. Falls back to CLI if GUI fails.
+
+        Update checks run on a background worker: the single-window app starts
+        it after its first frame is painted (see
+        :mod:`prompt_automation.services.update_check`).
+        """
         try:
             import tkinter as tk  # noqa: F401
             from tkinter import ttk, filedialog, messagebox, simpledialog  # noqa: F401
@@ -58,7 +57,9 @@ class PromptGUI:
                 # If another instance is running, request focus & exit
                 try:
                     from .single_window import singleton as _sw_singleton
-                    if _sw_singleton.connect_and_focus_if_running():
+                    with startup_profile.phase("singleton_probe"):
+                        focused = _sw_singleton.connect_and_focus_if_running()
+                    if focused:
                         self._log.info("Existing GUI instance focused (singleton)")
                         return
                 except Exception:
@@ -87,6 +88,12 @@ class PromptGUI:
 
             # --- Legacy multi-window flow (forced or fallback) -----------------------
             self._log.info("Starting GUI workflow (legacy multi-window mode)")
+            try:
+                from ..services.update_check import start_update_checks
+
+                start_update_checks(lambda msg: self._log.info("update: %s", msg))
+            except Exception:
+                pass
             template = open_template_selector()
             if template:
                 variables = collect_variables_gui(template)
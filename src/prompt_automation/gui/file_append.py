@@ -1,14 +1,95 @@
-"""Shared append-to-file logic used by GUI and CLI."""
+"""Shared append-to-file logic used by GUI and CLI.
+
+``context_append_file`` targets receive timestamped entries separated by
+``--- YYYY-MM-DD HH:MM:SS ---`` lines; :func:`read_recent_blocks` loads only
+the newest entries by seeking backwards from the end of the file. Append
+targets can be size-capped (``append_file_max_mb``), rotating the current
+file to ``<name>.1`` … ``<name>.N`` before it would grow past the cap.
+"""
 from __future__ import annotations
 
+import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, List
 
 from ..errorlog import get_logger
+from ..features import get_append_rotation
+from ..renderer import read_file_safe
 
 _log = get_logger(__name__)
 
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_SEPARATOR_RE = re.compile(rb"\n--- \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} ---\r?\n")
+_OVERLAP = 32  # longer than a separator, so matches split across reads are found
+_READ_BLOCK = 64 * 1024
+
+
+def read_recent_blocks(path: str, blocks: int) -> str:
+    """Return the newest ``blocks`` timestamped entries of an append file.
+
+    Reads backwards in 64 KiB steps until enough separators are found and
+    decodes only that tail, prefixed with a marker line noting that older
+    entries were left out. Files with no more than ``blocks`` entries (or
+    ``blocks <= 0``) are returned whole via :func:`read_file_safe`.
+    """
+    if blocks <= 0:
+        return read_file_safe(path)
+    p = Path(path).expanduser()
+    try:
+        with p.open("rb") as fh:
+            pos = fh.seek(0, os.SEEK_END)
+            starts: List[int] = []  # separator offsets, newest first
+            overlap = b""
+            while pos > 0 and len(starts) < blocks:
+                step = min(_READ_BLOCK, pos)
+                pos -= step
+                fh.seek(pos)
+                chunk = fh.read(step)
+                found = [pos + m.start() for m in _SEPARATOR_RE.finditer(chunk + overlap) if m.start() < step]
+                starts.extend(reversed(found))
+                overlap = chunk[:_OVERLAP]
+            if len(starts) < blocks or not _has_data_before(fh, starts[blocks - 1]):
+                return read_file_safe(path)
+            fh.seek(starts[blocks - 1] + 1)
+            tail = fh.read().decode("utf-8", errors="replace")
+    except (OSError, ValueError):
+        return ""
+    return f"[... {p.name}: older entries omitted, showing the last {blocks} ...]\n{tail}"
+
+
+def _has_data_before(fh: Any, end: int) -> bool:
+    """Whether anything but whitespace precedes offset ``end`` of ``fh``."""
+    while end > 0:
+        step = min(_READ_BLOCK, end)
+        end -= step
+        fh.seek(end)
+        if fh.read(step).strip():
+            return True
+    return False
+
+
+def _rotate_if_needed(p: Path, incoming: int) -> None:
+    max_bytes, backups = get_append_rotation()
+    if max_bytes <= 0:
+        return
+    try:
+        size = p.stat().st_size
+    except OSError:
+        return
+    if size == 0 or size + incoming <= max_bytes:
+        return
+    if backups <= 0:
+        os.truncate(p, 0)  # no backups kept: start over in place
+    else:
+        for i in range(backups - 1, 0, -1):
+            older = p.with_name(f"{p.name}.{i}")
+            if older.exists():
+                os.replace(older, p.with_name(f"{p.name}.{i + 1}"))
+        os.replace(p, p.with_name(f"{p.name}.1"))
+    _log.info("append_file.rotated path=%s size=%s backups=%s", p, size, backups)
+
 
 def _append_to_files(var_map: dict[str, Any], text: str) -> None:
     """Append ``text`` to any paths specified by append_file placeholders."""
@@ -18,14 +99,19 @@ def _append_to_files(var_map: dict[str, Any], text: str) -> None:
                 continue
             try:
                 p = Path(path).expanduser()
+                if key == "context_append_file":
+                    ts = datetime.now().strftime(TIMESTAMP_FORMAT)
+                    entry = f"\n\n--- {ts} ---\n{text}\n"
+                else:
+                    entry = text + "\n"
+                try:
+                    _rotate_if_needed(p, len(entry.encode("utf-8")))
+                except Exception as e:  # pragma: no cover - filesystem
+                    _log.warning("failed to rotate %s: %s", path, e)
                 with p.open("a", encoding="utf-8") as fh:
-                    if key == "context_append_file":
-                        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        fh.write(f"\n\n--- {ts} ---\n{text}\n")
-                    else:
-                        fh.write(text + "\n")
+                    fh.write(entry)
             except Exception as e:  # pragma: no cover - filesystem
                 _log.warning("failed to append to %s: %s", path, e)
 
 
-__all__ = ["_append_to_files"]
+__all__ = ["_append_to_files", "read_recent_blocks", "TIMESTAMP_FORMAT"]
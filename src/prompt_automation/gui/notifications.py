@@ -0,0 +1,59 @@
+"""Non-modal notifications anchored to the main window.
+
+``show_notification`` places a small borderless message in the bottom-right
+corner of ``root`` that disappears on click or after ``timeout_ms``. It never
+grabs focus, so typing in the template list continues uninterrupted. Safe to
+call from worker threads once :func:`prompt_automation.gui.ui_queue.install`
+ran for ``root``: the request is queued and the widget is created on the Tk
+thread. Failures are ignored (headless runs, window already closed).
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from . import ui_queue
+
+
+def _show(root: Any, message: str, timeout_ms: int) -> None:
+    import tkinter as tk
+
+    if not root.winfo_exists():
+        return
+    win = tk.Toplevel(root)
+    win.withdraw()
+    win.overrideredirect(True)
+    try:
+        win.transient(root)
+    except Exception:
+        pass
+    label = tk.Label(win, text=message, justify="left", wraplength=360, padx=12, pady=8, relief="solid", borderwidth=1)
+    label.pack()
+    win.update_idletasks()
+    x = root.winfo_rootx() + root.winfo_width() - win.winfo_reqwidth() - 16
+    y = root.winfo_rooty() + root.winfo_height() - win.winfo_reqheight() - 16
+    win.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+    win.deiconify()
+
+    def _close(_event: Any = None) -> None:
+        try:
+            win.destroy()
+        except Exception:
+            pass
+
+    label.bind("<Button-1>", _close)
+    win.after(timeout_ms, _close)
+
+
+def show_notification(root: Any, message: str, timeout_ms: int = 8000) -> None:
+    """Show ``message`` without blocking or stealing focus."""
+
+    def _run() -> None:
+        try:
+            _show(root, message, timeout_ms)
+        except Exception:
+            pass
+
+    ui_queue.post(root, _run)
+
+
+__all__ = ["show_notification"]
@@ -31,6 +31,31 @@ from ...theme import model as _theme_model
 from ...theme import resolve as _theme_resolve
 from ...theme import apply as _theme_apply
 from ... import parser_singlefield  # single-field capture parser
+from ... import startup_profile
+
+
+def _unbind_handler(widget, sequence: str, funcid: str) -> None:
+    """Remove one handler added with ``bind(..., add="+")``, keeping the rest.
+
+    ``Misc.unbind(sequence, funcid)`` drops every handler for ``sequence``
+    on Python < 3.13, so the binding script is rewritten without ``funcid``.
+    """
+    script = widget.bind(sequence) or ""
+    kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+    if kept.strip():
+        widget.bind(sequence, kept)
+    else:
+        widget.unbind(sequence)
+    widget.deletecommand(funcid)
+
+
+def _todoist_dead_message(entries) -> str:
+    """Notification text for Todoist tasks the queue gave up on."""
+    first = entries[0]
+    summary = str(first.get("summary") or "")[:80]
+    error = str(first.get("last_error") or "unknown error")[:120]
+    more = f" (and {len(entries) - 1} more)" if len(entries) > 1 else ""
+    return f"Todoist: could not send \"{summary}\"{more} after retries: {error}"
 
 
 class SingleWindowApp:
@@ -41,7 +66,8 @@ class SingleWindowApp:
 
         self._log = get_logger("prompt_automation.gui.single_window")
 
-        self.root = tk.Tk()
+        with startup_profile.phase("tk_root"):
+            self.root = tk.Tk()
         self.root.title("Prompt Automation")
         self.root.geometry(load_geometry())
         self.root.minsize(960, 640)
@@ -88,7 +114,10 @@ class SingleWindowApp:
                         pass
             except Exception:
                 pass
-            singleton.start_server(lambda: (self._focus_and_raise(), self._focus_first_template_widget()))
+            singleton.start_server(
+                lambda: (self._focus_and_raise(), self._focus_first_template_widget()),
+                handlers={"SHOW": self._handle_show_request},
+            )
             # Ensure no port file remains in restricted test sandboxes
             try:
                 import os
@@ -213,7 +242,8 @@ class SingleWindowApp:
         self._clear_content()
         self._stage = "select"
         try:
-            self._current_view = select.build(self)
+            with startup_profile.phase("template_scan"):
+                self._current_view = select.build(self)
         except Exception as e:
             self._log.error("Template selection failed: %s", e, exc_info=True)
             show_error("Error", f"Failed to open template selector:\n{e}")
@@ -248,6 +278,8 @@ class SingleWindowApp:
                         self._log.debug("fastpath.placeholder_empty", extra={"activated": True})
                     except Exception:
                         pass
+                    # Review only joins the raw lines here (no variables),
+                    # which is cheaper than a render_memo key; no memo needed.
                     self.advance_to_review({})
                     return
         except Exception:  # pragma: no cover - defensive
@@ -413,6 +445,45 @@ class SingleWindowApp:
             except Exception:
                 _do_cycle()
 
+    def show_template(self, template: Dict[str, Any]) -> None:
+        """Bring the window forward and open ``template`` for collection."""
+        self._focus_and_raise()
+        self.advance_to_collect(template)
+
+    def _handle_show_request(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """IPC ``SHOW`` handler (runs on the singleton server thread).
+
+        The template is resolved here so the caller gets an immediate error
+        for unknown ids; the stage swap itself is marshalled onto Tk.
+        """
+        from ...menus import load_template_ref
+
+        ref = req.get("template")
+        tmpl = load_template_ref(ref) if ref not in (None, "") else None
+        if tmpl is None:
+            raise LookupError(f"template not found: {ref}")
+        self.root.after(0, lambda: self.show_template(tmpl))
+        return {"template": tmpl.get("id")}
+
+    def _show_requested_template(self) -> None:
+        """Open a template preselected via ``--show`` on a cold start."""
+        import os
+
+        ref = os.environ.pop("PROMPT_AUTOMATION_SHOW_TEMPLATE", None)
+        if not ref:
+            return
+        try:
+            from ...menus import load_template_ref
+
+            tmpl = load_template_ref(ref)
+        except Exception as e:  # pragma: no cover - defensive
+            self._log.error("Preselected template load failed: %s", e, exc_info=True)
+            return
+        if tmpl is None:
+            self._log.warning("Preselected template not found: %s", ref)
+            return
+        self.advance_to_collect(tmpl)
+
     def cancel(self) -> None:
         self.final_text = None
         self.variables = None
@@ -424,6 +495,9 @@ class SingleWindowApp:
     def run(self) -> tuple[Optional[str], Optional[Dict[str, Any]]]:
         try:
             self.start()
+            self._show_requested_template()
+            self._first_paint_phase = startup_profile.start_phase("first_frame_paint")
+            self._after_first_paint(self._on_first_paint)
             self.root.mainloop()
             return self.final_text, self.variables
         finally:  # persistence best effort
@@ -433,6 +507,70 @@ class SingleWindowApp:
             except Exception:
                 pass
 
+    def _after_first_paint(self, callback) -> None:
+        """Run ``callback`` once, after the window is first exposed and redrawn.
+
+        The ``<Expose>`` handler unbinds itself before ``callback`` runs so
+        later repaints do not keep calling it.
+        """
+        root = self.root
+        fired = False
+        funcid = None
+
+        def _run() -> None:
+            if funcid:
+                try:
+                    _unbind_handler(root, "<Expose>", funcid)
+                except Exception:
+                    pass
+            callback()
+
+        def _on_expose(_event=None) -> None:
+            nonlocal fired
+            if fired:
+                return
+            fired = True
+            try:
+                root.after_idle(_run)
+            except Exception:
+                pass
+
+        try:
+            funcid = root.bind("<Expose>", _on_expose, add="+")
+        except Exception:
+            pass
+
+    def _on_first_paint(self) -> None:
+        self._first_paint_phase()
+        startup_profile.emit()
+        self._start_update_checks()
+        self._resume_todoist_queue()
+
+    def _start_update_checks(self) -> None:
+        """Run update checks off the UI thread; outcomes show as notifications."""
+        try:
+            from ...services.update_check import start_update_checks
+            from .. import ui_queue
+            from ..notifications import show_notification
+
+            ui_queue.install(self.root)  # the worker only posts to this queue
+            start_update_checks(lambda msg: show_notification(self.root, msg))
+        except Exception as e:  # pragma: no cover - never block the UI
+            self._log.error("update check start failed: %s", e)
+
+    def _resume_todoist_queue(self) -> None:
+        """Resume delivery of queued Todoist tasks and report ones given up on."""
+        try:
+            from ...services.todoist_queue import get_queue, resume
+            from .. import ui_queue
+            from ..notifications import show_notification
+
+            ui_queue.install(self.root)
+            get_queue().on_dead = lambda entries: show_notification(self.root, _todoist_dead_message(entries))
+            resume()
+        except Exception as e:  # pragma: no cover - never block the UI
+            self._log.error("todoist queue resume failed: %s", e)
+
     # --- Focus helpers ----------------------------------------------------
     def _focus_and_raise(self) -> None:
         """Force the window to foreground (best effort)."""
@@ -21,6 +21,7 @@ from ....renderer import read_file_safe
 from ...constants import INSTR_COLLECT_SHORTCUTS
 import os
 from ..scroll_helpers import ensure_visible
+from ...text_loader import insert_progressively, title_progress
 from ....errorlog import get_logger
 
 
@@ -499,7 +500,8 @@ def build(app, template: Dict[str, Any]):  # pragma: no cover - Tk runtime
         if not path:
             return
         win = tk.Toplevel(app.root)
-        win.title(f"Reference File: {Path(path).name}")
+        title = f"Reference File: {Path(path).name}"
+        win.title(title)
         win.geometry("900x680")
         text_frame = tk.Frame(win)
         text_frame.pack(fill="both", expand=True)
@@ -512,8 +514,8 @@ def build(app, template: Dict[str, Any]):  # pragma: no cover - Tk runtime
             content = read_file_safe(path).replace("\r", "")
         except Exception:
             content = "(Error reading file)"
-        txt.insert("1.0", content)
         txt.config(state="disabled")
+        insert_progressively(txt, content, on_progress=title_progress(win, title))
 
     view_btn = tk.Button(ref_frame, text="View", command=_view_ref)
     view_btn.pack(side="left", padx=2)
@@ -612,7 +614,8 @@ def build(app, template: Dict[str, Any]):  # pragma: no cover - Tk runtime
             if not path:
                 return
             win = tk.Toplevel(app.root)
-            win.title(f"Reference File: {Path(path).name}")
+            title = f"Reference File: {Path(path).name}"
+            win.title(title)
             win.geometry("900x680")
             text_frame = tk.Frame(win)
             text_frame.pack(fill="both", expand=True)
@@ -625,8 +628,8 @@ def build(app, template: Dict[str, Any]):  # pragma: no cover - Tk runtime
                 content = read_file_safe(path).replace("\r", "")
             except Exception:
                 content = "(Error reading file)"
-            txt.insert("1.0", content)
             txt.config(state="disabled")
+            insert_progressively(txt, content, on_progress=title_progress(win, title))
 
         view_btn = tk.Button(ref_frame, text="View", command=_view_ref)
         view_btn.pack(side="left", padx=2)
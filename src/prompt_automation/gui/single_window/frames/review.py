@@ -16,8 +16,11 @@ from ...error_dialogs import safe_copy_to_clipboard
 from ....variables.storage import get_setting_auto_copy_review, is_auto_copy_enabled_for_template
 from ...constants import INSTR_FINISH_COPY_AGAIN, INSTR_FINISH_COPY_CLOSE
 from ...file_append import _append_to_files
+from ... import ui_queue
+from ...text_loader import insert_progressively, title_progress
 from ....logger import log_usage
-from ....services.todoist_action import send_to_todoist, build_summary_and_note
+from ....services.todoist_action import queue_to_todoist, build_summary_and_note
+from ....services.post_actions import PostAction, run_post_actions, submit as submit_post_actions
 
 
 def build(app, template: Dict[str, Any], variables: Dict[str, Any]):  # pragma: no cover - Tk runtime
@@ -148,7 +151,6 @@ def build(app, template: Dict[str, Any], variables: Dict[str, Any]):  # pragma:
     text.configure(yscrollcommand=scroll.set)
     text.grid(row=0, column=0, sticky="nsew")
     scroll.grid(row=0, column=1, sticky="ns")
-    text.insert("1.0", rendered)
     text.focus_set()
 
     status_var = tk.StringVar(value="")
@@ -157,11 +159,19 @@ def build(app, template: Dict[str, Any], variables: Dict[str, Any]):  # pragma:
     btn_bar.columnconfigure(0, weight=1)
     tk.Label(btn_bar, textvariable=status_var, anchor="w").grid(row=0, column=0, sticky="w", padx=12)
 
+    def _load_progress(loaded: int, total: int) -> None:
+        status_var.set("" if loaded >= total else f"Loading… {loaded * 100 // max(total, 1)}%")
+
+    # Large prompts are appended in chunks so the window paints immediately;
+    # copy/finish flush the remainder before reading the widget back.
+    loader = insert_progressively(text, rendered, on_progress=_load_progress)
+
     def _set_status(msg: str) -> None:
         status_var.set(msg)
         app.root.after(3000, lambda: status_var.set(""))
 
     def do_copy() -> None:
+        loader.flush()
         content = text.get("1.0", "end-1c")
         if not safe_copy_to_clipboard(content):
             copy_to_clipboard(content)
@@ -183,8 +193,9 @@ def build(app, template: Dict[str, Any], variables: Dict[str, Any]):  # pragma:
                 return
             win = tk.Toplevel(app.root)
             from pathlib import Path as _P
-            try: win.title(f"Reference File: {_P(ref_path).name}")
-            except Exception: win.title("Reference File")
+            try: title = f"Reference File: {_P(ref_path).name}"
+            except Exception: title = "Reference File"
+            win.title(title)
             win.geometry("900x680")
             text_frame = tk.Frame(win)
             text_frame.pack(fill="both", expand=True)
@@ -208,55 +219,74 @@ def build(app, template: Dict[str, Any], variables: Dict[str, Any]):  # pragma:
                 txt.configure(font=get_display_font(master=app.root))
             except Exception:
                 pass
-            txt.insert("1.0", content)
             txt.config(state="disabled")
+            insert_progressively(txt, content, on_progress=title_progress(win, title))
         except Exception:
             pass
 
+    def _record_history(final_text: str) -> None:
+        from ....history import record_history
+        record_history(template, rendered_text=final_text, final_output=final_text)
+
+    def _todoist_post_action(final_vars: Dict[str, Any]):
+        # Build Summary/Note from current variables following omission rules
+        summary, note = build_summary_and_note(
+            action=str(final_vars.get("action") or ""),
+            type_=str(final_vars.get("type") or ""),
+            dod=str(final_vars.get("dod") or ""),
+            nra=str(final_vars.get("nra") or ""),
+        )
+        if summary.strip():
+            return queue_to_todoist(summary, note)
+        return True, "empty"
+
+    # build() runs on the Tk thread; post-action status events are handed
+    # back through this queue instead of touching Tk from the worker.
+    ui_queue.install(app.root)
+
+    def _post_status(name: str, state: str, detail: str) -> None:
+        # Called on the post-action worker; only Todoist failures are surfaced
+        # (non-blocking UX: the text is already on the clipboard). Tasks the
+        # queue gives up on after retries are reported by the controller.
+        if name != "todoist" or state == "ok":
+            return
+
+        def _warn() -> None:
+            try:
+                from tkinter import messagebox  # type: ignore
+                messagebox.showwarning("Todoist", "API failed, copied to clipboard instead")
+            except Exception:
+                pass
+
+        ui_queue.post(app.root, _warn)
+
     def finish() -> None:
+        loader.flush()
         final_text = text.get("1.0", "end-1c")
+        do_append = False
         if needs_append:
             try:
                 from tkinter import messagebox  # type: ignore
                 do_append = messagebox.askyesno("Append Output", "Append rendered text to file(s)?")
             except Exception:
                 do_append = False
-            if do_append:
-                _append_to_files(variables, final_text)
-        log_usage(template, len(final_text))
-        # Record in recent history (ignore errors)
-        try:
-            from ....history import record_history
-            record_history(template, rendered_text=final_text, final_output=final_text)
-        except Exception:
-            pass
         if not safe_copy_to_clipboard(final_text):
             copy_to_clipboard(final_text)
 
-        # Optional Todoist post-action (non-blocking UX on failure)
+        # File appends, usage/history logging and queueing the Todoist task
+        # run on the post-action worker so the window cycles back immediately.
+        final_vars = dict(variables)
+        actions = []
+        if do_append:
+            actions.append(PostAction("append", lambda: _append_to_files(final_vars, final_text)))
+        actions.append(PostAction("log_usage", lambda: log_usage(template, len(final_text)), timeout=5.0))
+        actions.append(PostAction("history", lambda: _record_history(final_text), timeout=5.0))
+        actions.append(PostAction("todoist", lambda: _todoist_post_action(final_vars)))
         try:
-            # Build Summary/Note from current variables following omission rules
-            summary, note = build_summary_and_note(
-                action=str(variables.get("action") or ""),
-                type_=str(variables.get("type") or ""),
-                dod=str(variables.get("dod") or ""),
-                nra=str(variables.get("nra") or ""),
-            )
-            if summary.strip():
-                ok, _msg = send_to_todoist(summary, note)
-                if not ok:
-                    try:
-                        from tkinter import messagebox  # type: ignore
-                        messagebox.showwarning("Todoist", "API failed, copied to clipboard instead")
-                    except Exception:
-                        pass
+            submit_post_actions(actions, _post_status)
         except Exception:
-            # Never block finish due to post-action errors
-            try:
-                from tkinter import messagebox  # type: ignore
-                messagebox.showwarning("Todoist", "API failed, copied to clipboard instead")
-            except Exception:
-                pass
+            # Never lose side effects if the worker cannot start
+            run_post_actions(actions, _post_status)
         app.finish(final_text)
 
     def cancel() -> None:
@@ -292,7 +322,7 @@ def build(app, template: Dict[str, Any], variables: Dict[str, Any]):  # pragma:
     # Perform auto-copy immediately if setting enabled
     try:
         if is_auto_copy_enabled_for_template(template.get("id")):
-            content_initial = text.get("1.0", "end-1c")
+            content_initial = rendered  # widget may still be loading
             if content_initial.strip():
                 copied = safe_copy_to_clipboard(content_initial)
                 if not copied:
@@ -3,8 +3,8 @@
 Allows external invocations (e.g. global hotkey launching a new
 ``prompt-automation --gui`` process) to *focus* the already running
 window instead of spawning a second instance. Implementation keeps
-scope intentionally minimal: a best‑effort unix domain socket server
-listening for short text commands.
+scope intentionally small: a best‑effort unix domain socket (or TCP
+loopback) server speaking a tiny line-framed protocol.
 
 Design:
   * On supported platforms (posix with AF_UNIX), we create a socket
@@ -17,6 +17,22 @@ Design:
     Tk root and toggling topmost briefly (mirrors existing ad‑hoc
     focus code elsewhere for parity).
 
+Protocol:
+  Frames follow :mod:`prompt_automation.ipc`: one line per request, either
+  the legacy plain-text ``FOCUS`` command or a JSON object with a ``cmd``
+  key, answered by one JSON line. Built-in commands:
+
+    ``PING``    -> ``{"ok": true, "pid": <int>}``
+    ``FOCUS``   -> raise and focus the window
+    ``SHOW``    -> ``{"template": <id|path>}`` open the template in the
+                   running window (handler supplied by the GUI controller)
+    ``RENDER``  -> ``{"template": <id|path>, "values": {...}}`` returns
+                   ``{"text": "..."}`` rendered without any UI interaction
+
+  Connections are multiplexed with :mod:`selectors` on a single daemon
+  thread so a slow or idle client never blocks other callers; ``RENDER``
+  requests run on worker threads so a slow render does not delay them.
+
 Failure handling is deliberately quiet: any exception during socket
 operations simply disables singleton behaviour so the GUI still
 launches (never blocking usability).
@@ -24,13 +40,23 @@ launches (never blocking usability).
 from __future__ import annotations
 
 from pathlib import Path
+import json
 import os
 import socket
 import threading
-import contextlib
-from typing import Optional, Callable
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from ...ipc import MAX_FRAME, Handler, encode_frame, serve
+
+__all__ = [
+    "connect_and_focus_if_running",
+    "send_command",
+    "encode_frame",
+    "start_server",
+    "PROTOCOL_VERSION",
+]
 
-__all__ = ["connect_and_focus_if_running", "start_server"]
+PROTOCOL_VERSION = 1
 
 # In-process flag used to acknowledge an already-running GUI within the
 # same Python process when IPC is unavailable (e.g., restricted sandboxes).
@@ -65,34 +91,46 @@ def _port_file() -> Path:
     return base / "gui.port"
 
 
-def connect_and_focus_if_running() -> bool:
-    """Attempt to focus existing instance via UNIX or TCP socket.
+# --- Client side -------------------------------------------------------------
 
-    Returns True if a running instance accepted the focus request.
-    """
+def _connect() -> Optional[socket.socket]:
+    """Return a connected socket to the running instance or ``None``."""
     # 1. AF_UNIX path
     path = _socket_path()
     if hasattr(socket, "AF_UNIX") and os.path.exists(path):
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-                s.settimeout(0.15)
-                s.connect(path)
-                s.sendall(b"FOCUS\n")
-                return True
+            s.settimeout(0.15)
+            s.connect(path)
+            return s
         except Exception:
-            pass
+            s.close()
     # 2. TCP fallback (Windows / forced)
     try:
         pf = _port_file()
         if pf.exists():
             port_txt = pf.read_text().strip()
             if port_txt.isdigit():
-                port = int(port_txt)
-                with socket.create_connection(("127.0.0.1", port), timeout=0.25) as s:
-                    s.sendall(b"FOCUS\n")
-                    return True
+                return socket.create_connection(("127.0.0.1", int(port_txt)), timeout=0.25)
     except Exception:
         pass
+    return None
+
+
+def connect_and_focus_if_running() -> bool:
+    """Attempt to focus existing instance via UNIX or TCP socket.
+
+    Returns True if a running instance accepted the focus request.
+    """
+    s = _connect()
+    if s is not None:
+        try:
+            with s:
+                # Plain-text form keeps compatibility with older instances.
+                s.sendall(b"FOCUS\n")
+                return True
+        except Exception:
+            pass
     # Fallback for environments where IPC sockets/files are not available but
     # the current process already has a running instance (e.g., under tests
     # that start an instance then invoke CLI within the same process).
@@ -102,7 +140,69 @@ def connect_and_focus_if_running() -> bool:
     return False
 
 
-def start_server(focus_callback: Callable[[], None]) -> Optional[threading.Thread]:  # pragma: no cover - runtime thread
+def send_command(cmd: str, timeout: float = 5.0, **payload: Any) -> Optional[Dict[str, Any]]:
+    """Send ``cmd`` with ``payload`` to the running instance and return its reply.
+
+    Returns ``None`` when no instance is reachable or the reply cannot be
+    parsed; otherwise the decoded response object (check ``ok``).
+    """
+    s = _connect()
+    if s is None:
+        return None
+    try:
+        with s:
+            s.settimeout(timeout)
+            s.sendall(encode_frame({"cmd": cmd.upper(), **payload}))
+            buf = b""
+            while b"\n" not in buf:
+                chunk = s.recv(65536)
+                if not chunk:
+                    break
+                buf += chunk
+                if len(buf) > MAX_FRAME * 64:
+                    return None
+        reply = json.loads(buf.split(b"\n", 1)[0].decode("utf-8"))
+        return reply if isinstance(reply, dict) else None
+    except Exception:
+        return None
+
+
+# --- Server side -------------------------------------------------------------
+
+def _render_request(req: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Default ``RENDER`` handler (no UI; values supplied by the caller)."""
+    from ...services.render_service import get_render_service
+
+    return get_render_service().handle_render(req)
+
+
+def _build_handlers(
+    focus_callback: Callable[[], None], extra: Mapping[str, Handler] | None
+) -> Dict[str, Handler]:
+    def _focus(req: Dict[str, Any]) -> None:
+        focus_callback()
+
+    handlers: Dict[str, Handler] = {
+        "PING": lambda req: {"pid": os.getpid(), "protocol": PROTOCOL_VERSION},
+        "FOCUS": _focus,
+        "RENDER": _render_request,
+    }
+    for name, fn in (extra or {}).items():
+        handlers[name.upper()] = fn
+    return handlers
+
+
+def start_server(
+    focus_callback: Callable[[], None],
+    handlers: Mapping[str, Handler] | None = None,
+) -> Optional[threading.Thread]:  # pragma: no cover - runtime thread
+    """Start the IPC server thread.
+
+    ``handlers`` maps additional (or overriding) command names to callables
+    receiving the decoded request and returning an optional dict merged into
+    the reply. Handlers run on the server thread (``RENDER`` on a worker
+    pool); GUI work must be marshalled onto the Tk thread by the caller.
+    """
     global _IN_PROCESS_RUNNING, _INPROC_SOCKET_PATH
     # Mark that a GUI instance exists in this process even if IPC cannot be established
     _IN_PROCESS_RUNNING = True
@@ -129,6 +229,7 @@ def start_server(focus_callback: Callable[[], None]) -> Optional[threading.Threa
         except Exception:
             pass
         return None
+    dispatch = _build_handlers(focus_callback, handlers)
     force_tcp = os.environ.get("PROMPT_AUTOMATION_SINGLETON_FORCE_TCP") == "1"
     use_unix = hasattr(socket, "AF_UNIX") and not force_tcp and os.name != "nt"
 
@@ -148,27 +249,28 @@ def start_server(focus_callback: Callable[[], None]) -> Optional[threading.Threa
         try:
             srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             srv.bind(path)
-            srv.listen(1)
+            srv.listen(8)
         except Exception:
             return None
 
-        def _loop_unix():
-            with contextlib.ExitStack() as stack:
-                stack.callback(lambda: (srv.close(), os.path.exists(path) and os.unlink(path)))
-                while True:
-                    try:
-                        conn, _ = srv.accept()
-                    except Exception:
-                        break
-                    with conn:
-                        try:
-                            data = conn.recv(32)
-                            if data and data.strip().upper().startswith(b"FOCUS"):
-                                focus_callback()
-                        except Exception:
-                            pass
-
-        t = threading.Thread(target=_loop_unix, name="prompt-auto-singleton", daemon=True)
+        def _cleanup_unix():  # pragma: no cover - shutdown path
+            try:
+                srv.close()
+            except Exception:
+                pass
+            try:
+                if os.path.exists(path):
+                    os.unlink(path)
+            except Exception:
+                pass
+
+        t = threading.Thread(
+            target=serve,
+            args=(srv, dispatch, _cleanup_unix),
+            kwargs={"background": ("RENDER",)},
+            name="prompt-auto-singleton",
+            daemon=True,
+        )
         t.start()
         return t
 
@@ -188,7 +290,7 @@ def start_server(focus_callback: Callable[[], None]) -> Optional[threading.Threa
             return None
         srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         srv.bind(("127.0.0.1", 0))  # ephemeral port
-        srv.listen(1)
+        srv.listen(8)
         # Validate that clients are permitted to connect in this environment.
         port = srv.getsockname()[1]
         try:
@@ -219,40 +321,31 @@ def start_server(focus_callback: Callable[[], None]) -> Optional[threading.Threa
     except Exception:
         return None
 
-    def _loop_tcp():
-        with contextlib.ExitStack() as stack:
-            def _cleanup():  # pragma: no cover - shutdown path
-                try:
-                    srv.close()
-                except Exception:
-                    pass
-                try:
-                    p = _port_file()
-                    if p.exists():
-                        p.unlink()
-                except Exception:
-                    pass
-                # Also remove legacy duplicate if present
-                try:
-                    legacy_pf = Path.home() / ".prompt-automation" / "gui.port"
-                    if legacy_pf.exists():
-                        legacy_pf.unlink()
-                except Exception:
-                    pass
-            stack.callback(_cleanup)
-            while True:
-                try:
-                    conn, _ = srv.accept()
-                except Exception:
-                    break
-                with conn:
-                    try:
-                        data = conn.recv(32)
-                        if data and data.strip().upper().startswith(b"FOCUS"):
-                            focus_callback()
-                    except Exception:
-                        pass
+    def _cleanup_tcp():  # pragma: no cover - shutdown path
+        try:
+            srv.close()
+        except Exception:
+            pass
+        try:
+            p = _port_file()
+            if p.exists():
+                p.unlink()
+        except Exception:
+            pass
+        # Also remove legacy duplicate if present
+        try:
+            legacy_pf = Path.home() / ".prompt-automation" / "gui.port"
+            if legacy_pf.exists():
+                legacy_pf.unlink()
+        except Exception:
+            pass
 
-    t = threading.Thread(target=_loop_tcp, name="prompt-auto-singleton-tcp", daemon=True)
+    t = threading.Thread(
+        target=serve,
+        args=(srv, dispatch, _cleanup_tcp),
+        kwargs={"background": ("RENDER",)},
+        name="prompt-auto-singleton-tcp",
+        daemon=True,
+    )
     t.start()
     return t
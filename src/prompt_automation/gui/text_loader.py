@@ -0,0 +1,167 @@
+"""Progressive insertion of large strings into ``tk.Text`` widgets.
+
+A single ``text.insert("1.0", content)`` of a multi-megabyte file blocks the
+event loop until Tk has laid out the whole buffer. :func:`insert_progressively`
+inserts the first screen synchronously, cut at a line boundary, and appends
+the rest in ``chunk_chars`` slices scheduled with ``after`` so the window
+stays scrollable and closable while loading. Short content (the common case)
+is inserted in one call exactly as before.
+
+Callers that read the widget back (copy/finish) call
+:meth:`ChunkedInserter.flush` first so they never see a partial buffer.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+FIRST_SCREEN_CHARS = 16 * 1024
+CHUNK_CHARS = 64 * 1024
+CHUNK_DELAY_MS = 1
+
+Progress = Callable[[int, int], None]
+
+
+def _cut(content: str, start: int, size: int) -> int:
+    """End offset of a slice of about ``size`` chars, extended to a newline."""
+    end = start + size
+    if end >= len(content):
+        return len(content)
+    nl = content.find("\n", end)
+    return end if nl < 0 or nl - end > size else nl + 1
+
+
+class ChunkedInserter:
+    """Append ``content`` to ``text`` in idle-friendly slices."""
+
+    def __init__(
+        self,
+        text: Any,
+        content: str,
+        *,
+        first_chars: int = FIRST_SCREEN_CHARS,
+        chunk_chars: int = CHUNK_CHARS,
+        delay_ms: int = CHUNK_DELAY_MS,
+        on_progress: Optional[Progress] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.text = text
+        self.content = content
+        self.first_chars = max(1, first_chars)
+        self.chunk_chars = max(1, chunk_chars)
+        self.delay_ms = delay_ms
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.offset = 0
+        self._after: Optional[str] = None
+        self._cancelled = False
+
+    @property
+    def done(self) -> bool:
+        return self.offset >= len(self.content)
+
+    def _append(self, end: int) -> None:
+        piece = self.content[self.offset:end]
+        state = None
+        try:
+            state = str(self.text.cget("state"))
+        except Exception:
+            pass
+        if state == "disabled":
+            self.text.configure(state="normal")
+        try:
+            self.text.insert("end-1c", piece)
+        finally:
+            if state == "disabled":
+                self.text.configure(state="disabled")
+        self.offset = end
+        if self.on_progress is not None:
+            try:
+                self.on_progress(self.offset, len(self.content))
+            except Exception:
+                pass
+
+    def _finish(self) -> None:
+        if self.on_done is not None:
+            callback, self.on_done = self.on_done, None
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def start(self) -> "ChunkedInserter":
+        self._append(_cut(self.content, 0, self.first_chars))
+        if self.done:
+            self._finish()
+        else:
+            self._schedule()
+        return self
+
+    def _schedule(self) -> None:
+        try:
+            self._after = self.text.after(self.delay_ms, self._step)
+        except Exception:
+            self._after = None
+            self.flush()
+
+    def _step(self) -> None:
+        self._after = None
+        if self._cancelled or self.done:
+            return
+        try:
+            self._append(_cut(self.content, self.offset, self.chunk_chars))
+        except Exception:
+            self._cancelled = True  # widget destroyed mid-load
+            return
+        if self.done:
+            self._finish()
+        else:
+            self._schedule()
+
+    def flush(self) -> None:
+        """Insert everything still pending right now."""
+        if self._after is not None:
+            try:
+                self.text.after_cancel(self._after)
+            except Exception:
+                pass
+            self._after = None
+        if not self._cancelled and not self.done:
+            self._append(len(self.content))
+            self._finish()
+
+    def cancel(self) -> None:
+        """Stop loading (content is being replaced or the window closed)."""
+        self._cancelled = True
+        if self._after is not None:
+            try:
+                self.text.after_cancel(self._after)
+            except Exception:
+                pass
+            self._after = None
+
+
+def insert_progressively(text: Any, content: str, **kwargs: Any) -> ChunkedInserter:
+    """Insert ``content`` at the end of ``text``; see :class:`ChunkedInserter`."""
+    return ChunkedInserter(text, content, **kwargs).start()
+
+
+def title_progress(window: Any, title: str) -> Progress:
+    """Progress callback that shows ``(loading N%)`` in ``window``'s title."""
+
+    def _update(loaded: int, total: int) -> None:
+        try:
+            if loaded >= total:
+                window.title(title)
+            else:
+                window.title(f"{title} (loading {loaded * 100 // max(total, 1)}%)")
+        except Exception:
+            pass
+
+    return _update
+
+
+__all__ = [
+    "ChunkedInserter",
+    "insert_progressively",
+    "title_progress",
+]
@@ -0,0 +1,60 @@
+"""Hand callbacks from worker threads to the Tk thread.
+
+Tkinter is not thread-safe: worker threads must not touch widgets, and that
+includes ``root.after``. :func:`install` (called once on the Tk thread)
+attaches a :class:`queue.Queue` to ``root`` and drains it from an ``after``
+poll every ``POLL_MS``; :func:`post` may be called from any thread and only
+puts the callable on that queue. Posts for a root without a queue, or after
+the root was destroyed, are dropped.
+"""
+from __future__ import annotations
+
+import queue
+from typing import Any, Callable
+
+from ..errorlog import get_logger
+
+_log = get_logger(__name__)
+
+POLL_MS = 50
+_ATTR = "_prompt_automation_ui_queue"
+
+
+def install(root: Any, poll_ms: int = POLL_MS) -> "queue.Queue[Callable[[], Any]]":
+    """Attach the queue to ``root`` and start draining it (Tk thread only)."""
+    existing = getattr(root, _ATTR, None)
+    if existing is not None:
+        return existing
+    pending: "queue.Queue[Callable[[], Any]]" = queue.Queue()
+
+    def _drain() -> None:
+        while True:
+            try:
+                fn = pending.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn()
+            except Exception as e:  # pragma: no cover - callback bugs
+                _log.debug("ui_queue callback failed: %s", e)
+        try:
+            root.after(poll_ms, _drain)
+        except Exception:
+            pass  # root destroyed; stop polling
+
+    setattr(root, _ATTR, pending)
+    root.after(poll_ms, _drain)
+    return pending
+
+
+def post(root: Any, fn: Callable[[], Any]) -> bool:
+    """Queue ``fn`` to run on the Tk thread; ``False`` if ``root`` has no queue."""
+    pending = getattr(root, _ATTR, None)
+    if pending is None:
+        _log.debug("ui_queue.post dropped: queue not installed")
+        return False
+    pending.put(fn)
+    return True
+
+
+__all__ = ["POLL_MS", "install", "post"]
@@ -0,0 +1,285 @@
+"""Line-framed JSON request protocol shared by local IPC endpoints.
+
+Used by the single-window singleton socket and the headless render service.
+Every frame is one line terminated by ``\\n``: either a JSON object with a
+``cmd`` key or a legacy bare word such as ``FOCUS``. Each request receives
+exactly one JSON line in reply, ``{"ok": true, ...}`` or
+``{"ok": false, "error": "..."}``; an ``id`` field in the request is echoed
+back so clients may pipeline several requests over one connection.
+
+Kept dependency-free (stdlib only) so importing it never slows the
+``--focus`` fast path.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import queue
+import selectors
+import socket
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Collection, Deque, Dict, List, Mapping, Optional
+
+__all__ = ["Handler", "MAX_FRAME", "encode_frame", "parse_frame", "dispatch", "serve"]
+
+# Upper bound for a single request line; guards servers against
+# unterminated garbage filling memory.
+MAX_FRAME = 1 << 20
+
+Handler = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def encode_frame(message: Mapping[str, Any]) -> bytes:
+    """Serialize ``message`` as one protocol frame."""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def parse_frame(line: bytes, default_cmd: str = "") -> Dict[str, Any]:
+    """Decode one frame; bare words map to ``{"cmd": word}``."""
+    text = line.decode("utf-8", "replace").strip()
+    if text.startswith("{"):
+        req = json.loads(text)
+        if not isinstance(req, dict):
+            raise ValueError("request must be a JSON object")
+        if default_cmd:
+            req.setdefault("cmd", default_cmd)
+        return req
+    # Legacy plain-text command (e.g. ``FOCUS``)
+    return {"cmd": text.split()[0] if text else default_cmd}
+
+
+def dispatch(line: bytes, handlers: Mapping[str, Handler], default_cmd: str = "") -> bytes:
+    """Run the handler for one request frame and return the encoded reply.
+
+    ``default_cmd`` is applied to JSON requests lacking a ``cmd`` key so
+    single-purpose endpoints can accept bare payload objects.
+    """
+    try:
+        req = parse_frame(line, default_cmd)
+    except Exception as e:
+        return encode_frame({"ok": False, "error": f"bad request: {e}"})
+    return _respond(req, handlers)
+
+
+def _command(req: Mapping[str, Any]) -> str:
+    return str(req.get("cmd") or "").upper()
+
+
+def _respond(req: Dict[str, Any], handlers: Mapping[str, Handler]) -> bytes:
+    cmd = _command(req)
+    resp: Dict[str, Any] = {"ok": True}
+    if "id" in req:
+        resp["id"] = req["id"]
+    handler = handlers.get(cmd)
+    if handler is None:
+        resp.update(ok=False, error=f"unknown command: {cmd or '(empty)'}")
+        return encode_frame(resp)
+    try:
+        result = handler(req)
+        if isinstance(result, dict):
+            resp.update(result)
+    except Exception as e:
+        resp.update(ok=False, error=str(e) or e.__class__.__name__)
+    return encode_frame(resp)
+
+
+class _Conn:
+    __slots__ = ("sock", "inbuf", "outbuf", "closing", "replies")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.inbuf = b""
+        self.outbuf = b""
+        self.closing = False
+        # One slot per request in arrival order; ``None`` until answered.
+        self.replies: Deque[List[Optional[bytes]]] = deque()
+
+
+_WAKE = object()
+
+
+def serve(
+    srv: socket.socket,
+    handlers: Mapping[str, Handler],
+    cleanup: Callable[[], None] = lambda: None,
+    default_cmd: str = "",
+    background: Collection[str] = (),
+    workers: int = 4,
+) -> None:
+    """Selector loop multiplexing the listening socket ``srv`` and its clients.
+
+    Blocks until ``srv`` is closed (or selection fails), then runs ``cleanup``.
+    Handlers run inline on the calling thread, except commands named in
+    ``background`` (e.g. ``RENDER``), which run on a pool of ``workers``
+    threads so a slow request does not hold up ``PING``/``FOCUS`` for other
+    clients. Replies on one connection are still sent in request order.
+    """
+    sel = selectors.DefaultSelector()
+    offload = {c.upper() for c in background}
+    pool: Optional[ThreadPoolExecutor] = None
+    done: "queue.SimpleQueue[_Conn]" = queue.SimpleQueue()
+    wake_r = wake_w = None
+
+    def _close(state: _Conn) -> None:
+        try:
+            sel.unregister(state.sock)
+        except Exception:
+            pass
+        try:
+            state.sock.close()
+        except Exception:
+            pass
+
+    def _rearm(state: _Conn) -> None:
+        if state.sock.fileno() == -1:
+            return
+        while state.replies and state.replies[0][0] is not None:
+            state.outbuf += state.replies.popleft()[0]  # type: ignore[operator]
+        if state.closing and not state.outbuf and not state.replies:
+            _close(state)
+            return
+        events = 0 if state.closing else selectors.EVENT_READ
+        if state.outbuf:
+            events |= selectors.EVENT_WRITE
+        try:
+            if not events:
+                # Closing and waiting on a background reply: park the socket
+                # until the reply wakes the loop.
+                with contextlib.suppress(KeyError):
+                    sel.unregister(state.sock)
+            else:
+                try:
+                    sel.modify(state.sock, events, state)
+                except KeyError:
+                    sel.register(state.sock, events, state)
+        except Exception:
+            _close(state)
+
+    def _finished(state: _Conn) -> None:
+        done.put(state)
+        try:
+            wake_w.send(b"\0")  # type: ignore[union-attr]
+        except OSError:
+            pass  # buffer full (a wakeup is pending anyway) or loop closed
+
+    def _handle(state: _Conn, line: bytes) -> None:
+        slot: List[Optional[bytes]] = [None]
+        state.replies.append(slot)
+        try:
+            req = parse_frame(line, default_cmd)
+        except Exception as e:
+            slot[0] = encode_frame({"ok": False, "error": f"bad request: {e}"})
+            return
+        if pool is None or _command(req) not in offload:
+            slot[0] = _respond(req, handlers)
+            return
+
+        def _job() -> None:
+            try:
+                slot[0] = _respond(req, handlers)
+            finally:
+                _finished(state)
+
+        try:
+            pool.submit(_job)
+        except RuntimeError:  # pool shut down
+            slot[0] = _respond(req, handlers)
+
+    def _on_read(state: _Conn) -> None:
+        try:
+            chunk = state.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception:
+            chunk = b""
+        if not chunk:
+            # Legacy clients may close without a trailing newline.
+            if state.inbuf.strip():
+                _handle(state, state.inbuf)
+            state.inbuf = b""
+            state.closing = True
+        else:
+            state.inbuf += chunk
+            while b"\n" in state.inbuf:
+                line, state.inbuf = state.inbuf.split(b"\n", 1)
+                if line.strip():
+                    _handle(state, line)
+            if len(state.inbuf) > MAX_FRAME:
+                state.replies.append([encode_frame({"ok": False, "error": "frame too large"})])
+                state.inbuf = b""
+                state.closing = True
+        _rearm(state)
+
+    def _on_write(state: _Conn) -> None:
+        try:
+            sent = state.sock.send(state.outbuf)
+            state.outbuf = state.outbuf[sent:]
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception:
+            # Peer went away (fire-and-forget clients); drop replies.
+            state.outbuf = b""
+            state.replies.clear()
+            state.closing = True
+        _rearm(state)
+
+    def _on_wake() -> None:
+        try:
+            while wake_r.recv(4096):  # type: ignore[union-attr]
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            return
+        while True:
+            try:
+                state = done.get_nowait()
+            except queue.Empty:
+                break
+            _rearm(state)
+
+    with contextlib.ExitStack() as stack:
+        stack.callback(cleanup)
+        stack.callback(sel.close)
+        try:
+            srv.setblocking(False)
+            sel.register(srv, selectors.EVENT_READ, None)
+            if offload:
+                wake_r, wake_w = socket.socketpair()
+                stack.callback(wake_w.close)
+                stack.callback(wake_r.close)
+                wake_r.setblocking(False)
+                wake_w.setblocking(False)
+                sel.register(wake_r, selectors.EVENT_READ, _WAKE)
+                pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="ipc-worker")
+                stack.callback(pool.shutdown, wait=False)
+        except Exception:
+            return
+        while True:
+            try:
+                events = sel.select()
+            except Exception:
+                break
+            for key, mask in events:
+                if key.data is _WAKE:
+                    _on_wake()
+                    continue
+                if key.data is None:
+                    try:
+                        conn, _ = srv.accept()
+                    except (BlockingIOError, InterruptedError):
+                        continue
+                    except Exception:
+                        return
+                    try:
+                        conn.setblocking(False)
+                        sel.register(conn, selectors.EVENT_READ, _Conn(conn))
+                    except Exception:
+                        conn.close()
+                    continue
+                state: _Conn = key.data
+                if mask & selectors.EVENT_READ:
+                    _on_read(state)
+                if mask & selectors.EVENT_WRITE and state.sock.fileno() != -1:
+                    _on_write(state)
@@ -24,7 +24,8 @@ from ..variables import (
     get_global_reference_file,
 )
 
-from .listing import list_styles, list_prompts
+from . import render_memo
+from .listing import list_styles, list_prompts, find_template_path, load_template_ref
 from .creation import (
     save_template,
     delete_template,
@@ -43,7 +44,7 @@ from .render_pipeline import (
     apply_markdown_rendering,
     apply_post_render,
 )
-from .. import parser_singlefield
+from .. import parser_singlefield, render_stats
 from ..reminders import (
     extract_template_reminders,
     partition_placeholder_reminders,
@@ -56,47 +57,92 @@ _log = get_logger(__name__)
 
 # --- Rendering -------------------------------------------------------------
 
+def _context_recent_blocks(placeholders: Any) -> int:
+    """Entries of the context file to inject (0 = whole file)."""
+    for ph in placeholders if isinstance(placeholders, list) else []:
+        if isinstance(ph, dict) and ph.get("name") == "context" and "recent_blocks" in ph:
+            try:
+                return max(0, int(ph["recent_blocks"]))
+            except (TypeError, ValueError):
+                break
+    from ..features import get_context_recent_blocks
+
+    return get_context_recent_blocks()
+
+
 def render_template(
     tmpl: "Template",
     values: Dict[str, Any] | None = None,
     *,
     return_vars: bool = False,
 ) -> str | tuple[str, Dict[str, Any]]:
-    """Render ``tmpl`` using provided ``values`` for placeholders."""
+    """Render ``tmpl`` using provided ``values`` for placeholders.
+
+    Per-stage timings are recorded when render stats are enabled (see
+    :mod:`prompt_automation.render_stats`). Placeholder-free templates are
+    served from :mod:`.render_memo` while their inputs are unchanged.
+    """
+    with render_stats.collect(tmpl.get("id")):
+        key = render_memo.memo_key(tmpl, values)
+        hit = None
+        if key:
+            with render_stats.span("render_memo"):
+                hit = render_memo.lookup(key)
+                (render_stats.cache_hit if hit else render_stats.cache_miss)()
+        if hit is not None:
+            if isinstance(hit.get("globals"), dict):
+                tmpl["global_placeholders"] = dict(hit["globals"])
+            if return_vars:
+                return hit["text"], dict(hit.get("vars") or {})
+            return hit["text"]
+        result = _render_template(tmpl, values, return_vars=return_vars)
+        if key:
+            text, vars = result if isinstance(result, tuple) else (result, None)
+            render_memo.store(key, text, vars, tmpl.get("global_placeholders"))
+        return result
+
 
+def _render_template(
+    tmpl: "Template",
+    values: Dict[str, Any] | None,
+    *,
+    return_vars: bool,
+) -> str | tuple[str, Dict[str, Any]]:
+    span = render_stats.span
     placeholders = tmpl.get("placeholders", [])
     template_id = tmpl.get("id")
 
     meta = tmpl.get("metadata") if isinstance(tmpl.get("metadata"), dict) else {}
     exclude_globals: set[str] = parse_exclusions(meta.get("exclude_globals"))
 
-    try:
-        globals_file = PROMPTS_DIR / "globals.json"
-        if globals_file.exists():
-            gdata = json.loads(globals_file.read_text())
-            gph_all = gdata.get("global_placeholders", {}) or {}
-            if gph_all:
-                tgt = tmpl.setdefault("global_placeholders", {})
-                for k, v in gph_all.items():
-                    if k not in tgt:
-                        tgt[k] = v
-    except Exception:
-        pass
-    globals_map = tmpl.get("global_placeholders", {}) or {}
-    if exclude_globals:
-        for k in list(globals_map.keys()):
-            if k in exclude_globals:
-                globals_map.pop(k, None)
-    if isinstance(template_id, int):
-        ensure_template_global_snapshot(template_id, globals_map)
-        snap_merged = apply_template_global_overrides(template_id, {})
-        for k, v in snap_merged.items():
-            if k in exclude_globals:
-                continue
-            if k == "reminders" and k not in globals_map:
-                continue
-            globals_map.setdefault(k, v)
-        tmpl["global_placeholders"] = globals_map
+    with span("globals"):
+        try:
+            globals_file = PROMPTS_DIR / "globals.json"
+            if globals_file.exists():
+                gdata = json.loads(globals_file.read_text())
+                gph_all = gdata.get("global_placeholders", {}) or {}
+                if gph_all:
+                    tgt = tmpl.setdefault("global_placeholders", {})
+                    for k, v in gph_all.items():
+                        if k not in tgt:
+                            tgt[k] = v
+        except Exception:
+            pass
+        globals_map = tmpl.get("global_placeholders", {}) or {}
+        if exclude_globals:
+            for k in list(globals_map.keys()):
+                if k in exclude_globals:
+                    globals_map.pop(k, None)
+        if isinstance(template_id, int):
+            ensure_template_global_snapshot(template_id, globals_map)
+            snap_merged = apply_template_global_overrides(template_id, {})
+            for k, v in snap_merged.items():
+                if k in exclude_globals:
+                    continue
+                if k == "reminders" and k not in globals_map:
+                    continue
+                globals_map.setdefault(k, v)
+            tmpl["global_placeholders"] = globals_map
     if values is None:
         # Compute reminders (non-invasive): attach a private key for CLI flow,
         # and pass template/global reminders via globals_map under a reserved key.
@@ -130,9 +176,10 @@ def render_template(
                     pass
             except Exception:
                 pass
-        raw_vars = get_variables(
-            placeholders, template_id=template_id, globals_map=globals_map
-        )
+        with span("get_variables"):
+            raw_vars = get_variables(
+                placeholders, template_id=template_id, globals_map=globals_map
+            )
     else:
         raw_vars = dict(values)
 
@@ -154,27 +201,43 @@ def render_template(
 
     vars = dict(raw_vars)
 
-    context_path = raw_vars.get("context_append_file") or raw_vars.get("context_file")
-    if not context_path:
-        candidate = raw_vars.get("context")
-        if isinstance(candidate, str) and Path(candidate).expanduser().is_file():
-            context_path = candidate
-    if context_path:
-        vars["context"] = read_file_safe(str(context_path))
-        raw_vars["context_append_file"] = str(context_path)
-
-    apply_file_placeholders(tmpl, raw_vars, vars, placeholders)
-    apply_defaults(raw_vars, vars, placeholders)
-    apply_global_placeholders(tmpl, vars, exclude_globals)
-    apply_formatting(vars, placeholders)
+    with span("context_file", vars):
+        context_path = raw_vars.get("context_append_file") or raw_vars.get("context_file")
+        if not context_path:
+            candidate = raw_vars.get("context")
+            if isinstance(candidate, str) and Path(candidate).expanduser().is_file():
+                context_path = candidate
+        if context_path:
+            blocks = _context_recent_blocks(placeholders)
+            if blocks:
+                from ..gui.file_append import read_recent_blocks
+
+                vars["context"] = read_recent_blocks(str(context_path), blocks)
+            else:
+                vars["context"] = read_file_safe(str(context_path))
+            raw_vars["context_append_file"] = str(context_path)
+
+    with span("apply_file_placeholders", vars):
+        apply_file_placeholders(tmpl, raw_vars, vars, placeholders)
+    with span("apply_defaults", vars):
+        apply_defaults(raw_vars, vars, placeholders)
+    with span("apply_global_placeholders", vars):
+        apply_global_placeholders(tmpl, vars, exclude_globals)
+    with span("apply_formatting", vars):
+        apply_formatting(vars, placeholders)
     # Convert markdown placeholders (e.g., reference_file) into sanitized HTML and wrappers
-    try:
-        apply_markdown_rendering(tmpl, vars, placeholders)
-    except Exception:
-        pass
+    with span("apply_markdown_rendering", vars):
+        try:
+            apply_markdown_rendering(tmpl, vars, placeholders)
+        except Exception:
+            pass
 
-    rendered = fill_placeholders(tmpl["template"], vars)
-    rendered = apply_post_render(rendered, tmpl, placeholders, vars, exclude_globals)
+    with span("fill_placeholders", vars) as sp:
+        rendered = fill_placeholders(tmpl["template"], vars)
+        sp.output(rendered)
+    with span("apply_post_render", rendered) as sp:
+        rendered = apply_post_render(rendered, tmpl, placeholders, vars, exclude_globals)
+        sp.output(rendered)
 
     # Fallback: if logic-driven tokens still present, attempt late parse & substitution
     if (
@@ -207,6 +270,8 @@ def render_template(
 __all__ = [
     "list_styles",
     "list_prompts",
+    "find_template_path",
+    "load_template_ref",
     "pick_style",
     "pick_prompt",
     "render_template",
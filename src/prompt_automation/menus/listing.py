@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from .. import config
 from ..renderer import load_template, is_shareable
@@ -42,4 +43,45 @@ def list_prompts(style: str, *, shared_only: bool = False) -> List[Path]:
     return filtered
 
 
-__all__ = ["list_styles", "list_prompts"]
+def find_template_path(ref: Any) -> Optional[Path]:
+    """Resolve ``ref`` (template id or file path) to a template file.
+
+    Integers and digit-only strings are matched against the ``id`` field of
+    templates under ``PROMPTS_DIR``; anything else is treated as a path,
+    absolute or relative to ``PROMPTS_DIR``.
+    """
+    if isinstance(ref, bool) or ref is None:
+        return None
+    text = str(ref).strip()
+    if not text:
+        return None
+    if isinstance(ref, int) or text.isdigit():
+        wanted = int(text)
+        for p in sorted(config.PROMPTS_DIR.rglob("*.json")):
+            if p.name.lower() == "settings.json":
+                continue
+            try:
+                data = json.loads(p.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+            if isinstance(data, dict) and data.get("id") == wanted:
+                return p
+        return None
+    candidate = Path(text).expanduser()
+    if not candidate.is_absolute():
+        candidate = config.PROMPTS_DIR / candidate
+    return candidate if candidate.is_file() else None
+
+
+def load_template_ref(ref: Any) -> Optional[Dict[str, Any]]:
+    """Load the template identified by ``ref`` or return ``None``."""
+    path = find_template_path(ref)
+    if path is None:
+        return None
+    try:
+        return load_template(path)
+    except Exception:
+        return None
+
+
+__all__ = ["list_styles", "list_prompts", "find_template_path", "load_template_ref"]
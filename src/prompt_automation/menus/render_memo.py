@@ -0,0 +1,202 @@
+"""Persistent memo of rendered output for placeholder-free templates.
+
+Templates without effective inputs (see
+:func:`prompt_automation.placeholder_fastpath.evaluate_fastpath_state`)
+render to the same text until one of their inputs changes, yet every launch
+ran the whole pipeline again. :func:`memo_key` derives a key from
+everything such a render depends on:
+
+- the template content (a hash of the dict, which changes whenever the
+  template file does),
+- ``globals.json``, ``Settings/settings.json`` and the overrides file
+  (``placeholder-overrides.json``) by mtime and size,
+- the global reference file path and stat when the template refers to it,
+- the ``PROMPT_AUTOMATION_*`` environment.
+
+Each result is kept in its own file under ``HOME_DIR/render-cache/`` so the
+next process can reuse it; a lookup reads just that entry. Writes prune the
+least recently used entries beyond ``MAX_ENTRIES`` or ``MAX_TOTAL_BYTES``
+(texts longer than ``MAX_TEXT_CHARS`` are not stored). Only
+renders without caller values are memoized, and with ``values=None`` only
+templates whose placeholder list is empty (other specs may still prompt).
+``PROMPT_AUTOMATION_RENDER_MEMO=0`` disables the memo.
+
+The single-window GUI fast path does not use the memo: it only runs
+``fill_placeholders`` over the raw lines with no variables, which costs
+less than computing a key.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import HOME_DIR
+from ..errorlog import get_logger
+from ..placeholder_fastpath import FastPathState, evaluate_fastpath_state
+
+_log = get_logger(__name__)
+
+ENV_VAR = "PROMPT_AUTOMATION_RENDER_MEMO"
+CACHE_DIR = HOME_DIR / "render-cache"
+SCHEMA_VERSION = 1
+MAX_ENTRIES = 64
+MAX_TEXT_CHARS = 512 * 1024
+MAX_TOTAL_BYTES = 4 * 1024 * 1024
+_RECENT_MAX = 16
+
+_lock = threading.Lock()
+# Entries already read or written by this process (keys are content
+# derived, so an entry never changes under its key).
+_recent: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_VAR, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _sig(path: Any) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def memo_key(tmpl: Dict[str, Any], values: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Key for a memoizable render of ``tmpl`` or ``None`` when it is not."""
+    if values or not is_enabled() or not isinstance(tmpl, dict):
+        return None
+    placeholders = tmpl.get("placeholders")
+    if values is None and isinstance(placeholders, list) and placeholders:
+        return None
+    if not isinstance(tmpl.get("template"), list):
+        return None
+    try:
+        if evaluate_fastpath_state(tmpl) != FastPathState.EMPTY:
+            return None
+        body = json.dumps(tmpl, sort_keys=True, ensure_ascii=False, default=str)
+    except Exception:
+        return None
+    from . import PROMPTS_DIR, get_global_reference_file
+    from ..variables.storage import _PERSIST_FILE
+
+    parts: Dict[str, Any] = {
+        "template": hashlib.sha256(body.encode("utf-8")).hexdigest(),
+        "prompts_dir": str(PROMPTS_DIR),
+        "globals": _sig(PROMPTS_DIR / "globals.json"),
+        "settings": _sig(PROMPTS_DIR / "Settings" / "settings.json"),
+        "overrides": _sig(_PERSIST_FILE),
+        "env": sorted((k, v) for k, v in os.environ.items() if k.startswith("PROMPT_AUTOMATION_")),
+        "prompted": values is None,
+    }
+    if "reference_file" in body:
+        ref = get_global_reference_file()
+        parts["reference"] = [ref, _sig(ref) if ref else None]
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return Path(CACHE_DIR) / f"{key}.json"
+
+
+def lookup(key: str) -> Optional[Dict[str, Any]]:
+    """Entry stored for ``key`` (reads only that entry's file)."""
+    with _lock:
+        entry = _recent.get(key)
+        if entry is not None:
+            _recent.move_to_end(key)
+            return entry
+    path = _entry_path(key)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        _log.warning("render memo unreadable %s: %s", path, e)
+        return None
+    if not isinstance(data, dict) or data.get("schema_version") != SCHEMA_VERSION:
+        return None
+    if not isinstance(data.get("text"), str):
+        return None
+    try:
+        os.utime(path)  # mtime doubles as last use for pruning
+    except OSError:
+        pass
+    _remember(key, data)
+    return data
+
+
+def _remember(key: str, entry: Dict[str, Any]) -> None:
+    with _lock:
+        _recent[key] = entry
+        _recent.move_to_end(key)
+        while len(_recent) > _RECENT_MAX:
+            _recent.popitem(last=False)
+
+
+def _prune(directory: Path) -> None:
+    """Drop least recently used entries beyond ``MAX_ENTRIES``/``MAX_TOTAL_BYTES``."""
+    try:
+        files = []
+        for e in os.scandir(directory):
+            if e.name.endswith(".json") and e.is_file():
+                st = e.stat()
+                files.append((st.st_mtime_ns, st.st_size, e.path))
+    except OSError:
+        return
+    files.sort(reverse=True)
+    total = 0
+    for count, (_mtime, size, path) in enumerate(files, 1):
+        total += size
+        if count > MAX_ENTRIES or total > MAX_TOTAL_BYTES:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def store(key: str, text: str, vars: Optional[Dict[str, Any]], globals_map: Any) -> None:
+    if len(text) > MAX_TEXT_CHARS:
+        return
+    entry = {
+        "schema_version": SCHEMA_VERSION,
+        "text": text,
+        "vars": vars,
+        "globals": globals_map,
+    }
+    try:
+        payload = json.dumps(entry, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return
+    path = _entry_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp.write_text(payload, encoding="utf-8")
+        tmp.replace(path)
+    except Exception as e:
+        _log.error("render memo flush failed: %s", e)
+        return
+    _remember(key, entry)
+    _prune(path.parent)
+
+
+def clear() -> None:
+    with _lock:
+        _recent.clear()
+    try:
+        for e in os.scandir(CACHE_DIR):
+            if e.name.endswith((".json", ".tmp")):
+                os.unlink(e.path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        _log.error("render memo clear failed: %s", e)
+
+
+__all__ = ["CACHE_DIR", "ENV_VAR", "clear", "is_enabled", "lookup", "memo_key", "store"]
@@ -1,8 +1,96 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Sequence
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence, Tuple
 
-from ...renderer import read_file_safe
+from ... import render_stats
+from ...errorlog import get_logger
+from ...file_reader import FILE_WINDOWS, read_file_safe, read_file_window
+
+_log = get_logger(__name__)
+
+_LIMIT_KEYS = ("max_bytes", "max_lines", "max_chars")
+
+READ_WORKERS = 8
+"""Upper bound on files read concurrently by :func:`load_files`."""
+
+FileRequest = Tuple[str, Dict[str, Any]]
+
+
+def _file_limits(ph: Dict[str, Any]) -> Dict[str, Any]:
+    """Size/window options declared on a file placeholder (empty if none).
+
+    ``max_bytes`` / ``max_lines`` / ``max_chars`` cap what is injected;
+    ``window`` picks ``head`` (default), ``tail`` or ``both`` ends and
+    ``truncation_marker`` replaces the default marker line.
+    """
+    limits: Dict[str, Any] = {}
+    for key in _LIMIT_KEYS:
+        try:
+            value = int(ph.get(key) or 0)
+        except (TypeError, ValueError):
+            value = 0
+        if value > 0:
+            limits[key] = value
+    if limits:
+        window = ph.get("window")
+        limits["window"] = window if window in FILE_WINDOWS else "head"
+        if isinstance(ph.get("truncation_marker"), str):
+            limits["marker"] = ph["truncation_marker"]
+    return limits
+
+
+def _timed_read(path: str, limits: Dict[str, Any]) -> Tuple[str, float]:
+    start = time.perf_counter()
+    content = read_file_window(path, **limits) if limits else read_file_safe(path)
+    return content, (time.perf_counter() - start) * 1000.0
+
+
+def load_files(requests: Sequence[FileRequest]) -> List[str]:
+    """Read ``(path, limits)`` requests, concurrently when there are several.
+
+    Identical requests are read once. Files on network shares or WSL-mounted
+    Windows drives (``/mnt/c``) pay a round trip per open/stat/read, so
+    overlapping them keeps a template with several file placeholders close
+    to the cost of its slowest file. Per-file timings are logged as one
+    ``file_placeholders.load`` event; contents are returned in request order.
+    """
+    unique: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], int] = {}
+    jobs: List[FileRequest] = []
+    order: List[int] = []
+    for path, limits in requests:
+        key = (path, tuple(sorted(limits.items())))
+        if key not in unique:
+            unique[key] = len(jobs)
+            jobs.append((path, limits))
+        order.append(unique[key])
+    if not jobs:
+        return []
+    start = time.perf_counter()
+    workers = max(1, min(READ_WORKERS, len(jobs)))
+    if workers == 1:
+        results = [_timed_read(path, limits) for path, limits in jobs]
+    else:
+        read = render_stats.bind(_timed_read)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-placeholder") as pool:
+            results = list(pool.map(lambda job: read(*job), jobs))
+    try:
+        _log.debug(
+            "%s",
+            {
+                "event": "file_placeholders.load",
+                "workers": workers,
+                "duration_ms": round((time.perf_counter() - start) * 1000.0, 2),
+                "files": [
+                    {"path": path, "chars": len(content), "duration_ms": round(ms, 2)}
+                    for (path, _limits), (content, ms) in zip(jobs, results)
+                ],
+            },
+        )
+    except Exception:
+        pass
+    return [results[i][0] for i in order]
 
 
 def apply_file_placeholders(
@@ -25,6 +113,7 @@ def apply_file_placeholders(
         ph.get("name") == "reference_file" for ph in placeholders
     )
 
+    entries: List[Tuple[str, Any, Dict[str, Any]]] = []
     for ph in placeholders:
         if ph.get("type") != "file":
             continue
@@ -35,32 +124,43 @@ def apply_file_placeholders(
         if name == "reference_file" and (not path) and ref_path_global:
             path = ref_path_global
             raw_vars[name] = path
-        content = read_file_safe(path) if path else ""
+        entries.append((name, path, _file_limits(ph)))
+
+    needs_ref = bool(
+        not declared_reference_placeholder
+        and ref_path_global
+        and (
+            "{{reference_file}}" in tmpl_text_all
+            or "{{reference_file_content}}" in tmpl_text_all
+        )
+    )
+    requests: List[FileRequest] = [(str(path), limits) for _name, path, limits in entries if path]
+    if needs_ref:
+        requests.append((str(ref_path_global), {}))
+    contents = iter(load_files(requests))
+
+    for name, path, _limits in entries:
+        content = next(contents) if path else ""
         vars[name] = content
         if f"{{{{{name}_path}}}}" in tmpl_text_all:
             vars[f"{name}_path"] = path or ""
         if name == "reference_file":
             vars["reference_file_content"] = content
 
-    if not declared_reference_placeholder and ref_path_global:
+    if needs_ref:
         try:
-            needs_ref = (
-                "{{reference_file}}" in tmpl_text_all
-                or "{{reference_file_content}}" in tmpl_text_all
-            )
-            if needs_ref:
-                content = read_file_safe(ref_path_global)
-                if "{{reference_file}}" in tmpl_text_all and "reference_file" not in vars:
-                    vars["reference_file"] = content
-                if (
-                    "reference_file_content" not in vars
-                    and "{{reference_file_content}}" in tmpl_text_all
-                ):
-                    vars["reference_file_content"] = content
-                if (
-                    "{{reference_file_path}}" in tmpl_text_all
-                    and "reference_file_path" not in vars
-                ):
-                    vars["reference_file_path"] = ref_path_global
+            content = next(contents)
+            if "{{reference_file}}" in tmpl_text_all and "reference_file" not in vars:
+                vars["reference_file"] = content
+            if (
+                "reference_file_content" not in vars
+                and "{{reference_file_content}}" in tmpl_text_all
+            ):
+                vars["reference_file_content"] = content
+            if (
+                "{{reference_file_path}}" in tmpl_text_all
+                and "reference_file_path" not in vars
+            ):
+                vars["reference_file_path"] = ref_path_global
         except Exception:
             pass
@@ -2,8 +2,22 @@ from __future__ import annotations
 
 import html
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Sequence
+from typing import Any, Dict, Sequence, Tuple
+
+from ... import render_stats
+
+# Converted HTML keyed by the markdown source itself: the str hash is cached
+# on the object, so re-rendering the same (file-cached) reference is a dict
+# hit. Bounded by entry count and total characters of source + HTML.
+_HTML_CACHE_MAX_ENTRIES = 32
+_HTML_CACHE_MAX_CHARS = 32 * 1024 * 1024
+_html_cache: "OrderedDict[str, str]" = OrderedDict()
+_html_cache_chars = 0
+_html_cache_lock = threading.Lock()
 
 
 def _escape(s: str) -> str:
@@ -11,6 +25,40 @@ def _escape(s: str) -> str:
 
 
 def _md_to_html(text: str) -> str:
+    """Cached :func:`_convert_md`; see the ``_HTML_CACHE_*`` bounds."""
+    global _html_cache_chars
+    with _html_cache_lock:
+        hit = _html_cache.get(text)
+        if hit is not None:
+            _html_cache.move_to_end(text)
+    if hit is not None:
+        render_stats.cache_hit()
+        return hit
+    render_stats.cache_miss()
+    out = _convert_md(text)
+    size = len(text) + len(out)
+    if size <= _HTML_CACHE_MAX_CHARS:
+        with _html_cache_lock:
+            if text not in _html_cache:
+                _html_cache[text] = out
+                _html_cache_chars += size
+            while _html_cache and (
+                len(_html_cache) > _HTML_CACHE_MAX_ENTRIES or _html_cache_chars > _HTML_CACHE_MAX_CHARS
+            ):
+                old_src, old_html = _html_cache.popitem(last=False)
+                _html_cache_chars -= len(old_src) + len(old_html)
+    return out
+
+
+def clear_html_cache() -> None:
+    """Drop all memoized markdown conversions."""
+    global _html_cache_chars
+    with _html_cache_lock:
+        _html_cache.clear()
+        _html_cache_chars = 0
+
+
+def _convert_md(text: str) -> str:
     """Very small markdown-to-HTML converter (headings, code, bold).
 
     Avoid external deps; sufficient for reference file previews. Sanitizes by
@@ -48,6 +96,28 @@ def _md_to_html(text: str) -> str:
     return "\n".join(l for l in out_lines if l is not None)
 
 
+@lru_cache(maxsize=256)
+def _occurrences(lines: Tuple[str, ...], names: Tuple[str, ...]) -> Tuple[int, Dict[str, int]]:
+    """Last non-empty line index and first line index of each ``{{name}}``.
+
+    Memoized per (template lines, markdown placeholder names) so repeated
+    renders of a template skip the lines x placeholders scan.
+    """
+    last_idx = -1
+    for i in range(len(lines) - 1, -1, -1):
+        if lines[i].strip():
+            last_idx = i
+            break
+    occ: Dict[str, int] = {}
+    for nm in names:
+        tok = f"{{{{{nm}}}}}"
+        for i, ln in enumerate(lines):
+            if tok in ln:
+                occ[nm] = i
+                break
+    return last_idx, occ
+
+
 def apply_markdown_rendering(
     tmpl: Dict[str, Any],
     vars: Dict[str, Any],
@@ -68,24 +138,12 @@ def apply_markdown_rendering(
     lines = tmpl.get("template", []) or []
     if not isinstance(lines, list):
         return
-    # Compute last non-empty line index
-    last_idx = -1
-    for i in range(len(lines) - 1, -1, -1):
-        if str(lines[i]).strip():
-            last_idx = i
-            break
-    if last_idx < 0:
+    names = tuple(
+        ph["name"] for ph in placeholders if ph.get("name") and ph.get("render") == "markdown"
+    )
+    if not names:
         return
-    # Map name -> index of first occurrence
-    occ: dict[str, int] = {}
-    for i, ln in enumerate(lines):
-        for ph in placeholders:
-            nm = ph.get("name")
-            if not nm or ph.get("render") != "markdown":
-                continue
-            tok = f"{{{{{nm}}}}}"
-            if tok in str(ln) and nm not in occ:
-                occ[nm] = i
+    last_idx, occ = _occurrences(tuple(str(ln) for ln in lines), names)
     for ph in placeholders:
         nm = ph.get("name")
         if not nm or ph.get("render") != "markdown":
@@ -3,11 +3,93 @@ from __future__ import annotations
 import json
 import os
 import re
-from typing import Any, Dict, Sequence, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Pattern, Sequence, Set, Tuple
 
 from ...config import PROMPTS_DIR
 
 
+def _empty_phrases(placeholders: Sequence[Dict[str, Any]], vars: Dict[str, Any]) -> Tuple[str, ...]:
+    """``remove_if_empty`` phrases of the placeholders whose value is blank."""
+    out: List[str] = []
+    for ph in placeholders:
+        name = ph.get("name")
+        if not name:
+            continue
+        val = vars.get(name)
+        if val is not None and str(val).strip():
+            continue
+        phrases = ph.get("remove_if_empty") or ph.get("remove_if_empty_phrases")
+        if not phrases:
+            continue
+        if isinstance(phrases, str):
+            phrases = [phrases]
+        for phrase in phrases:
+            if isinstance(phrase, str) and phrase.strip():
+                out.append(phrase.strip())
+    return tuple(out)
+
+
+def _keep_space(m: "re.Match[str]") -> str:
+    return m.group(1) if m.group(1).isspace() else ""
+
+
+_PUNCTUATION = ".,;:!?"
+
+
+@lru_cache(maxsize=256)
+def _phrase_rules(phrases: Tuple[str, ...]) -> Tuple[Pattern[str], Tuple[Pattern[str], ...], bool]:
+    """Compiled removal rules for a tuple of ``remove_if_empty`` phrases.
+
+    Returns the combined single-pass pattern, the per-phrase rule pairs
+    (phrase before punctuation, phrase plus trailing whitespace) applied in
+    order, and whether only the ordered rules give the documented result:
+    when a phrase contains another one, contains whitespace (removing an
+    earlier phrase can join the words of a later one), or contains
+    punctuation the "before punctuation" rule looks ahead for (removing it
+    can make a neighbour match that a single pass has already skipped).
+    """
+    alts = "|".join(rf"{re.escape(p)}(?:(?=\s*[.,;:!?])|\s+)" for p in phrases)
+    combined = re.compile(rf"(?:^|(?<=\s))(?:{alts})", re.IGNORECASE)
+    ordered = []
+    for p in phrases:
+        ordered.append(re.compile(rf"(\s|^){re.escape(p)}(?=\s*[.,;:!?])", re.IGNORECASE))
+        ordered.append(re.compile(rf"(\s|^){re.escape(p)}\s+", re.IGNORECASE))
+    folded = [p.casefold() for p in phrases]
+    ordered_only = any(a in b for i, a in enumerate(folded) for j, b in enumerate(folded) if i != j)
+    ordered_only = ordered_only or any(c in p for p in phrases for c in _PUNCTUATION)
+    ordered_only = ordered_only or any(re.search(r"\s", p) for p in phrases)
+    return combined, tuple(ordered), ordered_only
+
+
+def _remove_phrases(rendered: str, phrases: Tuple[str, ...]) -> str:
+    """Remove ``phrases`` from ``rendered``, normally in a single pass.
+
+    The combined pattern gives the same result as the ordered rules as long
+    as matches are separated by something other than whitespace; removing
+    one phrase can otherwise change whether its neighbour matches, so those
+    (rare) texts, and phrase lists flagged by :func:`_phrase_rules`, use the
+    ordered rules.
+    """
+    combined, ordered, ordered_only = _phrase_rules(phrases)
+    if not ordered_only:
+        pieces = []
+        pos = 0
+        for m in combined.finditer(rendered):
+            if pieces and not rendered[pos:m.start()].strip():
+                break
+            pieces.append(rendered[pos:m.start()])
+            pos = m.end()
+        else:
+            if not pieces:
+                return rendered
+            pieces.append(rendered[pos:])
+            return "".join(pieces)
+    for pattern in ordered:
+        rendered = pattern.sub(_keep_space, rendered)
+    return rendered
+
+
 def apply_post_render(
     rendered: str,
     tmpl: Dict[str, Any],
@@ -21,37 +103,9 @@ def apply_post_render(
     """
 
     try:
-        for ph in placeholders:
-            name = ph.get("name")
-            if not name:
-                continue
-            val = vars.get(name)
-            if val is not None and str(val).strip():
-                continue
-            phrases = ph.get("remove_if_empty") or ph.get("remove_if_empty_phrases")
-            if not phrases:
-                continue
-            if isinstance(phrases, str):
-                phrases = [phrases]
-            for phrase in phrases:
-                if not isinstance(phrase, str) or not phrase.strip():
-                    continue
-                pattern = re.compile(
-                    rf"(\s|^){re.escape(phrase.strip())}(?=\s*[.,;:!?])",
-                    re.IGNORECASE,
-                )
-                rendered = pattern.sub(
-                    lambda m: m.group(1) if m.group(1).isspace() else "",
-                    rendered,
-                )
-                pattern2 = re.compile(
-                    rf"(\s|^){re.escape(phrase.strip())}\s+",
-                    re.IGNORECASE,
-                )
-                rendered = pattern2.sub(
-                    lambda m: m.group(1) if m.group(1).isspace() else "",
-                    rendered,
-                )
+        phrases = _empty_phrases(placeholders, vars)
+        if phrases:
+            rendered = _remove_phrases(rendered, phrases)
 
         meta = tmpl.get("metadata", {}) if isinstance(tmpl.get("metadata"), dict) else {}
         trim_blanks_flag = meta.get("trim_blanks")
@@ -1,12 +1,14 @@
 import re
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
-try:
-    import dateparser
-except Exception:
-    dateparser = None
+# ``dateparser`` is slow to import (large regex/locale tables) and only needed
+# for due strings the native parser below does not understand, so it is
+# resolved on first use by ``_dateparser()``.
+dateparser: Any = None
+_DATEPARSER_TRIED = False
 
 
 PRIORITY_KEYWORDS = {
@@ -79,11 +81,131 @@ def _ensure_leading_verb(title: str, default_verb: str = "Draft") -> str:
     return f"{default_verb} {stripped}"
 
 
+def _dateparser() -> Any:
+    global dateparser, _DATEPARSER_TRIED
+    if dateparser is None and not _DATEPARSER_TRIED:
+        _DATEPARSER_TRIED = True
+        try:
+            import dateparser as _mod
+
+            dateparser = _mod
+        except Exception:
+            dateparser = None
+    return dateparser
+
+
+@lru_cache(maxsize=32)
+def _zone(name: Optional[str]) -> Optional[ZoneInfo]:
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+def _now(settings_tz: Optional[str]) -> datetime:
+    tz = _zone(settings_tz)
+    return datetime.now(tz) if tz is not None else datetime.now()
+
+
+_WEEKDAYS = {
+    "monday": 0, "mon": 0,
+    "tuesday": 1, "tue": 1, "tues": 1,
+    "wednesday": 2, "wed": 2,
+    "thursday": 3, "thu": 3, "thur": 3, "thurs": 3,
+    "friday": 4, "fri": 4,
+    "saturday": 5, "sat": 5,
+    "sunday": 6, "sun": 6,
+}
+
+RE_DUE_DAY = re.compile(
+    r"^(?:(?P<rel>today|tonight|tomorrow|tmrw|end of (?:the )?week|eow)"
+    r"|(?:(?P<next>next|this)\s+)?(?P<wd>[a-z]+)"
+    r"|(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2}))(?=$|[\s,t@])"
+)
+RE_DUE_TIME = re.compile(r"^(?:(?P<h>\d{1,2})(?::(?P<min>\d{2}))?\s*(?P<ap>am|pm)?|(?P<noon>noon|midnight))$")
+
+
+def _native_due(raw: str, now: datetime) -> Optional[datetime]:
+    """Resolve common due forms without ``dateparser``; ``None`` if unsure."""
+    parts = _native_due_parts(raw, now)
+    return parts[0] if parts else None
+
+
+def _native_due_parts(raw: str, now: datetime) -> Optional[Tuple[datetime, bool]]:
+    """Return ``(due, day_only)`` for common due forms; ``None`` if unsure.
+
+    Handles ``today``/``tonight``/``tomorrow``, ``end of week`` (Friday, or
+    Sunday once the work week is over), weekday names with optional
+    ``next``/``this``, ISO ``YYYY-MM-DD`` dates and a trailing time such as
+    ``4pm``, ``9:30 am`` or ``16:00`` (optionally after ``at``/``@``). Dates
+    prefer the future like the ``dateparser`` settings used for the rest.
+    """
+    text = " ".join(raw.lower().replace(",", " ").split())
+    today = now.date()
+    day: Optional[date] = None
+    m = RE_DUE_DAY.match(text)
+    if m:
+        rel, wd = m.group("rel"), m.group("wd")
+        if rel:
+            if rel in ("today", "tonight"):
+                day = today
+            elif rel in ("tomorrow", "tmrw"):
+                day = today + timedelta(days=1)
+            else:
+                wk = today.weekday()
+                day = today + timedelta(days=(4 - wk) if wk <= 4 else (6 - wk))
+        elif wd is not None:
+            if wd not in _WEEKDAYS:
+                m = None
+            else:
+                ahead = (_WEEKDAYS[wd] - today.weekday()) % 7
+                if ahead == 0 and m.group("next"):
+                    ahead = 7
+                day = today + timedelta(days=ahead)
+        else:
+            try:
+                day = date(int(m.group("y")), int(m.group("m")), int(m.group("d")))
+            except ValueError:
+                return None
+    rest = text[m.end():] if m else text
+    rest = rest.lstrip("t ").strip() if m and m.group("y") else rest.strip()
+    for prefix in ("at ", "@"):
+        if rest.startswith(prefix):
+            rest = rest[len(prefix):].strip()
+    if not rest:
+        return (datetime.combine(day, time(), tzinfo=now.tzinfo), True) if day is not None else None
+    t = RE_DUE_TIME.match(rest)
+    if not t:
+        return None
+    if t.group("noon"):
+        hour, minute = (12 if t.group("noon") == "noon" else 0), 0
+    else:
+        hour, minute, ap = int(t.group("h")), int(t.group("min") or 0), t.group("ap")
+        if ap:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if ap == "pm" else 0)
+        elif t.group("min") is None and day is None:
+            return None  # a bare number ("5") is too ambiguous
+        if hour > 23 or minute > 59:
+            return None
+    at = time(hour, minute)
+    if day is None:
+        day = today if at > now.time().replace(tzinfo=None) else today + timedelta(days=1)
+    return datetime.combine(day, at, tzinfo=now.tzinfo), False
+
+
 def _resolve_due(due_str: Optional[str], settings_tz: Optional[str] = None) -> Optional[str]:
     if not due_str:
         return None
     raw = due_str.strip()
-    if dateparser is None:
+    now = _now(settings_tz)
+    parts = _native_due_parts(raw, now)
+    if parts is not None:
+        return _format_due(raw, parts[0], now, day_only=parts[1])
+    if _dateparser() is None:
         return raw
 
     settings = {"PREFER_DATES_FROM": "future", "RETURN_AS_TIMEZONE_AWARE": True}
@@ -111,6 +233,10 @@ def _resolve_due(due_str: Optional[str], settings_tz: Optional[str] = None) -> O
         pass
 
     now = datetime.now(dt.tzinfo) if dt.tzinfo is not None else datetime.now()
+    return _format_due(raw, dt, now)
+
+
+def _format_due(raw: str, dt: datetime, now: datetime, day_only: bool = False) -> str:
     date_only = dt.date()
     today = now.date()
 
@@ -135,12 +261,21 @@ def _resolve_due(due_str: Optional[str], settings_tz: Optional[str] = None) -> O
         return f"{weekday} {time_part}" if dt.time() != datetime.min.time() else weekday
 
     # Otherwise show month day and time (e.g., Sep 2 9:00 AM)
+    if day_only:
+        return dt.strftime("%b %d").replace(" 0", " ")
     return dt.strftime("%b %d %I:%M %p").replace(" 0", " ")
 
 
 def parse_capture(capture: str, timezone: Optional[str] = None) -> Dict[str, Optional[str]]:
     """Parse a single-line capture per the JSON logic and return structured outputs.
 
+    Results are memoized per (capture, timezone, current day), so the early
+    and late parses in ``menus.render_template`` and repeated previews of the
+    same capture only resolve the due date once; a fresh dict is returned on
+    every call. Captures with a ``due:`` clause are keyed on the current
+    minute instead, since times such as ``4pm`` or ``in 2 hours`` resolve
+    relative to now.
+
     Spec (current):
     - Defaults: priority p3, no due.
     - Inference: keyword -> p1/p2.
@@ -149,6 +284,15 @@ def parse_capture(capture: str, timezone: Optional[str] = None) -> Dict[str, Opt
     - Always show priority bracket (including default p3) for consistency.
     Returns dict with keys: title, priority, due_display, acceptance_final, raw_due.
     """
+    now = _now(timezone)
+    stamp = now.replace(second=0, microsecond=0, tzinfo=None) if "due:" in capture.lower() else now.date()
+    return dict(_parse_capture_cached(capture, timezone, stamp))
+
+
+@lru_cache(maxsize=256)
+def _parse_capture_cached(
+    capture: str, timezone: Optional[str], stamp: date
+) -> Tuple[Tuple[str, Optional[str]], ...]:
     m = RE_CAPTURE.match(capture.strip())
     outcome = capture.strip()
     priority = None
@@ -200,10 +344,10 @@ def parse_capture(capture: str, timezone: Optional[str] = None) -> Dict[str, Opt
     else:
         acceptance_final = ""  # omit acceptance section when not specified
 
-    return {
-        "title": title,
-        "priority": priority,
-        "due_display": due_display,
-        "acceptance_final": acceptance_final,
-        "raw_due": due,
-    }
+    return (
+        ("title", title),
+        ("priority", priority),
+        ("due_display", due_display),
+        ("acceptance_final", acceptance_final),
+        ("raw_due", due),
+    )
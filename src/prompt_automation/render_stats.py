@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+"""Per-stage timing spans for the ``menus.render_template`` pipeline.
+
+Disabled by default; enable with ``--render-stats`` or the environment
+variable ``PROMPT_AUTOMATION_RENDER_STATS``:
+
+  - ``1`` / ``true`` / ``stderr`` – print one JSON object per render to stderr
+  - any other value              – treated as a file path; one JSON object
+    per render is appended (JSON lines)
+
+Each render produces a ``render.stats`` report with the template id, total
+duration and one entry per stage (``globals``, ``get_variables``,
+``context_file``, ``apply_file_placeholders``, ``apply_defaults``,
+``apply_global_placeholders``, ``apply_formatting``,
+``apply_markdown_rendering``, ``fill_placeholders``, ``apply_post_render``)
+carrying ``duration_ms``, UTF-8 ``bytes_in``/``bytes_out`` of the values the
+stage worked on, and ``cache_hits``/``cache_misses`` reported by caches used
+inside the stage via :func:`cache_hit` / :func:`cache_miss`. Reports are also
+logged as structured INFO events and the last few are kept in memory
+(:func:`recent`).
+
+When disabled, :func:`collect` and :func:`span` do no measuring; the pipeline
+pays one environment lookup per render.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from .errorlog import get_logger
+
+ENV_VAR = "PROMPT_AUTOMATION_RENDER_STATS"
+_STDERR_VALUES = {"1", "true", "yes", "on", "stderr", "-"}
+_OFF_VALUES = {"", "0", "false", "no", "off"}
+
+_log = get_logger(__name__)
+_local = threading.local()
+_RECENT: Deque[Dict[str, Any]] = deque(maxlen=50)
+_RECENT_LOCK = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_VAR, "").strip().lower() not in _OFF_VALUES
+
+
+def _size(obj: Any) -> int:
+    """UTF-8 size of the text carried by ``obj`` (str, list or vars dict)."""
+    if isinstance(obj, str):
+        return len(obj.encode("utf-8", "replace"))
+    if isinstance(obj, dict):
+        return sum(_size(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(_size(v) for v in obj)
+    return 0
+
+
+class Span:
+    """One pipeline stage; ``output()`` overrides the measured result."""
+
+    __slots__ = ("name", "duration_ms", "bytes_in", "bytes_out", "cache_hits", "cache_misses", "_out")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.duration_ms = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._out: Any = None
+
+    def output(self, value: Any) -> None:
+        self._out = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "duration_ms": self.duration_ms,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+
+class _NullSpan:
+    def output(self, value: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class RenderStats:
+    """Spans recorded for a single render."""
+
+    def __init__(self, template_id: Any = None) -> None:
+        self.template_id = template_id
+        self.spans: List[Span] = []
+        self._active: Optional[Span] = None
+        self._t0 = time.perf_counter()
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, data: Any = None) -> Iterator[Span]:
+        sp = Span(name)
+        sp.bytes_in = _size(data)
+        parent = self._active
+        self._active = sp
+        start = time.perf_counter()
+        try:
+            yield sp
+        finally:
+            sp.duration_ms = round((time.perf_counter() - start) * 1000.0, 3)
+            sp.bytes_out = _size(sp._out if sp._out is not None else data)
+            sp._out = None
+            self._active = parent
+            self.spans.append(sp)
+
+    def record_cache(self, hit: bool) -> None:
+        sp = self._active
+        if sp is None:
+            return
+        with self._lock:
+            if hit:
+                sp.cache_hits += 1
+            else:
+                sp.cache_misses += 1
+
+    def report(self) -> Dict[str, Any]:
+        stages = [s.to_dict() for s in self.spans]
+        return {
+            "event": "render.stats",
+            "template_id": self.template_id,
+            "total_ms": self.total_ms,
+            "stages": stages,
+            "cache_hits": sum(s["cache_hits"] for s in stages),
+            "cache_misses": sum(s["cache_misses"] for s in stages),
+        }
+
+
+def _current() -> Optional[RenderStats]:
+    return getattr(_local, "current", None)
+
+
+def _emit(report: Dict[str, Any]) -> None:
+    with _RECENT_LOCK:
+        _RECENT.append(report)
+    try:
+        _log.info("%s", report)
+    except Exception:
+        pass
+    target = os.environ.get(ENV_VAR, "").strip()
+    line = json.dumps(report, sort_keys=True, default=str)
+    try:
+        if target.lower() in _STDERR_VALUES:
+            print(line, file=sys.stderr)
+        else:
+            path = Path(target).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+    except Exception:
+        pass
+
+
+@contextmanager
+def collect(template_id: Any = None) -> Iterator[Optional[RenderStats]]:
+    """Record spans for one render on this thread and emit the report."""
+    if not is_enabled():
+        yield None
+        return
+    stats = RenderStats(template_id)
+    parent = _current()
+    _local.current = stats
+    try:
+        yield stats
+    finally:
+        _local.current = parent
+        stats.total_ms = round((time.perf_counter() - stats._t0) * 1000.0, 3)
+        _emit(stats.report())
+
+
+@contextmanager
+def span(name: str, data: Any = None) -> Iterator[Any]:
+    """Time stage ``name`` of the active render (no-op outside :func:`collect`).
+
+    ``data`` is measured on entry (``bytes_in``) and again on exit
+    (``bytes_out``) unless the stage reports its result via ``output()``.
+    """
+    stats = _current()
+    if stats is None:
+        yield _NULL_SPAN
+        return
+    with stats.span(name, data) as sp:
+        yield sp
+
+
+def cache_hit() -> None:
+    stats = _current()
+    if stats is not None:
+        stats.record_cache(True)
+
+
+def cache_miss() -> None:
+    stats = _current()
+    if stats is not None:
+        stats.record_cache(False)
+
+
+def bind(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap ``fn`` so cache hits/misses it records on a worker thread count
+    towards the render active on the calling thread."""
+    stats = _current()
+    if stats is None:
+        return fn
+
+    def _bound(*args: Any, **kwargs: Any) -> Any:
+        parent = _current()
+        _local.current = stats
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.current = parent
+
+    return _bound
+
+
+def recent() -> List[Dict[str, Any]]:
+    """Reports of the most recent renders in this process (oldest first)."""
+    with _RECENT_LOCK:
+        return list(_RECENT)
+
+
+__all__ = [
+    "ENV_VAR",
+    "RenderStats",
+    "Span",
+    "bind",
+    "cache_hit",
+    "cache_miss",
+    "collect",
+    "is_enabled",
+    "recent",
+    "span",
+]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+"""Batch rendering of JSON-lines request files across worker processes.
+
+Each non-blank input line is a render request in the
+:mod:`prompt_automation.services.render_service` format
+(``{"template": <id|path>, "values": {...}, "id": <any>}``). Lines are
+shipped to a :class:`concurrent.futures.ProcessPoolExecutor` as raw bytes;
+every worker keeps its own warm :class:`RenderService` so template parsing
+happens once per process. Replies are streamed as JSON lines in input order
+while later requests are still rendering; at most ``workers * window``
+requests are in flight so arbitrarily large inputs run in bounded memory.
+"""
+
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import IO, Deque, Iterable, Iterator, Optional
+
+from ..errorlog import get_logger
+
+_log = get_logger(__name__)
+
+
+def render_line(line: bytes) -> bytes:
+    """Render one request line in the current process; returns the reply frame."""
+    from ..ipc import dispatch
+    from .render_service import get_render_service
+
+    return dispatch(line, get_render_service().handlers(), default_cmd="RENDER")
+
+
+def _iter_requests(src: Iterable[bytes]) -> Iterator[bytes]:
+    for line in src:
+        if line.strip():
+            yield line
+
+
+def iter_batch(
+    src: Iterable[bytes],
+    workers: Optional[int] = None,
+    *,
+    window: int = 8,
+    executor: Executor | None = None,
+) -> Iterator[bytes]:
+    """Yield reply frames for each request in ``src`` preserving input order.
+
+    ``workers <= 1`` renders in-process (no pool start-up cost), which is
+    also the path used for tiny batches and tests.
+    """
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    requests = _iter_requests(src)
+    if executor is None and workers <= 1:
+        for line in requests:
+            yield render_line(line)
+        return
+    own = executor is None
+    # Spawned (not forked) workers: the CLI may already run helper threads
+    # and this matches the Windows/macOS behaviour exactly.
+    pool = executor or ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    pending: Deque[Future] = deque()
+    limit = max(1, workers) * max(1, window)
+    try:
+        for line in requests:
+            pending.append(pool.submit(render_line, line))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for fut in pending:
+            fut.cancel()
+        if own:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def run_batch(
+    src: Iterable[bytes],
+    out: IO[bytes],
+    workers: Optional[int] = None,
+) -> tuple[int, int]:
+    """Stream replies for ``src`` into ``out``; returns ``(total, failed)``."""
+    total = failed = 0
+    for frame in iter_batch(src, workers):
+        out.write(frame)
+        out.flush()
+        total += 1
+        try:
+            if not json.loads(frame).get("ok"):
+                failed += 1
+        except Exception:
+            failed += 1
+    _log.info("batch_render.complete total=%s failed=%s", total, failed)
+    return total, failed
+
+
+__all__ = ["render_line", "iter_batch", "run_batch"]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+"""Background executor for side effects that run after a prompt is finished.
+
+The review stage used to append to files, log usage, record history and run
+the Todoist post-action on the Tk thread before the window could cycle back.
+Callers now copy to the clipboard, hand the remaining work to
+:func:`submit` and return immediately.
+
+Batches run in submission order on a single non-daemon worker thread, so
+appends from consecutive finishes never interleave and pending work still
+completes when the GUI exits. Each action runs in its own daemon thread with
+a timeout; a hung action is abandoned (reported as ``timeout``) and the next
+one starts. ``on_status(name, state, detail)`` is called from the worker for
+every action with ``state`` one of ``ok``, ``failed`` (the action returned
+``(False, message)``), ``error`` (it raised) or ``timeout``.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+from ..errorlog import get_logger
+
+_log = get_logger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+
+StatusCallback = Callable[[str, str, str], None]
+
+
+@dataclass
+class PostAction:
+    """A named side effect with its own timeout in seconds."""
+
+    name: str
+    fn: Callable[[], Any]
+    timeout: float = DEFAULT_TIMEOUT
+
+
+_pending: Deque[Tuple[Sequence[PostAction], Optional[StatusCallback]]] = deque()
+_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+
+
+def _run_one(action: PostAction) -> Tuple[str, str]:
+    box: dict = {}
+
+    def _target() -> None:
+        try:
+            box["result"] = action.fn()
+        except Exception as e:
+            box["error"] = e
+
+    t = threading.Thread(target=_target, name=f"post-action-{action.name}", daemon=True)
+    t.start()
+    t.join(action.timeout)
+    if t.is_alive():
+        return "timeout", f"exceeded {action.timeout:g}s"
+    if "error" in box:
+        return "error", str(box["error"])
+    result = box.get("result")
+    if isinstance(result, tuple) and result and result[0] is False:
+        return "failed", str(result[1]) if len(result) > 1 else ""
+    return "ok", ""
+
+
+def run_post_actions(
+    actions: Sequence[PostAction], on_status: Optional[StatusCallback] = None
+) -> List[Tuple[str, str, str]]:
+    """Run ``actions`` in order on the calling thread; return ``(name, state, detail)``."""
+    results = []
+    for action in actions:
+        start = time.perf_counter()
+        state, detail = _run_one(action)
+        try:
+            _log.info(
+                "%s",
+                {
+                    "event": "post_action.done",
+                    "action": action.name,
+                    "state": state,
+                    "duration_ms": round((time.perf_counter() - start) * 1000.0, 2),
+                },
+            )
+        except Exception:
+            pass
+        if on_status is not None:
+            try:
+                on_status(action.name, state, detail)
+            except Exception:
+                pass
+        results.append((action.name, state, detail))
+    return results
+
+
+def _drain() -> None:
+    global _worker
+    while True:
+        with _lock:
+            if not _pending:
+                _worker = None
+                return
+            actions, on_status = _pending.popleft()
+        run_post_actions(actions, on_status)
+
+
+def submit(actions: Sequence[PostAction], on_status: Optional[StatusCallback] = None) -> threading.Thread:
+    """Queue ``actions`` for the background worker and return that worker."""
+    global _worker
+    with _lock:
+        _pending.append((list(actions), on_status))
+        if _worker is None:
+            _worker = threading.Thread(target=_drain, name="prompt-automation-post-actions")
+            _worker.start()
+        return _worker
+
+
+def wait(timeout: Optional[float] = None) -> bool:
+    """Block until queued actions finished; ``False`` if ``timeout`` expired."""
+    with _lock:
+        worker = _worker
+    if worker is None:
+        return True
+    worker.join(timeout)
+    return not worker.is_alive()
+
+
+__all__ = ["DEFAULT_TIMEOUT", "PostAction", "run_post_actions", "submit", "wait"]
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+"""Headless render service for scripted / batch prompt generation.
+
+Wraps :func:`prompt_automation.menus.render_template` in ``values=`` mode (no
+interactive collection) behind a long-lived object that keeps parsed
+templates and the template id -> path index warm between requests. Two
+transports speak the :mod:`prompt_automation.ipc` JSON-lines protocol, with
+``cmd`` defaulting to ``RENDER``:
+
+  * :func:`serve_stdio` – requests on stdin, replies on stdout
+  * :func:`serve_unix`  – any number of concurrent clients on a UNIX socket
+
+Request: ``{"template": <id|path>, "values": {...}, "id": <any>}``
+Reply:   ``{"ok": true, "id": <any>, "text": "..."}`` or ``{"ok": false, "error": "..."}``
+
+Cached templates are validated against ``st_mtime_ns``/``st_size`` on every
+request so edits are picked up without restarting the service.
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Optional
+
+from .. import config
+from ..errorlog import get_logger
+from ..ipc import Handler, dispatch, serve
+
+_log = get_logger(__name__)
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    data: Dict[str, Any]
+
+
+def _is_id_ref(ref: Any) -> bool:
+    if isinstance(ref, bool):
+        return False
+    return isinstance(ref, int) or (isinstance(ref, str) and ref.strip().isdigit())
+
+
+def _fresh_copy(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the parts of a cached template that ``render_template`` mutates."""
+    tmpl = dict(data)
+    gph = tmpl.get("global_placeholders")
+    if isinstance(gph, dict):
+        tmpl["global_placeholders"] = dict(gph)
+    phs = tmpl.get("placeholders")
+    if isinstance(phs, list):
+        tmpl["placeholders"] = [dict(p) if isinstance(p, dict) else p for p in phs]
+    return tmpl
+
+
+class RenderService:
+    """Render templates from caller-supplied values with warm caches."""
+
+    def __init__(self, prompts_dir: Path | None = None, *, max_templates: int = 4096) -> None:
+        self.prompts_dir = prompts_dir
+        self.max_templates = max_templates
+        self._lock = threading.Lock()
+        self._templates: "OrderedDict[Path, _Entry]" = OrderedDict()
+        self._id_index: Optional[Dict[int, Path]] = None
+        self.stats: Dict[str, int] = {
+            "renders": 0,
+            "errors": 0,
+            "template_hits": 0,
+            "template_misses": 0,
+            "index_builds": 0,
+        }
+
+    # --- template resolution -------------------------------------------------
+    def _root(self) -> Path:
+        return self.prompts_dir or config.PROMPTS_DIR
+
+    def _bump(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def stats_snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+    def _build_index(self) -> Dict[int, Path]:
+        index: Dict[int, Path] = {}
+        for p in sorted(self._root().rglob("*.json")):
+            if p.name.lower() == "settings.json":
+                continue
+            try:
+                data = json.loads(p.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+            tid = data.get("id") if isinstance(data, dict) else None
+            if isinstance(tid, int) and tid not in index:
+                index[tid] = p
+        self.stats["index_builds"] += 1
+        return index
+
+    def resolve(self, ref: Any) -> Optional[Path]:
+        """Return the template path for ``ref`` (id or path) or ``None``."""
+        if not _is_id_ref(ref):
+            if isinstance(ref, bool) or ref is None or not str(ref).strip():
+                return None
+            candidate = Path(str(ref).strip()).expanduser()
+            if not candidate.is_absolute():
+                candidate = self._root() / candidate
+            return candidate if candidate.is_file() else None
+        wanted = int(str(ref).strip())
+        with self._lock:
+            if self._id_index is None:
+                self._id_index = self._build_index()
+            path = self._id_index.get(wanted)
+            if path is None or not path.is_file():
+                # Library changed since the index was built; rescan once.
+                self._id_index = self._build_index()
+                path = self._id_index.get(wanted)
+        return path
+
+    def template(self, ref: Any) -> Dict[str, Any]:
+        """Return a render-ready copy of the template identified by ``ref``."""
+        from ..renderer import load_template
+
+        path = self.resolve(ref)
+        if path is None:
+            raise LookupError(f"template not found: {ref}")
+        st = path.stat()
+        with self._lock:
+            entry = self._templates.get(path)
+            if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                self._templates.move_to_end(path)
+                self.stats["template_hits"] += 1
+                return _fresh_copy(entry.data)
+        data = load_template(path)
+        if _is_id_ref(ref) and data.get("id") != int(str(ref).strip()):
+            # File was renumbered in place; drop the stale index and retry.
+            with self._lock:
+                self._id_index = None
+            return self.template(ref)
+        with self._lock:
+            self._templates[path] = _Entry(st.st_mtime_ns, st.st_size, data)
+            self._templates.move_to_end(path)
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+            self.stats["template_misses"] += 1
+        return _fresh_copy(data)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self._id_index = None
+
+    # --- rendering -----------------------------------------------------------
+    def render(self, ref: Any, values: Dict[str, Any] | None = None) -> str:
+        """Render template ``ref`` with ``values`` (never prompts)."""
+        from ..menus import render_template
+
+        tmpl = self.template(ref)
+        text = render_template(tmpl, values=dict(values or {}))
+        self._bump("renders")
+        return text  # type: ignore[return-value]
+
+    def handle_render(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """Protocol handler for ``RENDER`` requests."""
+        ref = req.get("template")
+        if ref in (None, ""):
+            self._bump("errors")
+            raise ValueError("missing 'template'")
+        values = req.get("values")
+        if values is None:
+            values = {}
+        if not isinstance(values, dict):
+            self._bump("errors")
+            raise ValueError("values must be an object")
+        try:
+            return {"text": self.render(ref, values)}
+        except Exception:
+            self._bump("errors")
+            raise
+
+    def handlers(self) -> Dict[str, Handler]:
+        return {
+            "RENDER": self.handle_render,
+            "PING": lambda req: {"pid": os.getpid()},
+            "STATS": lambda req: {"stats": self.stats_snapshot()},
+        }
+
+
+_DEFAULT: Optional[RenderService] = None
+
+
+def get_render_service() -> RenderService:
+    """Return the process-wide service (shared by IPC endpoints)."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = RenderService()
+    return _DEFAULT
+
+
+def serve_stdio(
+    service: RenderService | None = None,
+    stdin: IO[bytes] | None = None,
+    stdout: IO[bytes] | None = None,
+) -> int:
+    """Answer JSON-lines requests from ``stdin`` until EOF; returns count."""
+    service = service or get_render_service()
+    handlers = service.handlers()
+    src = stdin if stdin is not None else sys.stdin.buffer
+    out = stdout if stdout is not None else sys.stdout.buffer
+    count = 0
+    for line in src:
+        if not line.strip():
+            continue
+        out.write(dispatch(line, handlers, default_cmd="RENDER"))
+        out.flush()
+        count += 1
+    return count
+
+
+def _remove_stale_socket(sock_path: str) -> None:
+    """Unlink a leftover socket at ``sock_path``; refuse anything else.
+
+    Raises ``FileExistsError`` when the path is not a socket (e.g. a
+    mistyped ``--socket`` pointing at a regular file) and ``RuntimeError``
+    when another server is still accepting connections on it.
+    """
+    try:
+        st = os.lstat(sock_path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError(f"{sock_path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(0.5)
+    try:
+        probe.connect(sock_path)
+    except OSError:
+        os.unlink(sock_path)  # nobody listening: stale
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"another server is listening on {sock_path}")
+
+
+def serve_unix(path: str | Path, service: RenderService | None = None) -> None:
+    """Serve render requests on a UNIX socket at ``path`` (blocks)."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("UNIX sockets are not supported on this platform; use stdio mode")
+    service = service or get_render_service()
+    sock_path = str(Path(path).expanduser())
+    _remove_stale_socket(sock_path)
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    srv.bind(sock_path)
+    srv.listen(64)
+    bound_ino = os.lstat(sock_path).st_ino
+    _log.info("render_service.listening path=%s", sock_path)
+
+    def _cleanup() -> None:
+        try:
+            srv.close()
+        finally:
+            try:
+                st = os.lstat(sock_path)
+                # Only remove our own socket, never a file put there since.
+                if stat.S_ISSOCK(st.st_mode) and st.st_ino == bound_ino:
+                    os.unlink(sock_path)
+            except OSError:
+                pass
+
+    serve(srv, service.handlers(), _cleanup, default_cmd="RENDER", background=("RENDER",))
+
+
+__all__ = ["RenderService", "get_render_service", "serve_stdio", "serve_unix"]
@@ -79,6 +79,19 @@ def build_summary_and_note(action: str, type_: str | None, dod: str | None, nra:
     return summary, note
 
 
+def _send_enabled() -> bool:
+    # In dev/test runs, default to disabled unless explicitly enabled via env
+    if os.environ.get("PROMPT_AUTOMATION_DEV") == "1" and os.environ.get("SEND_TODOIST_AFTER_RENDER") is None:
+        return False
+    # Gate by env first; if off, also check user setting key 'send_todoist_after_render'
+    return _bool_env("SEND_TODOIST_AFTER_RENDER", default=False) or get_boolean_setting("send_todoist_after_render", False)
+
+
+def _dry_run_enabled() -> bool:
+    # Dry-run may be enabled via env or persisted settings
+    return _bool_env("TODOIST_DRY_RUN", default=False) or get_boolean_setting("todoist_dry_run", False)
+
+
 def send_to_todoist(summary: str, note: Optional[str]) -> Tuple[bool, str]:
     """Invoke the repo PowerShell script to create a Todoist task.
 
@@ -89,11 +102,7 @@ def send_to_todoist(summary: str, note: Optional[str]) -> Tuple[bool, str]:
       - NTSK_DISABLE: kill-switch honored by the script
       - TODOIST_TOKEN_ENV: optional override of token env var name
     """
-    # In dev/test runs, default to disabled unless explicitly enabled via env
-    if os.environ.get("PROMPT_AUTOMATION_DEV") == "1" and os.environ.get("SEND_TODOIST_AFTER_RENDER") is None:
-        return True, "disabled"
-    # Gate by env first; if off, also check user setting key 'send_todoist_after_render'
-    if not (_bool_env("SEND_TODOIST_AFTER_RENDER", default=False) or get_boolean_setting("send_todoist_after_render", False)):
+    if not _send_enabled():
         return True, "disabled"
 
     # Non-blocking skip if PowerShell unavailable
@@ -114,8 +123,7 @@ def send_to_todoist(summary: str, note: Optional[str]) -> Tuple[bool, str]:
     args += ["-File", str(script), summary]
     if note is not None:
         args.append(note)
-    # Dry-run may be enabled via env or persisted settings
-    dry_run = _bool_env("TODOIST_DRY_RUN", default=False) or get_boolean_setting("todoist_dry_run", False)
+    dry_run = _dry_run_enabled()
     if dry_run:
         args.append("-DryRun")
 
@@ -151,4 +159,23 @@ def send_to_todoist(summary: str, note: Optional[str]) -> Tuple[bool, str]:
         return False, str(e)
 
 
-__all__ = ["send_to_todoist", "build_summary_and_note"]
+def queue_to_todoist(summary: str, note: Optional[str]) -> Tuple[bool, str]:
+    """Queue a Todoist task for the background sender (see ``todoist_queue``).
+
+    Same gating as :func:`send_to_todoist`; returns immediately with
+    ``(True, "queued")`` once the task is persisted, so delivery survives
+    API outages and restarts and several tasks share one script run.
+    """
+    if not _send_enabled():
+        return True, "disabled"
+    try:
+        from .todoist_queue import get_queue
+
+        task_id = get_queue().enqueue(summary, note)
+    except Exception as e:
+        _log.error("todoist.queue enqueue failed: %s", e)
+        return False, str(e)
+    return True, f"queued {task_id}"
+
+
+__all__ = ["send_to_todoist", "queue_to_todoist", "build_summary_and_note"]
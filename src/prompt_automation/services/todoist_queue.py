@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+"""Persistent outbound queue for the Todoist post-action.
+
+Tasks are appended to ``HOME_DIR/todoist-queue.json`` and sent by a
+background worker, so nothing is lost when the API, the network or
+PowerShell is unavailable, or when the app exits before the task was sent.
+The worker takes up to ``max_batch`` due tasks, writes them to a temporary
+JSON file and runs the sender once with ``-BatchFile <path>``:
+
+    [{"id": "...", "summary": "...", "note": "..." | null}, ...]
+
+The sender reports per-task outcomes on stdout as
+``[RESULT] <id> ok`` or ``[RESULT] <id> error <message>``; tasks without a
+result line follow the exit status. Failed tasks are retried with
+exponential backoff (``base_delay * 2**(attempts-1)`` capped at
+``max_delay``) and moved to the ``dead`` list after ``max_attempts``; the
+queue's ``on_dead`` callback (set by the GUI) receives the entries that
+were given up on in a batch, so the failure is reported to the user.
+
+Every change re-reads the file and writes it back while holding
+``<queue>.lock`` (``flock``/``msvcrt.locking``), so several processes or
+queue instances can share one file without dropping each other's tasks.
+Tasks handed to the sender are leased by pushing ``next_at`` past the send
+timeout, so another worker does not send them a second time.
+
+The sender defaults to ``scripts/todoist_add.ps1`` under PowerShell; set
+``PROMPT_AUTOMATION_TODOIST_CMD`` (a shell-style command line) to use a
+different program, e.g. a local stand-in script in tests.
+"""
+
+import contextlib
+import json
+import os
+import re
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..config import HOME_DIR
+from ..errorlog import get_logger
+
+_log = get_logger(__name__)
+
+SCHEMA_VERSION = 1
+QUEUE_FILE = HOME_DIR / "todoist-queue.json"
+ENV_CMD = "PROMPT_AUTOMATION_TODOIST_CMD"
+MAX_BATCH = 20
+BASE_DELAY = 5.0
+MAX_DELAY = 900.0
+MAX_ATTEMPTS = 8
+BATCH_TIMEOUT = 60.0
+
+_RESULT_RE = re.compile(r"^\[RESULT\]\s+(\S+)\s+(ok|error)\b[ \t]*(.*)$", re.IGNORECASE | re.MULTILINE)
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive advisory lock on ``path`` (best effort when unavailable)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fh = open(path, "a+b")
+    except Exception as e:
+        _log.debug("todoist.queue lock unavailable %s: %s", path, e)
+        yield
+        return
+    locked = False
+    try:
+        try:
+            if os.name == "nt":
+                import msvcrt
+
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore[attr-defined]
+            else:
+                import fcntl
+
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            locked = True
+        except OSError as e:
+            _log.warning("todoist.queue lock failed %s: %s", path, e)
+        yield
+    finally:
+        try:
+            if locked:
+                if os.name == "nt":
+                    import msvcrt
+
+                    fh.seek(0)
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore[attr-defined]
+                else:
+                    import fcntl
+
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+        finally:
+            fh.close()
+
+
+def _default_command() -> Optional[List[str]]:
+    override = os.environ.get(ENV_CMD)
+    if override:
+        return shlex.split(override, posix=os.name != "nt")
+    from .todoist_action import _detect_powershell, _dry_run_enabled, _script_path_from_repo
+
+    ps = _detect_powershell()
+    script = _script_path_from_repo()
+    if not ps or not script:
+        return None
+    args = [ps, "-NoProfile"]
+    if os.name == "nt":
+        args += ["-ExecutionPolicy", "Bypass"]
+    args += ["-File", str(script)]
+    if _dry_run_enabled():
+        args.append("-DryRun")
+    return args
+
+
+class TodoistQueue:
+    """On-disk task queue drained by a lazily started worker thread.
+
+    ``on_dead`` is called on the worker thread with the entries moved to the
+    dead list by a batch; it must not touch Tk directly.
+    """
+
+    def __init__(
+        self,
+        path: Path = QUEUE_FILE,
+        *,
+        command: Optional[Sequence[str]] = None,
+        max_batch: int = MAX_BATCH,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        max_attempts: int = MAX_ATTEMPTS,
+        timeout: float = BATCH_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+        on_dead: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.command = list(command) if command else None
+        self.max_batch = max(1, max_batch)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self._clock = clock
+        self.on_dead = on_dead
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._dead: List[Dict[str, Any]] = []
+
+    # --- persistence --------------------------------------------------------
+    def _load(self) -> None:
+        """Replace the in-memory lists with the file's current contents."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._pending, self._dead = [], []
+            return
+        except Exception as e:
+            _log.warning("todoist.queue unreadable %s: %s", self.path, e)
+            return
+        if isinstance(data, dict) and int(data.get("schema_version", 0)) == SCHEMA_VERSION:
+            self._pending = [e for e in data.get("pending") or [] if isinstance(e, dict) and e.get("id")]
+            self._dead = [e for e in data.get("dead") or [] if isinstance(e, dict)]
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Re-read, let the caller modify, then write back, all under the lock file."""
+        with self._lock, _file_lock(self.path.with_suffix(".lock")):
+            self._load()
+            yield
+            self._flush()
+
+    def _flush(self) -> None:
+        payload = {"schema_version": SCHEMA_VERSION, "pending": self._pending, "dead": self._dead}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+        except Exception as e:
+            _log.error("todoist.queue flush failed: %s", e)
+
+    # --- API ----------------------------------------------------------------
+    def enqueue(self, summary: str, note: Optional[str] = None, *, start: bool = True) -> str:
+        """Persist a task and wake the worker; returns the task id."""
+        entry = {
+            "id": uuid.uuid4().hex,
+            "summary": summary,
+            "note": note,
+            "attempts": 0,
+            "next_at": 0.0,
+            "created": self._clock(),
+            "last_error": "",
+        }
+        with self._transaction():
+            self._pending.append(entry)
+        if start:
+            self.start()
+        return entry["id"]
+
+    def depth(self) -> int:
+        """Number of tasks waiting to be sent (including ones backing off)."""
+        with self._lock:
+            self._load()
+            return len(self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._load()
+            due = [float(e.get("next_at") or 0.0) for e in self._pending]
+            return {
+                "depth": len(self._pending),
+                "dead": len(self._dead),
+                "next_attempt_at": min(due) if due else None,
+            }
+
+    def drain_once(self) -> int:
+        """Send one batch of due tasks; returns how many were delivered."""
+        with self._lock:
+            self._load()
+            now = self._clock()
+            due = any(float(e.get("next_at") or 0.0) <= now for e in self._pending)
+        if not due:
+            return 0
+        with self._transaction():
+            now = self._clock()
+            picked = [e for e in self._pending if float(e.get("next_at") or 0.0) <= now][: self.max_batch]
+            batch = [dict(e) for e in picked]
+            for entry in picked:
+                entry["next_at"] = now + self.timeout + 1.0  # lease while sending
+        if not batch:
+            return 0
+        start = time.perf_counter()
+        outcomes = self._dispatch(batch)
+        sent = 0
+        died: List[Dict[str, Any]] = []
+        with self._transaction():
+            now = self._clock()
+            by_id = {e["id"]: e for e in self._pending}
+            for item in batch:
+                entry = by_id.get(item["id"])
+                if entry is None:
+                    continue
+                ok, msg = outcomes.get(item["id"], (False, "no result"))
+                if ok:
+                    sent += 1
+                    self._pending.remove(entry)
+                    continue
+                entry["attempts"] = int(entry.get("attempts") or 0) + 1
+                entry["last_error"] = msg[:500]
+                if entry["attempts"] >= self.max_attempts:
+                    self._pending.remove(entry)
+                    self._dead.append(entry)
+                    died.append(dict(entry))
+                else:
+                    delay = min(self.max_delay, self.base_delay * 2 ** (entry["attempts"] - 1))
+                    entry["next_at"] = now + delay
+            depth = len(self._pending)
+        try:
+            _log.info(
+                "%s",
+                {
+                    "event": "todoist.queue.batch",
+                    "size": len(batch),
+                    "sent": sent,
+                    "failed": len(batch) - sent,
+                    "depth": depth,
+                    "duration_ms": round((time.perf_counter() - start) * 1000.0, 2),
+                },
+            )
+        except Exception:
+            pass
+        if died:
+            _log.warning("todoist.queue gave up on %d task(s): %s", len(died), died[-1].get("last_error"))
+            if self.on_dead is not None:
+                try:
+                    self.on_dead(died)
+                except Exception as e:
+                    _log.error("todoist.queue on_dead failed: %s", e)
+        return sent
+
+    def _dispatch(self, batch: List[Dict[str, Any]]) -> Dict[str, Tuple[bool, str]]:
+        cmd = self.command or _default_command()
+        if not cmd:
+            return {e["id"]: (False, "sender unavailable") for e in batch}
+        items = [{"id": e["id"], "summary": e.get("summary") or "", "note": e.get("note")} for e in batch]
+        fd, batch_path = tempfile.mkstemp(prefix="todoist-batch-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(items, fh, ensure_ascii=False)
+            proc = subprocess.run(
+                [*cmd, "-BatchFile", batch_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return {e["id"]: (False, "timeout") for e in batch}
+        except Exception as e:
+            return {item["id"]: (False, str(e)) for item in batch}
+        finally:
+            try:
+                os.unlink(batch_path)
+            except Exception:
+                pass
+        outcomes = {m.group(1): (m.group(2).lower() == "ok", m.group(3).strip()) for m in _RESULT_RE.finditer(proc.stdout or "")}
+        fallback = (proc.returncode == 0, (proc.stderr or proc.stdout or "").strip()[-500:])
+        return {e["id"]: outcomes.get(e["id"], fallback) for e in batch}
+
+    # --- worker -------------------------------------------------------------
+    def _next_delay(self) -> Optional[float]:
+        with self._lock:
+            if not self._pending:
+                self._thread = None
+                return None
+            next_at = min(float(e.get("next_at") or 0.0) for e in self._pending)
+        return max(0.0, next_at - self._clock())
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.drain_once()
+            except Exception as e:
+                _log.error("todoist.queue drain failed: %s", e)
+            delay = self._next_delay()
+            if delay is None:
+                return
+            self._wake.wait(delay)
+            self._wake.clear()
+        with self._lock:
+            self._thread = None
+
+    def start(self) -> Optional[threading.Thread]:
+        """Start (or wake) the worker when tasks are pending."""
+        with self._lock:
+            self._load()
+            if not self._pending:
+                return None
+            self._stop.clear()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="prompt-automation-todoist-queue", daemon=True)
+                self._thread.start()
+            else:
+                self._wake.set()
+            return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            thread = self._thread
+        self._stop.set()
+        self._wake.set()
+        if thread is not None:
+            thread.join(timeout)
+
+
+_default: Optional[TodoistQueue] = None
+_default_lock = threading.Lock()
+
+
+def get_queue() -> TodoistQueue:
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TodoistQueue()
+        return _default
+
+
+def queue_depth() -> int:
+    return get_queue().depth()
+
+
+def resume() -> Optional[threading.Thread]:
+    """Resume sending tasks left over from a previous run (no-op when empty)."""
+    if not QUEUE_FILE.exists():
+        return None
+    return get_queue().start()
+
+
+__all__ = [
+    "ENV_CMD",
+    "QUEUE_FILE",
+    "TodoistQueue",
+    "get_queue",
+    "queue_depth",
+    "resume",
+]
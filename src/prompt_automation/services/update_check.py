@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+"""Background update checks for the GUI.
+
+:func:`start_update_checks` runs the PyPI check
+(:func:`prompt_automation.updater.check_and_upgrade`, up to a 2 s HTTP
+timeout plus a possible ``pipx upgrade``) and the manifest check
+(:func:`prompt_automation.update.check_and_prompt`) on a worker thread. The
+GUI starts it once the first frame is painted; outcomes are reported through
+a caller-supplied ``notify(message)`` callback (a non-modal notification in
+the GUI).
+
+The worker is skipped in developer mode, mirroring the CLI. It is a
+non-daemon thread so an in-progress upgrade is never cut off when the
+window closes. Endpoints come from ``PROMPT_AUTOMATION_PYPI_URL`` and
+``PROMPT_AUTOMATION_UPDATE_URL`` so tests can point them at a local HTTP stub.
+"""
+
+import threading
+from typing import Callable, List, Optional
+
+from ..errorlog import get_logger
+
+_log = get_logger(__name__)
+
+Notify = Callable[[str], None]
+
+
+def run_update_checks(notify: Notify | None = None) -> List[str]:
+    """Run both update checks synchronously; returns the messages reported."""
+    from .. import update, updater
+
+    messages: List[str] = []
+
+    def _report(msg: str) -> None:
+        messages.append(msg)
+        if notify is not None:
+            try:
+                notify(msg)
+            except Exception as e:  # pragma: no cover - UI teardown races
+                _log.debug("update notification failed: %s", e)
+
+    try:
+        latest, upgraded = updater.check_and_upgrade()
+    except Exception as e:
+        _log.warning("background PyPI update check failed: %s", e)
+        latest, upgraded = None, False
+    if latest:
+        if upgraded:
+            _report(f"prompt-automation {latest} was installed in the background. Restart to use it.")
+        elif updater.have_pipx():
+            _report(f"prompt-automation {latest} is available; the background upgrade failed (pipx upgrade prompt-automation).")
+        else:
+            _report(f"prompt-automation {latest} is available (pip install -U prompt-automation).")
+
+    try:
+        remote = update.check_and_prompt(interactive=False)
+    except Exception as e:
+        _log.warning("background manifest update failed: %s", e)
+        remote = None
+    if remote:
+        if update.auto_apply_enabled():
+            _report(f"Update {remote} applied. Restart prompt-automation to use it.")
+        else:
+            _report(f"Update {remote} is available. Run `prompt-automation --update` to review it.")
+    return messages
+
+
+def start_update_checks(notify: Notify | None = None) -> Optional[threading.Thread]:
+    """Start :func:`run_update_checks` on a worker thread (``None`` in dev mode)."""
+    from ..dev import is_dev_mode
+
+    if is_dev_mode():
+        return None
+    thread = threading.Thread(
+        target=run_update_checks, args=(notify,), name="prompt-automation-update-check"
+    )
+    thread.start()
+    return thread
+
+
+__all__ = ["run_update_checks", "start_update_checks"]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+"""Wall-clock timings for the phases between launch and the first painted frame.
+
+Phases are always recorded (two ``perf_counter`` calls each) into a
+process-wide profiler; the report is only emitted when profiling is enabled
+via ``--profile-startup`` or the environment variable
+``PROMPT_AUTOMATION_PROFILE_STARTUP``:
+
+  - ``1`` / ``true`` / ``stderr`` – print one JSON object to stderr
+  - any other value              – treated as a file path; one JSON object
+    per launch is appended (JSON lines) so runs can be compared per machine
+
+The report is emitted once, at the first "ready" point (first frame painted
+in the GUI, before the first prompt in terminal mode, or on exit).
+
+Phase names used by the CLI/GUI: ``env_file``, ``config_discovery``,
+``singleton_probe``, ``check_dependencies``, ``update_checks``,
+``ensure_unique_ids``, ``template_scan``, ``tk_root``, ``first_frame_paint``.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+ENV_VAR = "PROMPT_AUTOMATION_PROFILE_STARTUP"
+_STDERR_VALUES = {"1", "true", "yes", "on", "stderr", "-"}
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
+
+
+class StartupProfiler:
+    """Collect named phase timings relative to profiler creation."""
+
+    def __init__(self) -> None:
+        self.t0 = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._emitted = False
+
+    def start_phase(self, name: str) -> Callable[[], None]:
+        """Begin ``name`` and return a callable that ends it (first call wins)."""
+        start = time.perf_counter()
+        done = False
+
+        def _end() -> None:
+            nonlocal done
+            if done:
+                return
+            done = True
+            end = time.perf_counter()
+            with self._lock:
+                self.phases.append(
+                    {"name": name, "start_ms": _ms(start - self.t0), "duration_ms": _ms(end - start)}
+                )
+
+        return _end
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        end = self.start_phase(name)
+        try:
+            yield
+        finally:
+            end()
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = list(self.phases)
+        totals: Dict[str, float] = {}
+        for p in phases:
+            totals[p["name"]] = round(totals.get(p["name"], 0.0) + p["duration_ms"], 3)
+        return {
+            "event": "startup_profile",
+            "pid": os.getpid(),
+            "argv": sys.argv[1:],
+            "total_ms": _ms(time.perf_counter() - self.t0),
+            "phases": phases,
+            "totals_ms": totals,
+        }
+
+    def emit(self, target: str | None = None) -> Dict[str, Any] | None:
+        """Write the report once if profiling is enabled; returns it when written."""
+        target = target if target is not None else os.environ.get(ENV_VAR, "")
+        target = target.strip()
+        if not target or target.lower() in {"0", "false", "no", "off"}:
+            return None
+        with self._lock:
+            if self._emitted:
+                return None
+            self._emitted = True
+        data = self.report()
+        line = json.dumps(data, sort_keys=True)
+        try:
+            if target.lower() in _STDERR_VALUES:
+                print(line, file=sys.stderr)
+            else:
+                path = Path(target).expanduser()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("a", encoding="utf-8") as fh:
+                    fh.write(line + "\n")
+        except Exception:
+            return None
+        return data
+
+
+_PROFILER = StartupProfiler()
+
+
+def get_profiler() -> StartupProfiler:
+    return _PROFILER
+
+
+def reset() -> StartupProfiler:
+    """Start a fresh profiler (tests / re-entrant ``main`` calls)."""
+    global _PROFILER
+    _PROFILER = StartupProfiler()
+    return _PROFILER
+
+
+def phase(name: str):
+    """Context manager timing ``name`` on the process-wide profiler."""
+    return _PROFILER.phase(name)
+
+
+def start_phase(name: str) -> Callable[[], None]:
+    return _PROFILER.start_phase(name)
+
+
+def emit(target: str | None = None) -> Dict[str, Any] | None:
+    return _PROFILER.emit(target)
+
+
+__all__ = [
+    "ENV_VAR",
+    "StartupProfiler",
+    "get_profiler",
+    "reset",
+    "phase",
+    "start_phase",
+    "emit",
+]
@@ -12,22 +12,30 @@ run in restricted environments and across all supported platforms
 The remote update location can be customised via the environment
 variable ``PROMPT_AUTOMATION_UPDATE_URL``.  The expected payload is a JSON
 document with at minimum the keys ``version`` and ``files``.  ``files`` is a
-mapping of relative file paths to download URLs.  An optional ``moved``
-mapping can be supplied to indicate files that changed paths.
+mapping of relative file paths to download URLs, or to objects with ``url``
+and an optional ``sha256`` hex digest.  Files whose local copy already
+matches ``sha256`` are skipped without downloading; downloads are verified
+against it.  An optional ``moved`` mapping can be supplied to indicate files
+that changed paths.
 
 Example manifest::
 
     {
         "version": "0.3.0",
         "files": {
-            "src/prompt_automation/some.py": "https://example/file.py",
+            "src/prompt_automation/some.py": {
+                "url": "https://example/file.py",
+                "sha256": "9f86d081884c7d65..."
+            },
             "prompts/example.txt": "https://example/example.txt"
         },
         "moved": {"old/path.txt": "new/path.txt"}
     }
 
 The :func:`check_and_prompt` function is the public entry point used by
-both the CLI and GUI at start-up.  It performs the following steps:
+the terminal CLI at start-up and by the GUI's background update worker
+(:mod:`prompt_automation.services.update_check`, started after the first
+frame is painted).  It performs the following steps:
 
 ``fetch_manifest`` -> ``compare version`` -> ``prompt user`` ->
 ``download/apply``
@@ -38,14 +46,16 @@ for troubleshooting.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib import request, error
-from typing import Dict, Iterable
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # Logging setup
@@ -73,12 +83,16 @@ ROOT_DIR = Path(__file__).resolve().parents[2]
 UPDATE_URL = os.environ.get("PROMPT_AUTOMATION_UPDATE_URL", "")
 """Remote manifest location.  Empty string disables update checks."""
 
+DOWNLOAD_WORKERS = 4
+"""Upper bound on concurrent file downloads in :func:`apply_update`."""
+
 # Auto-apply behaviour (default enabled). Set ``PROMPT_AUTOMATION_MANIFEST_AUTO=0``
 # to restore interactive prompts. When enabled the manifest update system
 # applies updates silently and resolves file conflicts by backing up the
 # existing file to ``<name>.bak`` (or ``<name>.bak.N`` if needed) before
 # replacing it. Moved files are auto-migrated.
-def _auto_mode() -> bool:
+def auto_apply_enabled() -> bool:
+    """Whether manifest updates are applied without prompting."""
     return os.environ.get("PROMPT_AUTOMATION_MANIFEST_AUTO", "1") != "0"
 
 
@@ -138,6 +152,45 @@ def _download_to_temp(url: str) -> Path:
     return Path(tmp_path)
 
 
+def _sha256(path: Path) -> str:
+    with open(path, "rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def _manifest_entries(files: Dict[str, Any]) -> List[Tuple[str, str, Optional[str]]]:
+    """Normalise ``files`` into ``(relpath, url, sha256 or None)`` tuples."""
+    entries: List[Tuple[str, str, Optional[str]]] = []
+    for relpath, spec in files.items():
+        if isinstance(spec, dict):
+            url = spec.get("url")
+            digest = spec.get("sha256")
+        else:
+            url, digest = spec, None
+        if not isinstance(url, str) or not url:
+            _log.warning("manifest entry %s has no url; skipping", relpath)
+            continue
+        entries.append((relpath, url, digest.lower() if isinstance(digest, str) else None))
+    return entries
+
+
+def _is_current(dest: Path, digest: Optional[str]) -> bool:
+    if not digest or not dest.is_file():
+        return False
+    try:
+        return _sha256(dest) == digest
+    except OSError:
+        return False
+
+
+def _fetch_verified(url: str, digest: Optional[str]) -> Path:
+    """Download ``url`` and check it against ``digest`` when provided."""
+    tmp = _download_to_temp(url)
+    if digest and _sha256(tmp) != digest:
+        tmp.unlink(missing_ok=True)
+        raise ValueError(f"sha256 mismatch for {url}")
+    return tmp
+
+
 def _apply_file_update(dest: Path, new_file: Path) -> None:
     """Safely apply an update for ``dest`` using content from ``new_file``.
 
@@ -151,7 +204,7 @@ def _apply_file_update(dest: Path, new_file: Path) -> None:
         if dest.read_bytes() == new_file.read_bytes():
             _log.info("%s already up to date", dest)
             return
-        if _auto_mode():
+        if auto_apply_enabled():
             # Automatic resolution: create unique .bak backup then replace
             backup = dest.with_suffix(dest.suffix + ".bak")
             idx = 1
@@ -196,7 +249,7 @@ def _handle_moved_files(mapping: Dict[str, str]) -> None:
         new_path = ROOT_DIR / new
         if not old_path.exists():
             continue
-        if _auto_mode():
+        if auto_apply_enabled():
             try:
                 new_path.parent.mkdir(parents=True, exist_ok=True)
                 if new_path.exists():
@@ -220,57 +273,80 @@ def _handle_moved_files(mapping: Dict[str, str]) -> None:
 def apply_update(manifest: dict) -> None:
     """Download and apply update described by ``manifest``."""
 
-    files: Dict[str, str] = manifest.get("files", {})
+    files: Dict[str, Any] = manifest.get("files", {})
     moved: Dict[str, str] = manifest.get("moved", {})
 
-    for relpath, url in files.items():
+    pending = []
+    for relpath, url, digest in _manifest_entries(files):
         dest = ROOT_DIR / relpath
-        try:
-            tmp_file = _download_to_temp(url)
-        except Exception:
-            print(f"Failed downloading {url}")
+        if _is_current(dest, digest):
+            _log.info("%s already up to date (sha256)", dest)
             continue
-        _apply_file_update(dest, tmp_file)
+        pending.append((dest, url, digest))
+
+    if pending:
+        # Downloads run concurrently; applying stays sequential and in
+        # manifest order because conflicts may prompt interactively.
+        workers = max(1, min(DOWNLOAD_WORKERS, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="update-download") as pool:
+            futures = [pool.submit(_fetch_verified, url, digest) for _dest, url, digest in pending]
+            for (dest, url, _digest), fut in zip(pending, futures):
+                try:
+                    tmp_file = fut.result()
+                except Exception as e:
+                    _log.error("failed fetching %s: %s", url, e)
+                    print(f"Failed downloading {url}")
+                    continue
+                _apply_file_update(dest, tmp_file)
 
     if moved:
         _handle_moved_files(moved)
 
 
-def check_and_prompt(force: bool = False) -> None:
+def check_and_prompt(force: bool = False, *, interactive: bool = True) -> str | None:
     """Check for updates and apply them.
 
     Behaviour:
     - Auto mode (default): apply updates silently when a newer manifest version
       is available; backup conflicting files; move renamed files.
     - Interactive mode (``PROMPT_AUTOMATION_MANIFEST_AUTO=0``): original
-      behaviour with confirmation and per-file conflict prompts.
+      behaviour with confirmation and per-file conflict prompts. With
+      ``interactive=False`` (background checks) nothing is applied; the caller
+      is expected to point the user at ``prompt-automation --update``.
+
+    Returns the newer remote version when one is available, else ``None``.
     """
 
     manifest = fetch_manifest()
     if not manifest:
-        return
+        return None
 
     local_version = _read_local_version()
     remote_version = manifest.get("version", "0")
 
     if not force and remote_version <= local_version:
         _log.info("no updates available (local=%s remote=%s)", local_version, remote_version)
-        return
+        return None
 
-    if not _auto_mode():
+    if not auto_apply_enabled():
+        if not interactive:
+            _log.info("manifest update pending user review (remote=%s)", remote_version)
+            return remote_version
         if not _prompt_yes_no("Updates are available. Review and apply updates now?"):
             _log.info("user skipped update")
-            return
+            return None
     else:
         _log.info("auto applying manifest update (local=%s remote=%s)", local_version, remote_version)
 
     apply_update(manifest)
-    if not _auto_mode():
+    if not auto_apply_enabled():
         print("[prompt-automation] Update complete")
+    return remote_version
 
 
 __all__ = [
     "check_and_prompt",
     "fetch_manifest",
     "apply_update",
+    "auto_apply_enabled",
 ]
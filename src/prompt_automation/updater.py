@@ -5,7 +5,8 @@ found attempts to upgrade the local installation using ``pipx upgrade``.
 
 Behaviour is controlled by environment variable
 ``PROMPT_AUTOMATION_AUTO_UPDATE`` (default ``1`` = enabled). Set to ``0``
-to disable the check. A small state file stores the timestamp of the
+to disable the check. ``PROMPT_AUTOMATION_PYPI_URL`` overrides the JSON
+endpoint (e.g. a local HTTP stub in tests). A small state file stores the timestamp of the
 last check to rate‑limit network calls to once per 24 hours.
 
 All failures are silent; the main application should never be blocked
@@ -20,7 +21,7 @@ import json
 import os
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from urllib import request, error
 import sys
 
@@ -31,7 +32,9 @@ try:  # Python >=3.8
 except Exception:  # pragma: no cover
     import importlib_metadata  # type: ignore
 
-PYPI_URL = "https://pypi.org/pypi/prompt-automation/json"
+PYPI_URL = os.environ.get(
+    "PROMPT_AUTOMATION_PYPI_URL", "https://pypi.org/pypi/prompt-automation/json"
+)
 STATE_PATH = Path.home() / ".prompt-automation" / "auto-update.json"
 STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
@@ -92,12 +95,13 @@ def _is_newer(remote: str, local: str) -> bool:
         return remote != local
 
 
-def _have_pipx() -> bool:
+def have_pipx() -> bool:
+    """Whether ``pipx`` is on ``PATH`` (background upgrades need it)."""
     from shutil import which
     return which("pipx") is not None
 
 
-def _upgrade_via_pipx() -> None:
+def _upgrade_via_pipx() -> bool:
     """Attempt to upgrade via pipx with resilient fallbacks.
 
     Problem: On Windows + WSL workflows the provided install script may copy the
@@ -110,50 +114,63 @@ def _upgrade_via_pipx() -> None:
 
     This function detects that failure mode and transparently falls back to a
     clean forced install from PyPI (resetting the spec to the package name) so
-    subsequent upgrades work normally. All failures remain silent by design.
+    subsequent upgrades work normally. All failures remain silent by design;
+    the return value tells whether some step succeeded.
     Set ``PROMPT_AUTOMATION_DISABLE_PIPX_FALLBACK=1`` to disable the fallback.
     """
     if os.environ.get("PROMPT_AUTOMATION_DISABLE_PIPX_FALLBACK") == "1":  # pragma: no cover - opt out
         try:
-            safe_run(["pipx", "upgrade", "prompt-automation"], capture_output=True, timeout=30)
+            res = safe_run(["pipx", "upgrade", "prompt-automation"], capture_output=True, timeout=30)
+            return res.returncode == 0
         except Exception:
-            pass
-        return
+            return False
 
     try:
         res = safe_run(
             ["pipx", "upgrade", "prompt-automation"], capture_output=True, text=True, timeout=30
         )
         if res.returncode == 0:
-            return
+            return True
         combined = (res.stdout or "") + "\n" + (res.stderr or "")
         if "Unable to parse package spec" in combined or "parse package spec" in combined:
             # Fallback: reinstall from PyPI (forces spec to canonical name)
             try:
-                safe_run(
+                res = safe_run(
                     ["pipx", "install", "--force", "prompt-automation"],
                     capture_output=True,
                     timeout=60,
                 )
+                return res.returncode == 0
             except Exception:
                 # Final fallback: user install via pip (no pipx) so they at least get newer code
                 try:
-                    safe_run(
+                    res = safe_run(
                         ["python", "-m", "pip", "install", "--upgrade", "--user", "prompt-automation"],
                         capture_output=True,
                         timeout=60,
                     )
+                    return res.returncode == 0
                 except Exception:
                     pass
     except Exception:
         # Silent by design
         pass
+    return False
+
+
+def check_for_update() -> Optional[str]:
+    """Check PyPI (rate limited) and upgrade via pipx when newer.
+
+    Returns the newer remote version when one was found, else ``None``.
+    """
+    return check_and_upgrade()[0]
 
 
-def check_for_update() -> None:
+def check_and_upgrade() -> Tuple[Optional[str], bool]:
+    """Like :func:`check_for_update`; also reports whether the pipx upgrade succeeded."""
     # Global opt-out
     if os.environ.get("PROMPT_AUTOMATION_AUTO_UPDATE", "1") == "0":
-        return
+        return None, False
 
     # Safety default on Windows: skip implicit pipx upgrades unless explicitly opted in.
     # This avoids breaking pipx shims when installed from temporary/local specs
@@ -161,11 +178,11 @@ def check_for_update() -> None:
     if _PLATFORM.startswith("win") and os.environ.get(
         "PROMPT_AUTOMATION_WINDOWS_ALLOW_PIPX_UPDATE", "0"
     ) != "1":
-        return
+        return None, False
 
     state = UpdateState.load()
     if _should_rate_limit(state.last_check):
-        return
+        return None, False
 
     local_version = _current_version()
     latest = _fetch_latest_version()
@@ -175,10 +192,10 @@ def check_for_update() -> None:
     state.save()
 
     if not latest or not _is_newer(latest, local_version):
-        return
+        return None, False
 
-    if _have_pipx():
-        _upgrade_via_pipx()
+    upgraded = bool(_upgrade_via_pipx()) if have_pipx() else False
+    return latest, upgraded
 
 
-__all__ = ["check_for_update"]
+__all__ = ["check_and_upgrade", "check_for_update", "have_pipx"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, Tuple, List
 
+from .. import wsl_paths
 from ..errorlog import get_logger
 
 from .gui import _gui_file_prompt
@@ -116,7 +117,7 @@ def get_global_reference_file() -> str | None:
         if path:
             norm = _normalize_reference_path(path)
             p = Path(norm).expanduser()
-            if p.exists():
+            if wsl_paths.exists(p):
                 if norm != path:
                     try:
                         raw = _load_overrides()
@@ -7,6 +7,7 @@ import platform
 from pathlib import Path
 from typing import Any, Dict, Callable
 
+from .. import wsl_paths
 from ..config import HOME_DIR, PROMPTS_DIR
 from ..errorlog import get_logger
 
@@ -353,11 +354,16 @@ def _normalize_reference_path(path: str) -> str:
     """Normalize reference file path for cross-platform consistency.
 
     - Expands user (~)
-    - Converts Windows backslashes to forward slashes when running under WSL/Linux for consistent display
+    - Under WSL maps Windows paths (``C:\\x``, ``\\\\wsl$\\...``) to their ``/mnt/<drive>`` form
+    - Otherwise converts Windows backslashes to forward slashes on non-Windows hosts for consistent display
     - Resolves redundant separators / up-level references when possible
     """
     try:
-        p = Path(path.strip().strip('"')).expanduser()
+        raw = path.strip().strip('"')
+        local = wsl_paths.to_local_path(raw)
+        if local != raw:
+            return local
+        p = Path(raw).expanduser()
         txt = str(p)
         if os.name != 'nt':
             if ':' in txt and '\\' in txt:
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+"""Windows path handling and file access shortcuts under WSL.
+
+Reference files are often picked from Windows (``C:\\Users\\me\\notes.md``)
+and read from WSL, where every ``stat`` and ``read`` on a ``/mnt/<drive>``
+(drvfs) path crosses the 9P bridge. This module keeps that cost down:
+
+- :func:`to_local_path` maps Windows drive and ``\\\\wsl$`` paths to their
+  WSL form once per distinct string (honouring the ``[automount] root`` of
+  ``/etc/wsl.conf``); outside WSL paths are returned unchanged.
+- :func:`stat` caches ``stat`` results of drvfs paths for
+  ``PROMPT_AUTOMATION_WSL_STAT_TTL`` seconds (default 2, ``0`` disables),
+  so existence checks during one render pay for one round trip. Callers
+  validating cached content pass ``fresh=True``, which always stats (and
+  refreshes the cached entry); other paths are never cached.
+- :func:`local_snapshot` copies drvfs files of up to ``SNAPSHOT_MAX_BYTES``
+  into ``HOME_DIR/wsl-snapshots`` and reuses the copy while its size and
+  mtime match the original, so a new process reading an unchanged reference
+  file pays one ``stat`` instead of a full read. ``PROMPT_AUTOMATION_WSL_SNAPSHOTS=0``
+  turns snapshots off.
+
+Everything except path translation is a no-op for non-drvfs paths.
+"""
+
+import configparser
+import hashlib
+import os
+import platform
+import re
+import shutil
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from .errorlog import get_logger
+
+_log = get_logger(__name__)
+
+STAT_TTL_ENV = "PROMPT_AUTOMATION_WSL_STAT_TTL"
+SNAPSHOTS_ENV = "PROMPT_AUTOMATION_WSL_SNAPSHOTS"
+DEFAULT_STAT_TTL = 2.0
+SNAPSHOT_MAX_BYTES = 16 * 1024 * 1024
+SNAPSHOT_MAX_FILES = 64
+
+_DRIVE_RE = re.compile(r"^([A-Za-z]):[\\/]*(.*)$", re.DOTALL)
+_UNC_RE = re.compile(r"^[\\/]{2}(?:wsl\$|wsl\.localhost)[\\/]+[^\\/]+[\\/]*(.*)$", re.IGNORECASE | re.DOTALL)
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+@lru_cache(maxsize=1)
+def is_wsl() -> bool:
+    if os.environ.get("WSL_DISTRO_NAME"):
+        return True
+    if platform.system() == "Linux":
+        rel = platform.uname().release.lower()
+        return "microsoft" in rel or "wsl" in rel
+    return False
+
+
+@lru_cache(maxsize=1)
+def mount_root() -> str:
+    """Drvfs mount root from ``/etc/wsl.conf`` (``/mnt/`` by default)."""
+    root = "/mnt/"
+    try:
+        cfg = configparser.ConfigParser()
+        cfg.read("/etc/wsl.conf", encoding="utf-8")
+        value = cfg.get("automount", "root", fallback="").strip().strip('"')
+        if value:
+            root = value
+    except Exception:
+        pass
+    return root.rstrip("/") + "/"
+
+
+@lru_cache(maxsize=1024)
+def to_local_path(path: str) -> str:
+    """WSL form of a Windows path (``C:\\x`` → ``/mnt/c/x``); others unchanged."""
+    if not is_wsl() or not path:
+        return path
+    m = _DRIVE_RE.match(path)
+    if m:
+        drive = f"{mount_root()}{m.group(1).lower()}"
+        rest = m.group(2).replace("\\", "/")
+        return f"{drive}/{rest}" if rest else drive
+    m = _UNC_RE.match(path)
+    if m:
+        return "/" + m.group(1).replace("\\", "/")
+    return path
+
+
+def is_drvfs(path: PathLike) -> bool:
+    """Whether ``path`` lives on a Windows drive mounted into WSL."""
+    if not is_wsl():
+        return False
+    text = os.fspath(path)
+    root = mount_root()
+    drive = text[len(root):len(root) + 2]
+    return text.startswith(root) and drive[:1].isalpha() and drive[1:] in ("", "/")
+
+
+def _stat_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get(STAT_TTL_ENV, DEFAULT_STAT_TTL)))
+    except ValueError:
+        return DEFAULT_STAT_TTL
+
+
+_stat_cache: Dict[str, Tuple[float, Optional[os.stat_result], Optional[OSError]]] = {}
+_stat_lock = threading.Lock()
+
+
+def stat(path: PathLike, *, fresh: bool = False) -> os.stat_result:
+    """``os.stat`` with a short-lived cache for drvfs paths (raises ``OSError``).
+
+    ``fresh=True`` skips the cached result but still records the new one.
+    """
+    text = os.fspath(path)
+    ttl = _stat_ttl() if is_drvfs(text) else 0.0
+    if not ttl:
+        return os.stat(text)
+    now = time.monotonic()
+    with _stat_lock:
+        hit = None if fresh else _stat_cache.get(text)
+    if hit is not None and hit[0] > now:
+        if hit[2] is not None:
+            raise hit[2]
+        return hit[1]  # type: ignore[return-value]
+    try:
+        st = os.stat(text)
+    except OSError as e:
+        with _stat_lock:
+            _stat_cache[text] = (now + ttl, None, e)
+        raise
+    with _stat_lock:
+        if len(_stat_cache) > 4096:
+            _stat_cache.clear()
+        _stat_cache[text] = (now + ttl, st, None)
+    return st
+
+
+def exists(path: PathLike) -> bool:
+    try:
+        stat(path)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+def clear_stat_cache() -> None:
+    with _stat_lock:
+        _stat_cache.clear()
+
+
+def _snapshot_dir() -> Path:
+    from .config import HOME_DIR
+
+    return HOME_DIR / "wsl-snapshots"
+
+
+def _snapshots_enabled() -> bool:
+    return os.environ.get(SNAPSHOTS_ENV, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _prune(directory: Path) -> None:
+    try:
+        # mtime mirrors the source file; ctime is when the snapshot was written
+        snaps = sorted(directory.glob("*.snap"), key=lambda p: p.stat().st_ctime)
+        for old in snaps[: max(0, len(snaps) - SNAPSHOT_MAX_FILES)]:
+            old.unlink()
+    except Exception:
+        pass
+
+
+def local_snapshot(path: PathLike, st: Optional[os.stat_result] = None) -> Optional[Path]:
+    """Local copy of a drvfs file, refreshed when its size or mtime changed.
+
+    Returns ``None`` when the file is not on drvfs, is too large, snapshots
+    are disabled or copying failed; callers then read ``path`` directly.
+    """
+    text = os.fspath(path)
+    if not is_drvfs(text) or not _snapshots_enabled():
+        return None
+    try:
+        st = st or stat(text)
+        if st.st_size > SNAPSHOT_MAX_BYTES:
+            return None
+        directory = _snapshot_dir()
+        snap = directory / (hashlib.sha1(os.path.abspath(text).encode("utf-8")).hexdigest() + ".snap")
+        try:
+            local = snap.stat()
+            if local.st_size == st.st_size and local.st_mtime_ns == st.st_mtime_ns:
+                return snap
+        except FileNotFoundError:
+            pass
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = snap.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        shutil.copyfile(text, tmp)
+        if tmp.stat().st_size != st.st_size:  # changed while copying
+            tmp.unlink()
+            return None
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        tmp.replace(snap)
+        _prune(directory)
+        return snap
+    except Exception as e:
+        _log.debug("wsl.snapshot failed for %s: %s", text, e)
+        return None
+
+
+__all__ = [
+    "clear_stat_cache",
+    "exists",
+    "is_drvfs",
+    "is_wsl",
+    "local_snapshot",
+    "mount_root",
+    "stat",
+    "to_local_path",
+]
@@ -21,6 +21,8 @@ def _isolate_updates(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("PROMPT_AUTOMATION_AUTO_UPDATE", "0")
     # And ensure manifest updater has no remote configured
     monkeypatch.delenv("PROMPT_AUTOMATION_UPDATE_URL", raising=False)
+    # Keep rendered output out of the user's render memo; its tests opt in
+    monkeypatch.setenv("PROMPT_AUTOMATION_RENDER_MEMO", "0")
     # Keep environment otherwise intact for other tests
     yield
 
@@ -0,0 +1,93 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'src'))
+
+from prompt_automation.gui.collector.components.markdown_view import (
+    MarkdownHighlighter,
+    line_tags,
+)
+
+
+class FakeText:
+    """Minimal tk.Text stand-in: fixed viewport, recorded tags, manual idle loop."""
+
+    def __init__(self, first=1, visible=40):
+        self.first = first
+        self.visible = visible
+        self.tags = []
+        self.idle = []
+        self.scroll_cmd = None
+
+    def configure(self, **kw):
+        self.scroll_cmd = kw.get("yscrollcommand", self.scroll_cmd)
+
+    def index(self, spec):
+        y = int(spec.split(",")[1])
+        return f"{self.first + (self.visible - 1 if y else 0)}.0"
+
+    def winfo_height(self):
+        return 600
+
+    def after_idle(self, fn):
+        self.idle.append(fn)
+        return f"after#{len(self.idle)}"
+
+    def after_cancel(self, ident):
+        self.idle.clear()
+
+    def tag_add(self, tag, start, end):
+        self.tags.append((tag, start, end))
+
+    def run_idle(self):
+        steps = 0
+        while self.idle:
+            self.idle.pop(0)()
+            steps += 1
+        return steps
+
+
+def test_line_tags_spans():
+    assert line_tags("# Title") == [("h1", 0, -1)]
+    assert line_tags("---") == [("hr", 0, -1)]
+    assert line_tags("a **b** and `c`") == [("bold", 4, 5), ("inlinecode", 13, 14)]
+    assert line_tags("**not bold**", in_code=True) == [("codeblock", 0, -1)]
+
+
+def test_only_viewport_is_tagged_in_idle_chunks():
+    lines = ["## Heading %d **x**" % i for i in range(100_000)]
+    text = FakeText(first=50_001, visible=40)
+    hl = MarkdownHighlighter(text, "\n".join(lines), chunk_lines=50, margin=100)
+    hl.attach()
+    steps = text.run_idle()
+    tagged = {int(start.split(".")[0]) for _, start, _ in text.tags}
+    assert tagged == set(range(49_901, 50_141))
+    assert steps == 5  # 240 lines / 50 per idle slice
+    # Scrolling reports through yscrollcommand and tags the new region only
+    text.first = 90_000
+    text.scroll_cmd("0.9", "0.91")
+    text.run_idle()
+    assert ("h2", "90000.0", "90000.0 lineend") in text.tags
+    assert not any(start.startswith("1.") for _, start, _ in text.tags)
+
+
+def test_code_fences_cover_block_and_ignore_unclosed():
+    raw = "\n".join(["text", "```", "**code**", "```", "# after", "```", "tail"])
+    text = FakeText(visible=10)
+    hl = MarkdownHighlighter(text, raw)
+    hl.highlight_all()
+    by_line = {}
+    for tag, start, _ in text.tags:
+        by_line.setdefault(int(start.split(".")[0]), []).append(tag)
+    assert by_line[2] == by_line[3] == by_line[4] == ["codeblock"]
+    assert by_line[5] == ["h1"]
+    assert by_line[6] == ["codeblock"]  # the unclosed fence line itself
+    assert 7 not in by_line
+
+
+def test_close_cancels_pending_work():
+    text = FakeText()
+    hl = MarkdownHighlighter(text, "# a\n# b").attach()
+    hl.close()
+    assert text.run_idle() == 0
+    assert text.tags == []
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import prompt_automation.gui.file_append as file_append
+from prompt_automation.gui.file_append import _append_to_files, read_recent_blocks
+from prompt_automation.menus import render_template
+
+
+def _context_file(path: Path, entries: int, filler: int = 0) -> Path:
+    body = ["Base context ✓\n" + "x" * filler]
+    for i in range(entries):
+        body.append(f"\n\n--- 2024-01-{i % 28 + 1:02d} 10:00:{i % 60:02d} ---\nentry {i}\n")
+    path.write_text("".join(body), encoding="utf-8")
+    return path
+
+
+def test_reads_only_recent_entries(tmp_path, monkeypatch):
+    f = _context_file(tmp_path / "ctx.txt", 2000, filler=200_000)
+    monkeypatch.setattr(file_append, "_READ_BLOCK", 1024)  # force separators across reads
+    out = read_recent_blocks(str(f), 3)
+    lines = out.splitlines()
+    assert lines[0].startswith("[... ctx.txt: older entries omitted")
+    assert [l for l in lines if l.startswith("entry")] == ["entry 1997", "entry 1998", "entry 1999"]
+    assert lines[1].startswith("--- 2024-")
+    assert "Base context" not in out
+
+
+def test_short_files_are_returned_whole(tmp_path):
+    f = _context_file(tmp_path / "ctx.txt", 2)
+    assert read_recent_blocks(str(f), 5) == f.read_text(encoding="utf-8")
+    assert read_recent_blocks(str(f), 0) == f.read_text(encoding="utf-8")
+    assert read_recent_blocks(str(tmp_path / "missing.txt"), 2) == ""
+
+
+def test_exact_entry_count_has_no_omitted_marker(tmp_path):
+    f = tmp_path / "ctx.txt"
+    for i in range(3):
+        _append_to_files({"context_append_file": str(f)}, f"reply {i}")
+    assert read_recent_blocks(str(f), 3) == f.read_text(encoding="utf-8")
+    assert read_recent_blocks(str(f), 2).startswith("[... ctx.txt: older entries omitted")
+
+
+def test_appended_entries_round_trip(tmp_path):
+    f = tmp_path / "ctx.txt"
+    f.write_text("Base\n", encoding="utf-8")
+    for i in range(4):
+        _append_to_files({"context_append_file": str(f)}, f"reply {i}")
+    out = read_recent_blocks(str(f), 2)
+    assert "reply 2" in out and "reply 3" in out and "reply 1" not in out
+
+
+def test_render_uses_recent_blocks_from_placeholder(tmp_path):
+    f = _context_file(tmp_path / "ctx.txt", 10)
+    tmpl = {"template": ["{{context}}"], "placeholders": [{"name": "context", "recent_blocks": 1}]}
+    rendered = render_template(tmpl, values={"context_file": str(f)})
+    assert "entry 9" in rendered and "entry 8" not in rendered
+
+
+def test_size_capped_rotation(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMPT_AUTOMATION_APPEND_MAX_MB", str(100 / (1024 * 1024)))
+    monkeypatch.setenv("PROMPT_AUTOMATION_APPEND_BACKUPS", "2")
+    f = tmp_path / "log.txt"
+    for i in range(12):
+        _append_to_files({"append_file": str(f)}, f"line {i:02d} " + "y" * 20)
+    assert f.stat().st_size <= 100
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["log.txt", "log.txt.1", "log.txt.2"]
+    assert "line 11" in f.read_text()
+    assert "line 00" not in "".join(p.read_text() for p in tmp_path.iterdir())
+
+
+def test_rotation_disabled_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv("PROMPT_AUTOMATION_APPEND_MAX_MB", raising=False)
+    f = tmp_path / "log.txt"
+    for i in range(50):
+        _append_to_files({"append_file": str(f)}, "z" * 100)
+    assert [p.name for p in tmp_path.iterdir()] == ["log.txt"]
+
+
+def test_rotation_without_backups_truncates_in_place(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMPT_AUTOMATION_APPEND_MAX_MB", str(100 / (1024 * 1024)))
+    monkeypatch.setenv("PROMPT_AUTOMATION_APPEND_BACKUPS", "0")
+    f = tmp_path / "log.txt"
+    for i in range(6):
+        _append_to_files({"append_file": str(f)}, f"line {i:02d} " + "y" * 20)
+    ino = f.stat().st_ino
+    _append_to_files({"append_file": str(f)}, "line 06 " + "y" * 20)
+    assert [p.name for p in tmp_path.iterdir()] == ["log.txt"]
+    assert f.stat().st_ino == ino
+    assert f.stat().st_size <= 100 and "line 06" in f.read_text()
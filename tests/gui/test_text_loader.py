@@ -0,0 +1,75 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from prompt_automation.gui.text_loader import insert_progressively
+
+
+class FakeText:
+    def __init__(self, state="normal"):
+        self.buf = ""
+        self.state = state
+        self.timers = []
+        self.inserts = 0
+
+    def cget(self, key):
+        return self.state
+
+    def configure(self, **kw):
+        self.state = kw.get("state", self.state)
+
+    def insert(self, index, text):
+        assert index == "end-1c"
+        assert self.state == "normal", "insert into disabled widget"
+        self.buf += text
+        self.inserts += 1
+
+    def after(self, ms, fn):
+        self.timers.append(fn)
+        return f"after#{len(self.timers)}"
+
+    def after_cancel(self, ident):
+        self.timers.clear()
+
+    def run_timers(self):
+        while self.timers:
+            self.timers.pop(0)()
+
+
+def test_short_content_is_inserted_in_one_call():
+    text = FakeText()
+    done = []
+    loader = insert_progressively(text, "hello\nworld", on_done=lambda: done.append(True))
+    assert text.buf == "hello\nworld" and text.inserts == 1
+    assert loader.done and done == [True] and text.timers == []
+
+
+def test_large_content_loads_in_line_aligned_chunks():
+    content = "".join(f"line {i}\n" for i in range(5000))
+    text = FakeText(state="disabled")
+    progress = []
+    loader = insert_progressively(
+        text, content, first_chars=1000, chunk_chars=4000, on_progress=lambda a, b: progress.append((a, b))
+    )
+    first = text.buf
+    assert first.endswith("\n") and 1000 <= len(first) < 1100
+    assert not loader.done and text.state == "disabled"
+    text.run_timers()
+    assert text.buf == content and text.state == "disabled"
+    assert progress[-1] == (len(content), len(content))
+    assert all(a < b for (a, _), (b, _) in zip(progress, progress[1:]))
+
+
+def test_flush_and_cancel():
+    content = "x" * 50_000
+    text = FakeText()
+    loader = insert_progressively(text, content, first_chars=100, chunk_chars=100)
+    loader.flush()
+    assert text.buf == content and text.timers == []
+
+    text2 = FakeText()
+    loader2 = insert_progressively(text2, content, first_chars=100, chunk_chars=100)
+    loader2.cancel()
+    text2.run_timers()
+    assert text2.buf == "x" * 100
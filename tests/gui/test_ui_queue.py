@@ -0,0 +1,50 @@
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from prompt_automation.gui import ui_queue
+
+
+class _FakeRoot:
+    """Records ``after`` calls instead of running a Tk event loop."""
+
+    def __init__(self):
+        self.scheduled = []
+        self.callers = []
+
+    def after(self, ms, fn):
+        self.callers.append(threading.current_thread())
+        self.scheduled.append(fn)
+
+    def tick(self):
+        pending, self.scheduled = self.scheduled, []
+        for fn in pending:
+            fn()
+
+
+def test_posts_from_workers_run_on_the_polling_thread():
+    root = _FakeRoot()
+    queue = ui_queue.install(root)
+    assert ui_queue.install(root) is queue
+    ran = []
+
+    def _worker():
+        ui_queue.post(root, lambda: ran.append(threading.current_thread()))
+
+    t = threading.Thread(target=_worker)
+    t.start()
+    t.join()
+    assert ran == []
+    root.tick()
+    assert ran == [threading.current_thread()]
+    # The worker never called into the root; the poll keeps re-arming.
+    assert set(root.callers) == {threading.current_thread()}
+    assert len(root.scheduled) == 1
+
+
+def test_post_without_queue_is_dropped():
+    root = _FakeRoot()
+    assert ui_queue.post(root, lambda: None) is False
+    assert root.scheduled == []
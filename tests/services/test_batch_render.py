@@ -0,0 +1,60 @@
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from prompt_automation.services.batch_render import iter_batch
+
+
+def _template(tmp_path: Path) -> Path:
+    path = tmp_path / "batch.json"
+    path.write_text(json.dumps({
+        "id": "batch-unit",
+        "title": "Batch",
+        "style": "Unit",
+        "template": ["Variant {{n}}: {{text}}"],
+        "placeholders": [{"name": "n"}, {"name": "text"}],
+    }))
+    return path
+
+
+def _requests(path: Path, count: int):
+    lines = [
+        json.dumps({"template": str(path), "values": {"n": str(i), "text": "x" * (count - i)}, "id": i}).encode() + b"\n"
+        for i in range(count)
+    ]
+    lines.insert(3, b"\n")
+    lines.append(b'{"template": "missing.json", "id": "bad"}\n')
+    return lines
+
+
+def test_in_process_batch_preserves_order_and_reports_errors(tmp_path):
+    replies = [json.loads(f) for f in iter_batch(_requests(_template(tmp_path), 6), workers=1)]
+    assert [r["id"] for r in replies] == [0, 1, 2, 3, 4, 5, "bad"]
+    assert replies[2]["text"] == "Variant 2: xxxx"
+    assert replies[-1]["ok"] is False
+
+
+def test_process_pool_batch_streams_in_input_order(tmp_path):
+    lines = _requests(_template(tmp_path), 40)
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        replies = [json.loads(f) for f in iter_batch(lines, workers=2, window=2, executor=pool)]
+    assert [r["id"] for r in replies] == list(range(40)) + ["bad"]
+    assert all(r["ok"] for r in replies[:-1])
+    assert replies[39]["text"] == "Variant 39: x"
+
+
+def test_cli_batch_writes_output_and_exit_code(tmp_path):
+    import prompt_automation.cli as cli_pkg
+
+    src = tmp_path / "requests.jsonl"
+    out = tmp_path / "out.jsonl"
+    src.write_bytes(b"".join(_requests(_template(tmp_path), 3)[:3]))
+    code = cli_pkg.PromptCLI().main(["render", "--batch", str(src), "--workers", "1", "--output", str(out)])
+    assert code == 0
+    assert [json.loads(l)["id"] for l in out.read_text().splitlines()] == [0, 1, 2]
+    src.write_bytes(b'{"template": "missing.json"}\n')
+    assert cli_pkg.PromptCLI().main(["render", "--batch", str(src), "--workers", "1", "--output", str(out)]) == 1
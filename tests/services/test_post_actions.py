@@ -0,0 +1,46 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from prompt_automation.services import post_actions as pa
+
+
+def test_run_post_actions_reports_each_state():
+    seen = []
+    release = threading.Event()
+    actions = [
+        pa.PostAction("ok", lambda: None),
+        pa.PostAction("failed", lambda: (False, "api down")),
+        pa.PostAction("error", lambda: 1 / 0),
+        pa.PostAction("slow", release.wait, timeout=0.05),
+        pa.PostAction("after", lambda: (True, "sent")),
+    ]
+    results = pa.run_post_actions(actions, lambda *s: seen.append(s))
+    release.set()
+    assert [r[:2] for r in results] == [
+        ("ok", "ok"),
+        ("failed", "failed"),
+        ("error", "error"),
+        ("slow", "timeout"),
+        ("after", "ok"),
+    ]
+    assert results[1][2] == "api down"
+    assert seen == results
+
+
+def test_submit_returns_immediately_and_runs_batches_in_order():
+    order = []
+    gate = threading.Event()
+    first = [pa.PostAction("a", lambda: (gate.wait(1), order.append("a")))]
+    second = [pa.PostAction("b", lambda: order.append("b"))]
+    start = time.perf_counter()
+    worker = pa.submit(first)
+    assert pa.submit(second) is worker
+    assert time.perf_counter() - start < 0.5
+    assert order == []
+    gate.set()
+    assert pa.wait(2)
+    assert order == ["a", "b"]
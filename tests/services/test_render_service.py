@@ -0,0 +1,135 @@
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import prompt_automation.variables.storage as storage
+from prompt_automation.ipc import encode_frame
+from prompt_automation.services.render_service import RenderService, serve_stdio, serve_unix
+
+
+def _write_template(base: Path, rel: str, tid: int, lines) -> Path:
+    path = base / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "id": tid,
+        "title": "T",
+        "style": "Unit",
+        "template": lines,
+        "placeholders": [{"name": "name"}, {"name": "items", "format": "list"}],
+    }))
+    return path
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_PERSIST_FILE", tmp_path / "placeholder-overrides.json")
+    monkeypatch.setattr(storage, "_SETTINGS_FILE", tmp_path / "Settings" / "settings.json")
+    (tmp_path / "Settings").mkdir()
+    prompts = tmp_path / "styles"
+    _write_template(prompts, "Unit/01_hello.json", 4101, ["Hello {{name}}", "{{items}}"])
+    return RenderService(prompts)
+
+
+def test_render_by_id_and_path_reuses_cache(service, tmp_path):
+    assert service.render(4101, {"name": "A", "items": "x\ny"}) == "Hello A\n- x\n- y"
+    assert service.render("4101", {"name": "B", "items": ""}) == "Hello B"
+    path = tmp_path / "styles" / "Unit" / "01_hello.json"
+    assert service.render(str(path), {"name": "C", "items": "z"}) == "Hello C\n- z"
+    assert service.stats["template_misses"] == 1
+    assert service.stats["template_hits"] == 2
+    assert service.stats["index_builds"] == 1
+
+
+def test_edits_and_new_templates_are_picked_up(service, tmp_path):
+    path = tmp_path / "styles" / "Unit" / "01_hello.json"
+    service.render(4101, {"name": "A", "items": ""})
+    _write_template(tmp_path / "styles", "Unit/01_hello.json", 4101, ["Bye {{name}} (edited)"])
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10_000_000))
+    assert service.render(4101, {"name": "A"}) == "Bye A (edited)"
+    _write_template(tmp_path / "styles", "Unit/02_new.json", 4102, ["New {{name}}"])
+    assert service.render(4102, {"name": "N"}) == "New N"
+    with pytest.raises(LookupError):
+        service.render(4199, {})
+
+
+def test_serve_stdio_jsonl(service):
+    src = io.BytesIO(
+        b'{"template": 4101, "values": {"name": "S", "items": ""}, "id": "a"}\n'
+        b'\n'
+        b'{"template": 4101, "values": []}\n'
+        b'{"cmd": "STATS"}\n'
+    )
+    out = io.BytesIO()
+    assert serve_stdio(service, src, out) == 3
+    replies = [json.loads(l) for l in out.getvalue().splitlines()]
+    assert replies[0] == {"ok": True, "id": "a", "text": "Hello S"}
+    assert replies[1]["ok"] is False and "values" in replies[1]["error"]
+    assert replies[2]["stats"]["renders"] == 1
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires AF_UNIX")
+def test_serve_unix_multiple_clients(service, tmp_path):
+    sock_path = tmp_path / "render.sock"
+    threading.Thread(target=serve_unix, args=(sock_path, service), daemon=True).start()
+    deadline = time.time() + 2
+    while not sock_path.exists() and time.time() < deadline:
+        time.sleep(0.01)
+
+    def _request(name):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(2)
+            s.connect(str(sock_path))
+            s.sendall(encode_frame({"template": 4101, "values": {"name": name, "items": ""}}))
+            buf = b""
+            while not buf.endswith(b"\n"):
+                buf += s.recv(4096)
+        return json.loads(buf)["text"]
+
+    assert [_request(n) for n in ("one", "two")] == ["Hello one", "Hello two"]
+
+
+def test_relative_path_resolves_against_service_prompts_dir(service, tmp_path, monkeypatch):
+    import prompt_automation.config as config
+
+    monkeypatch.setattr(config, "PROMPTS_DIR", tmp_path / "elsewhere")
+    assert service.render("Unit/01_hello.json", {"name": "R", "items": ""}) == "Hello R"
+    with pytest.raises(LookupError):
+        service.render("Unit/missing.json", {})
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires AF_UNIX")
+def test_serve_unix_refuses_to_replace_regular_file(service, tmp_path):
+    target = tmp_path / "notes.txt"
+    target.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        serve_unix(target, service)
+    assert target.read_text() == "keep me"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires AF_UNIX")
+def test_serve_unix_replaces_stale_socket_and_refuses_live_one(service, tmp_path):
+    sock_path = tmp_path / "render.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(sock_path))
+    stale.close()  # leaves the socket file behind with nobody listening
+    threading.Thread(target=serve_unix, args=(sock_path, service), daemon=True).start()
+    deadline = time.time() + 2
+    while time.time() < deadline:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+                s.connect(str(sock_path))
+            break
+        except OSError:
+            time.sleep(0.01)
+    with pytest.raises(RuntimeError):
+        serve_unix(sock_path, service)
+    assert sock_path.exists()
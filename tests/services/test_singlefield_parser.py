@@ -51,3 +51,56 @@ def test_normalization_prepends_verb():
     assert out["title"].lower().startswith("draft ")
     assert out["priority"] == "p3"
     assert out["acceptance_final"] == ""
+
+
+def test_native_due_forms_resolve_without_dateparser():
+    from datetime import datetime
+
+    now = datetime(2026, 10, 19, 10, 0)  # Monday
+    cases = {
+        "today": "today",
+        "today 4pm": "today 4:00 PM",
+        "tomorrow at 9:30 am": "tomorrow 9:30 AM",
+        "fri": "Friday",
+        "end of week": "Friday",
+        "16:00": "today 4:00 PM",
+        "2026-11-03": "Nov 3",
+        "2026-11-03T14:30": "Nov 3 2:30 PM",
+    }
+    for raw, expected in cases.items():
+        parts = ps._native_due_parts(raw, now)
+        assert parts is not None, raw
+        assert ps._format_due(raw, parts[0], now, day_only=parts[1]) == expected, raw
+    # Midnight results from dateparser keep their time as before.
+    assert ps._format_due("nov 3", datetime(2026, 11, 3), now) == "Nov 3 12:00 AM"
+    assert ps._native_due("next mon", now).day == 26
+    assert ps._native_due("8am", now).day == 20  # already past -> tomorrow
+    for raw in ("next week", "in 3 days", "5", "2026-13-40"):
+        assert ps._native_due(raw, now) is None, raw
+
+
+def test_native_due_does_not_import_dateparser(monkeypatch):
+    monkeypatch.setattr(ps, "dateparser", None)
+    monkeypatch.setattr(ps, "_DATEPARSER_TRIED", False)
+    assert ps._resolve_due("tomorrow 9am", "UTC") == "tomorrow 9:00 AM"
+    assert ps._DATEPARSER_TRIED is False
+
+
+def test_parse_capture_memoized_per_day():
+    ps._parse_capture_cached.cache_clear()
+    first = ps.parse_capture("Ship the memo p2", "UTC")
+    first["title"] = "mutated"
+    second = ps.parse_capture("Ship the memo p2", "UTC")
+    assert second["title"] == "Ship the memo"
+    assert ps._parse_capture_cached.cache_info().hits == 1
+
+
+def test_parse_capture_time_relative_due_not_stale(monkeypatch):
+    from datetime import datetime
+
+    ps._parse_capture_cached.cache_clear()
+    clock = {"now": datetime(2026, 10, 19, 10, 0)}
+    monkeypatch.setattr(ps, "_now", lambda tz: clock["now"])
+    assert ps.parse_capture("Call Bob due: 4pm", None)["due_display"].endswith("due: today 4:00 PM")
+    clock["now"] = datetime(2026, 10, 19, 17, 0)
+    assert ps.parse_capture("Call Bob due: 4pm", None)["due_display"].endswith("due: Tuesday 4:00 PM")
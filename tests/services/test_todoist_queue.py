@@ -0,0 +1,154 @@
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from prompt_automation.services import todoist_queue as tq
+
+
+def _stand_in(tmp_path, fail=()):
+    """Local replacement for todoist_add.ps1 that records each batch."""
+    script = tmp_path / "fake_todoist.py"
+    log = tmp_path / "batches.jsonl"
+    script.write_text(
+        textwrap.dedent(
+            f"""
+            import json, sys
+            items = json.load(open(sys.argv[sys.argv.index("-BatchFile") + 1], encoding="utf-8"))
+            with open({str(log)!r}, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps([i["summary"] for i in items]) + "\\n")
+            bad = {list(fail)!r}
+            for i in items:
+                print("[RESULT]", i["id"], "error boom" if i["summary"] in bad else "ok")
+            sys.exit(1 if any(i["summary"] in bad for i in items) else 0)
+            """
+        ),
+        encoding="utf-8",
+    )
+    return [sys.executable, str(script)], log
+
+
+def _batches(log):
+    return [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def test_pending_tasks_are_persisted_and_sent_in_one_batch(tmp_path):
+    cmd, log = _stand_in(tmp_path)
+    path = tmp_path / "queue.json"
+    q = tq.TodoistQueue(path, command=cmd)
+    for n in range(3):
+        q.enqueue(f"task {n}", None, start=False)
+    assert q.depth() == 3
+    # A new instance (e.g. after a restart) sees the same queue on disk
+    q2 = tq.TodoistQueue(path, command=cmd, max_batch=10)
+    assert q2.depth() == 3
+    assert q2.drain_once() == 3
+    assert _batches(log) == [["task 0", "task 1", "task 2"]]
+    assert q2.depth() == 0
+    assert tq.TodoistQueue(path).depth() == 0
+
+
+def test_failed_tasks_back_off_and_end_up_dead(tmp_path):
+    cmd, log = _stand_in(tmp_path, fail={"bad"})
+    now = [1000.0]
+    q = tq.TodoistQueue(tmp_path / "q.json", command=cmd, base_delay=10, max_attempts=2, clock=lambda: now[0])
+    q.enqueue("good", None, start=False)
+    q.enqueue("bad", None, start=False)
+    assert q.drain_once() == 1
+    stats = q.stats()
+    assert stats["depth"] == 1 and stats["next_attempt_at"] == 1010.0
+    assert q.drain_once() == 0  # still backing off: nothing dispatched
+    now[0] = 1011.0
+    q.drain_once()
+    assert q.stats() == {"depth": 0, "dead": 1, "next_attempt_at": None}
+    assert _batches(log) == [["good", "bad"], ["bad"]]
+
+
+def test_dead_lettered_tasks_are_reported(tmp_path):
+    cmd, _log = _stand_in(tmp_path, fail={"bad"})
+    reported = []
+    q = tq.TodoistQueue(tmp_path / "q.json", command=cmd, base_delay=0, max_attempts=2, on_dead=reported.append)
+    q.enqueue("good", None, start=False)
+    q.enqueue("bad", None, start=False)
+    q.drain_once()
+    assert reported == []  # first failure is retried, not reported
+    q.drain_once()
+    assert [[e["summary"] for e in batch] for batch in reported] == [["bad"]]
+    assert reported[0][0]["last_error"] == "boom"
+
+
+def test_worker_drains_in_background(tmp_path):
+    cmd, log = _stand_in(tmp_path)
+    q = tq.TodoistQueue(tmp_path / "q.json", command=cmd)
+    q.enqueue("one", "NRA: x")
+    thread = q.start()
+    if thread is not None:
+        thread.join(10)
+    assert q.depth() == 0
+    assert _batches(log)[0] == ["one"]
+
+
+def test_command_override_env(monkeypatch):
+    monkeypatch.setenv(tq.ENV_CMD, "python fake.py --flag")
+    assert tq._default_command() == ["python", "fake.py", "--flag"]
+
+
+def test_instances_sharing_a_file_keep_each_others_tasks(tmp_path):
+    cmd, log = _stand_in(tmp_path)
+    path = tmp_path / "q.json"
+    a = tq.TodoistQueue(path, command=cmd)
+    b = tq.TodoistQueue(path, command=cmd)
+    a.enqueue("from a", None, start=False)
+    b.enqueue("from b", None, start=False)
+    assert a.depth() == b.depth() == 2
+    assert a.drain_once() == 2
+    b.enqueue("late b", None, start=False)
+    a.enqueue("late a", None, start=False)
+    assert b.drain_once() == 2
+    assert _batches(log) == [["from a", "from b"], ["late b", "late a"]]
+
+
+def test_in_flight_tasks_are_leased(tmp_path):
+    cmd, log = _stand_in(tmp_path)
+    path = tmp_path / "q.json"
+    a = tq.TodoistQueue(path, command=cmd)
+    b = tq.TodoistQueue(path, command=cmd)
+    a.enqueue("once", None, start=False)
+    seen = []
+
+    def _dispatch(batch):
+        seen.append([e["summary"] for e in batch])
+        assert b.drain_once() == 0  # another worker finds nothing due
+        return {e["id"]: (True, "") for e in batch}
+
+    a._dispatch = _dispatch
+    assert a.drain_once() == 1
+    assert seen == [["once"]] and b.depth() == 0
+
+
+def test_concurrent_enqueues_from_threads_and_processes(tmp_path):
+    import subprocess
+    import threading
+
+    path = tmp_path / "q.json"
+    src = str(Path(__file__).resolve().parents[2] / "src")
+    code = (
+        f"import sys; sys.path.insert(0, {src!r})\n"
+        "from prompt_automation.services import todoist_queue as tq\n"
+        f"q = tq.TodoistQueue({str(path)!r})\n"
+        "for n in range(10): q.enqueue(f'p{n}', None, start=False)\n"
+    )
+    proc = subprocess.Popen([sys.executable, "-c", code])
+    queues = [tq.TodoistQueue(path) for _ in range(3)]
+    threads = [
+        threading.Thread(target=lambda q=q, i=i: [q.enqueue(f"t{i}-{n}", None, start=False) for n in range(10)])
+        for i, q in enumerate(queues)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert proc.wait(30) == 0
+    assert tq.TodoistQueue(path).depth() == 40
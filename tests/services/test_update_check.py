@@ -0,0 +1,140 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import prompt_automation.dev as dev
+import prompt_automation.update as update
+import prompt_automation.updater as updater
+from prompt_automation.services import update_check
+
+
+@pytest.fixture
+def stub_server():
+    routes = {}
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = routes.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{srv.server_address[1]}"
+    yield base, routes
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def stubbed_updates(stub_server, tmp_path, monkeypatch):
+    base, routes = stub_server
+    routes["/pypi"] = json.dumps({"info": {"version": "99.0.0"}}).encode()
+    routes["/manifest"] = json.dumps(
+        {"version": "99.0.0", "files": {"data/new.txt": f"{base}/files/new.txt"}}
+    ).encode()
+    routes["/files/new.txt"] = b"fresh"
+    monkeypatch.setattr(updater, "PYPI_URL", f"{base}/pypi")
+    monkeypatch.setattr(updater, "STATE_PATH", tmp_path / "auto-update.json")
+    monkeypatch.setattr(updater, "_PLATFORM", "linux")
+    monkeypatch.setattr(updater, "_current_version", lambda: "1.0.0")
+    monkeypatch.setattr(updater, "have_pipx", lambda: False)
+    monkeypatch.setattr(update, "UPDATE_URL", f"{base}/manifest")
+    monkeypatch.setattr(update, "ROOT_DIR", tmp_path / "root")
+    monkeypatch.setattr(update, "_read_local_version", lambda: "1.0.0")
+    monkeypatch.delenv("PROMPT_AUTOMATION_AUTO_UPDATE", raising=False)
+    monkeypatch.setattr(dev, "is_dev_mode", lambda: False)
+    return tmp_path
+
+
+def test_worker_applies_updates_and_notifies(stubbed_updates, monkeypatch):
+    monkeypatch.delenv("PROMPT_AUTOMATION_MANIFEST_AUTO", raising=False)
+    seen = []
+    thread = update_check.start_update_checks(seen.append)
+    assert thread is not None and thread.name == "prompt-automation-update-check"
+    thread.join(10)
+    assert not thread.is_alive()
+    assert len(seen) == 2
+    assert "99.0.0 is available" in seen[0]
+    assert "applied" in seen[1]
+    assert (stubbed_updates / "root" / "data" / "new.txt").read_bytes() == b"fresh"
+    # The check is recorded so the next launch is rate limited.
+    assert json.loads((stubbed_updates / "auto-update.json").read_text())["last_version"] == "99.0.0"
+
+
+@pytest.mark.parametrize("upgrade_ok, expected", [(True, "was installed"), (False, "upgrade failed")])
+def test_installed_only_reported_when_pipx_upgrade_succeeds(stubbed_updates, monkeypatch, upgrade_ok, expected):
+    monkeypatch.setattr(updater, "have_pipx", lambda: True)
+    monkeypatch.setattr(updater, "_upgrade_via_pipx", lambda: upgrade_ok)
+    monkeypatch.setattr(update, "check_and_prompt", lambda *a, **k: None)
+    messages = update_check.run_update_checks()
+    assert len(messages) == 1 and expected in messages[0]
+
+
+def test_notifications_from_worker_go_through_ui_queue(monkeypatch):
+    from prompt_automation.gui import notifications, ui_queue
+
+    class _Root:
+        def __init__(self):
+            self.calls = []
+
+        def after(self, ms, fn):
+            self.calls.append(threading.current_thread())
+
+    root = _Root()
+    ui_queue.install(root)
+    shown = []
+    monkeypatch.setattr(notifications, "_show", lambda r, msg, t: shown.append(msg))
+    t = threading.Thread(target=notifications.show_notification, args=(root, "hi"))
+    t.start()
+    t.join()
+    assert root.calls == [threading.current_thread()]  # only install() touched the root
+    getattr(root, ui_queue._ATTR).get_nowait()()
+    assert shown == ["hi"]
+
+
+def test_interactive_manifest_mode_never_prompts_in_background(stubbed_updates, monkeypatch):
+    monkeypatch.setenv("PROMPT_AUTOMATION_MANIFEST_AUTO", "0")
+    monkeypatch.setattr("builtins.input", lambda *a: pytest.fail("background check prompted"))
+    messages = update_check.run_update_checks()
+    assert messages[-1].endswith("Run `prompt-automation --update` to review it.")
+    assert not (stubbed_updates / "root").exists()
+
+
+def test_dev_mode_skips_worker(monkeypatch):
+    monkeypatch.setattr(dev, "is_dev_mode", lambda: True)
+    assert update_check.start_update_checks() is None
+
+
+def test_gui_launch_does_not_wait_for_update_checks(monkeypatch, tmp_path):
+    import prompt_automation.cli as cli_pkg
+    import prompt_automation.gui as gui_pkg
+    import prompt_automation.gui.single_window.singleton as singleton
+
+    calls = []
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    monkeypatch.setattr(dev, "is_dev_mode", lambda: False)
+    monkeypatch.setattr(cli_pkg, "check_dependencies", lambda require_fzf=True: True)
+    monkeypatch.setattr(cli_pkg, "ensure_unique_ids", lambda *_: None)
+    monkeypatch.setattr(singleton, "connect_and_focus_if_running", lambda: False)
+    monkeypatch.setattr(updater, "check_for_update", lambda: calls.append("pypi"))
+    monkeypatch.setattr(updater, "check_and_upgrade", lambda: (calls.append("pypi"), False))
+    monkeypatch.setattr(update, "check_and_prompt", lambda *a, **k: calls.append("manifest"))
+    monkeypatch.setattr(gui_pkg, "run", lambda: calls.append("gui"))
+    cli_pkg.PromptCLI().main(["--gui"])
+    assert calls == ["gui"]
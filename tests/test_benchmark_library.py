@@ -0,0 +1,65 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.library import build_library
+from prompt_automation.renderer import load_template, validate_template
+from prompt_automation.services.hierarchy import TemplateHierarchyScanner
+
+
+def _templates(styles: Path):
+    return [p for p in styles.rglob("*.json") if p.name not in ("globals.json", "settings.json")]
+
+
+def test_generated_library_shape(tmp_path):
+    styles = build_library(
+        tmp_path,
+        40,
+        per_folder=3,
+        depth=3,
+        fanout=2,
+        placeholders=10,
+        file_ratio=0.5,
+        reference_files=2,
+        reference_kb=8,
+        override_ratio=0.5,
+        seed=7,
+    )
+    paths = _templates(styles)
+    assert len(paths) == 40
+    assert {len(p.relative_to(styles).parts) for p in paths} == {4}
+    data = [load_template(p) for p in paths]
+    assert all(validate_template(d) for d in data)
+    assert sorted(d["id"] for d in data) == list(range(1, 41))
+    assert all(len({ph["name"] for ph in d["placeholders"]}) == len(d["placeholders"]) for d in data)
+    assert all(d["metadata"]["path"] == p.relative_to(styles).as_posix() for d, p in zip(data, paths))
+    with_files = [d for d in data if any(ph.get("type") == "file" for ph in d["placeholders"])]
+    assert 0 < len(with_files) < 40
+
+    overrides = json.loads((tmp_path / "placeholder-overrides.json").read_text())
+    assert 0 < len(overrides["templates"]) < 40
+    for entry in overrides["templates"].values():
+        if "spec_file" in entry:
+            assert Path(entry["spec_file"]["path"]).stat().st_size >= 8 * 1024
+    assert Path(overrides["global_files"]["reference_file"]).is_file()
+
+    tree = TemplateHierarchyScanner(styles).scan()
+    assert [c.name for c in tree.children][:2] == ["Style-000", "Style-001"]
+
+
+def test_generation_is_deterministic(tmp_path):
+    a = build_library(tmp_path / "a", 20, file_ratio=0.5, reference_files=1, reference_kb=1, seed=3)
+    b = build_library(tmp_path / "b", 20, file_ratio=0.5, reference_files=1, reference_kb=1, seed=3)
+    for p in _templates(a):
+        assert p.read_text() == (b / p.relative_to(a)).read_text()
+
+
+def test_rejects_invalid_shape(tmp_path):
+    with pytest.raises(ValueError):
+        build_library(tmp_path, 10, fanout=0)
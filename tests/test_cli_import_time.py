@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+# Modules the ``--focus`` fast path must not import: template/menu
+# machinery, persistence, update checks and GUI toolkits.
+HEAVY = (
+    "prompt_automation.menus",
+    "prompt_automation.variables",
+    "prompt_automation.renderer",
+    "prompt_automation.update",
+    "prompt_automation.updater",
+    "prompt_automation.logger",
+    "prompt_automation.gui.controller",
+    "prompt_automation.cli.dependencies",
+    "sqlite3",
+    "tkinter",
+    "urllib.request",
+    "pyperclip",
+    "dateparser",
+)
+
+# Cumulative import budget for the entry point plus the singleton probe.
+# Generous so slow CI machines pass; the eager tree was several times this.
+BUDGET_US = 150_000
+
+
+def _import_profile() -> dict[str, int]:
+    code = "import prompt_automation.cli, prompt_automation.gui.single_window.singleton"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(SRC), os.environ.get("PYTHONPATH", "")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cum, name = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        if cum.isdigit():
+            cumulative[name] = int(cum)
+    return cumulative
+
+
+def test_cli_entry_point_imports_stay_light():
+    profile = _import_profile()
+    assert "prompt_automation.cli.controller" in profile
+    loaded = sorted(m for m in HEAVY if m in profile)
+    assert loaded == [], f"eagerly imported: {loaded}"
+    total = profile["prompt_automation.cli"] + profile.get("prompt_automation.gui.single_window.singleton", 0)
+    assert total < BUDGET_US, f"CLI import took {total / 1000:.1f}ms (budget {BUDGET_US / 1000:.0f}ms)"
+
+
+def test_lazy_reexports_still_resolve():
+    import prompt_automation.cli as cli_pkg
+    from prompt_automation.cli import controller
+
+    assert callable(cli_pkg.check_dependencies)
+    assert cli_pkg.manifest_update is cli_pkg.update
+    assert controller.storage.__name__ == "prompt_automation.variables.storage"
+    assert callable(controller.PromptCLI.check_dependencies)
@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from prompt_automation.cli import dependencies
+
+
+def _install_probe(monkeypatch, tmp_path, results):
+    calls = []
+
+    def _probe(require_fzf):
+        calls.append(require_fzf)
+        result = results.pop(0)
+        return result if isinstance(result, tuple) else (result, result)
+
+    monkeypatch.setattr(dependencies, "_CACHE_FILE", tmp_path / "dependency-cache.json")
+    monkeypatch.setattr(dependencies, "_probe_dependencies", _probe)
+    monkeypatch.delenv(dependencies._CACHE_TTL_ENV, raising=False)
+    return calls
+
+
+def test_success_is_cached_per_environment(monkeypatch, tmp_path):
+    calls = _install_probe(monkeypatch, tmp_path, [True, True, True])
+    assert dependencies.check_dependencies(require_fzf=False)
+    assert dependencies.check_dependencies(require_fzf=False)
+    assert calls == [False]
+    # Different probe inputs (PATH, require_fzf) miss the cache.
+    monkeypatch.setenv("PATH", "/nonexistent-bin")
+    assert dependencies.check_dependencies(require_fzf=False)
+    assert dependencies.check_dependencies(require_fzf=True)
+    assert calls == [False, False, True]
+
+
+def test_failures_are_reprobed(monkeypatch, tmp_path):
+    calls = _install_probe(monkeypatch, tmp_path, [False, False, True])
+    assert not dependencies.check_dependencies()
+    assert not dependencies.check_dependencies()
+    assert dependencies.check_dependencies()
+    assert len(calls) == 3
+
+
+def test_degraded_wsl_interop_is_reprobed(monkeypatch, tmp_path):
+    calls = _install_probe(monkeypatch, tmp_path, [(True, False), (True, True), (True, True)])
+    assert dependencies.check_dependencies()
+    assert dependencies.check_dependencies()
+    assert dependencies.check_dependencies()
+    assert len(calls) == 2
+
+
+def test_ttl_expiry_and_disable(monkeypatch, tmp_path):
+    calls = _install_probe(monkeypatch, tmp_path, [True, True, True, True])
+    clock = [1_000_000.0]
+    monkeypatch.setattr(dependencies.time, "time", lambda: clock[0])
+    monkeypatch.setenv(dependencies._CACHE_TTL_ENV, "60")
+    dependencies.check_dependencies()
+    clock[0] += 30
+    dependencies.check_dependencies()
+    assert len(calls) == 1
+    clock[0] += 31
+    dependencies.check_dependencies()
+    assert len(calls) == 2
+    monkeypatch.setenv(dependencies._CACHE_TTL_ENV, "0")
+    dependencies.check_dependencies()
+    dependencies.check_dependencies()
+    assert len(calls) == 4
+
+
+def test_corrupt_cache_is_ignored(monkeypatch, tmp_path):
+    calls = _install_probe(monkeypatch, tmp_path, [True])
+    (tmp_path / "dependency-cache.json").write_text("{not json")
+    assert dependencies.check_dependencies()
+    assert calls == [True]
+    assert dependencies.check_dependencies()
@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from prompt_automation import file_reader
+from prompt_automation.menus.render_pipeline import apply_file_placeholders
+from prompt_automation.file_reader import read_file_window
+
+LINES = [f"line {i:04d} ✓\n" for i in range(1, 1001)]
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    f = tmp_path / "app.log"
+    f.write_text("".join(LINES), encoding="utf-8")
+    return f
+
+
+def test_head_lines_window(log_file):
+    out = read_file_window(str(log_file), max_lines=3)
+    assert out.splitlines()[:3] == ["line 0001 ✓", "line 0002 ✓", "line 0003 ✓"]
+    assert out.splitlines()[3].startswith("[... truncated app.log")
+    assert "first 3 lines" in out
+
+
+def test_tail_lines_window(log_file):
+    out = read_file_window(str(log_file), max_lines=2, window="tail")
+    assert out.splitlines() == [out.splitlines()[0], "line 0999 ✓", "line 1000 ✓"]
+    assert "last 2 lines" in out.splitlines()[0]
+
+
+def test_both_windows_split_budget(log_file):
+    out = read_file_window(str(log_file), max_lines=5, window="both").splitlines()
+    assert out[:3] == ["line 0001 ✓", "line 0002 ✓", "line 0003 ✓"]
+    assert out[3].startswith("[... truncated")
+    assert out[4:] == ["line 0999 ✓", "line 1000 ✓"]
+
+
+def test_byte_and_char_budgets(log_file):
+    out = read_file_window(str(log_file), max_bytes=100, window="tail")
+    body = out.split("\n", 1)[1]
+    assert len(body.encode("utf-8")) <= 100 and body.endswith("line 1000 ✓\n")
+    out = read_file_window(str(log_file), max_chars=20, marker="<cut>")
+    assert out == "line 0001 ✓\nline 000\n<cut>"
+
+
+def test_small_file_returned_unchanged(tmp_path):
+    f = tmp_path / "small.txt"
+    f.write_text("a\nb\n", encoding="utf-8")
+    assert read_file_window(str(f), max_lines=2, max_bytes=100, window="both") == "a\nb\n"
+    assert read_file_window(str(f)) == "a\nb\n"
+
+
+def test_streams_only_needed_bytes(tmp_path, monkeypatch):
+    f = tmp_path / "big.log"
+    f.write_bytes(("x" * 99 + "\n").encode() * 100_000)  # ~10 MB
+    monkeypatch.setattr(file_reader, "read_file_safe", lambda *_: pytest.fail("full read"))
+    out = read_file_window(str(f), max_lines=10, window="tail")
+    assert out.count("x" * 99) == 10
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-le", "utf-16-be", "utf-8-sig"])
+def test_windows_respect_encodings(tmp_path, encoding):
+    f = tmp_path / "enc.txt"
+    f.write_bytes("".join(LINES).encode(encoding))
+    head = read_file_window(str(f), max_lines=1)
+    tail = read_file_window(str(f), max_bytes=64, window="tail")
+    assert head.startswith("line 0001 ✓\n[... truncated")
+    assert tail.endswith("line 1000 ✓\n") and "�" not in tail
+
+
+def test_file_placeholder_applies_limits(log_file):
+    tmpl = {"template": ["{{log}}", "{{notes}}"]}
+    placeholders = [
+        {"name": "log", "type": "file", "max_lines": 2, "window": "tail", "truncation_marker": "[snip]"},
+        {"name": "notes", "type": "file", "max_lines": "bogus"},
+    ]
+    raw_vars = {"log": str(log_file), "notes": str(log_file)}
+    vars = {}
+    apply_file_placeholders(tmpl, raw_vars, vars, placeholders)
+    assert vars["log"] == "[snip]\nline 0999 ✓\nline 1000 ✓\n"
+    assert vars["notes"] == "".join(LINES)
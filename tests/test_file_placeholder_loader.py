@@ -0,0 +1,86 @@
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from prompt_automation import render_stats
+from prompt_automation.menus.render_pipeline import apply_file_placeholders
+from prompt_automation.menus.render_pipeline import file_placeholders as fp
+from prompt_automation.file_reader import clear_file_cache
+
+
+def _files(tmp_path, n):
+    paths = []
+    for i in range(n):
+        f = tmp_path / f"f{i}.txt"
+        f.write_text(f"content {i}\n" * 3)
+        paths.append(str(f))
+    return paths
+
+
+def test_reads_overlap(tmp_path, monkeypatch):
+    paths = _files(tmp_path, 4)
+    threads = set()
+
+    def slow_read(path):
+        threads.add(threading.get_ident())
+        time.sleep(0.1)
+        return Path(path).read_text()
+
+    monkeypatch.setattr(fp, "read_file_safe", slow_read)
+    start = time.perf_counter()
+    out = fp.load_files([(p, {}) for p in paths])
+    assert time.perf_counter() - start < 0.3
+    assert out == [Path(p).read_text() for p in paths]
+    assert len(threads) == 4
+
+
+def test_duplicates_read_once_and_order_kept(tmp_path, monkeypatch):
+    a, b = _files(tmp_path, 2)
+    calls = []
+    monkeypatch.setattr(fp, "read_file_safe", lambda p: calls.append(p) or Path(p).read_text())
+    out = fp.load_files([(a, {}), (b, {}), (a, {}), (a, {"max_lines": 1, "window": "head"})])
+    assert sorted(calls) == sorted([a, b])
+    assert out[0] == out[2] == Path(a).read_text()
+    assert out[1] == Path(b).read_text()
+    assert out[3].startswith("content 0\n[... truncated")
+
+
+def test_template_with_several_files_and_global_reference(tmp_path, monkeypatch):
+    a, b, ref = _files(tmp_path, 3)
+    import prompt_automation.menus as menus
+
+    monkeypatch.setattr(menus, "get_global_reference_file", lambda: ref)
+    events = []
+    monkeypatch.setattr(fp._log, "debug", lambda fmt, payload: events.append(payload))
+    tmpl = {"template": ["{{a}} {{a_path}}", "{{b}}", "{{reference_file_content}} {{reference_file_path}}"]}
+    placeholders = [{"name": "a", "type": "file"}, {"name": "b", "type": "file"}, {"name": "c", "type": "file"}]
+    vars = {}
+    apply_file_placeholders(tmpl, {"a": a, "b": b}, vars, placeholders)
+    assert vars["a"] == Path(a).read_text() and vars["a_path"] == a
+    assert vars["b"] == Path(b).read_text()
+    assert vars["c"] == ""
+    assert vars["reference_file_content"] == Path(ref).read_text()
+    assert vars["reference_file_path"] == ref
+    (event,) = events
+    assert event["event"] == "file_placeholders.load"
+    assert [f["path"] for f in event["files"]] == [a, b, ref]
+    assert all(f["duration_ms"] >= 0 and f["chars"] for f in event["files"])
+
+
+def test_cache_counters_follow_render_across_threads(tmp_path, monkeypatch):
+    monkeypatch.setenv(render_stats.ENV_VAR, str(tmp_path / "stats.jsonl"))
+    clear_file_cache()
+    paths = _files(tmp_path, 3)
+    old = time.time() - 60
+    for p in paths:
+        os.utime(p, (old, old))
+    with render_stats.collect("unit") as stats:
+        with render_stats.span("apply_file_placeholders"):
+            fp.load_files([(p, {}) for p in paths])
+            fp.load_files([(p, {}) for p in paths])
+    report = stats.report()
+    assert (report["cache_hits"], report["cache_misses"]) == (3, 3)
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from prompt_automation import render_stats
+from prompt_automation.menus.render_pipeline import markdown_render as mr
+
+
+PH = [{"name": "reference_file", "render": "markdown"}]
+
+
+def _tmpl(*lines):
+    return {"template": list(lines)}
+
+
+def test_html_conversion_is_memoized(monkeypatch, tmp_path):
+    monkeypatch.setenv(render_stats.ENV_VAR, str(tmp_path / "stats.jsonl"))
+    mr.clear_html_cache()
+    calls = []
+    real = mr._convert_md
+    monkeypatch.setattr(mr, "_convert_md", lambda t: calls.append(t) or real(t))
+    src = "# Title\n\nSome **bold** text\n" * 50
+    with render_stats.collect("unit") as stats:
+        with render_stats.span("apply_markdown_rendering"):
+            first = mr._md_to_html(src)
+            second = mr._md_to_html("".join(list(src)))  # equal content, new object
+    assert first == second
+    assert calls == [src]
+    report = stats.report()
+    assert (report["cache_hits"], report["cache_misses"]) == (1, 1)
+
+
+def test_html_cache_is_bounded(monkeypatch):
+    mr.clear_html_cache()
+    monkeypatch.setattr(mr, "_HTML_CACHE_MAX_ENTRIES", 2)
+    for i in range(4):
+        mr._md_to_html(f"# doc {i}")
+    assert list(mr._html_cache) == ["# doc 2", "# doc 3"]
+    monkeypatch.setattr(mr, "_HTML_CACHE_MAX_CHARS", 10)
+    mr._md_to_html("x" * 50)  # larger than the whole budget: not stored
+    assert "x" * 50 not in mr._html_cache
+
+
+def test_occurrences_are_computed_once_per_template():
+    mr._occurrences.cache_clear()
+    lines = ["Intro", "{{reference_file}}", "Outro", ""]
+    for _ in range(3):
+        vars = {"reference_file": "**b**"}
+        mr.apply_markdown_rendering(_tmpl(*lines), vars, PH)
+        assert vars["reference_file"].startswith("<details>")
+    info = mr._occurrences.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_last_line_and_no_markdown_placeholders():
+    vars = {"reference_file": "# H"}
+    mr.apply_markdown_rendering(_tmpl("Intro", "{{reference_file}}"), vars, PH)
+    assert vars["reference_file"] == "<h1>H</h1>"
+    vars = {"reference_file": "# H"}
+    mr.apply_markdown_rendering(_tmpl("{{reference_file}}", "x"), vars, [{"name": "reference_file"}])
+    assert vars["reference_file"] == "# H"
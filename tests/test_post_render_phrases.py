@@ -0,0 +1,120 @@
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from prompt_automation.menus.render_pipeline import post_render
+from prompt_automation.menus.render_pipeline.post_render import apply_post_render
+
+
+def _legacy_remove(rendered, placeholders, vars):
+    """The per-phrase, two-regex implementation the combined pattern replaces."""
+    for ph in placeholders:
+        name = ph.get("name")
+        val = vars.get(name)
+        if not name or (val is not None and str(val).strip()):
+            continue
+        phrases = ph.get("remove_if_empty") or ph.get("remove_if_empty_phrases")
+        if not phrases:
+            continue
+        if isinstance(phrases, str):
+            phrases = [phrases]
+        for phrase in phrases:
+            if not isinstance(phrase, str) or not phrase.strip():
+                continue
+            for pat in (
+                rf"(\s|^){re.escape(phrase.strip())}(?=\s*[.,;:!?])",
+                rf"(\s|^){re.escape(phrase.strip())}\s+",
+            ):
+                rendered = re.compile(pat, re.IGNORECASE).sub(
+                    lambda m: m.group(1) if m.group(1).isspace() else "", rendered
+                )
+    return rendered
+
+
+PLACEHOLDERS = [
+    {"name": "optional_line", "remove_if_empty": "Optional:"},
+    {"name": "extra", "remove_if_empty": ["Extra", "  also see  ", ""]},
+    {"name": "ctx", "remove_if_empty_phrases": ["Context (if any)", "c++ notes"]},
+    {"name": "filled", "remove_if_empty": "Filled"},
+    {"remove_if_empty": "Nameless"},
+]
+
+FIXTURES = [
+    # golden render fixture (tests/test_render_golden.py)
+    "Hello World\n\nTasks:\n- [ ] task one\n- [ ] task two\n\nOptional: \n"
+    "Reference file path: ref.txt\nReference file content: REF CONTENT",
+    "Extra.",
+    "Extra details follow. Please also see  the docs, EXTRA!",
+    "Context (if any): \nUse c++ notes ; and Filled values. Nameless stays.",
+    "Line one\n  optional:   \nextra\textra\n",
+    "Optional:Extra,Context (if any)?",
+    "Prefix-Extra stays; Extraordinary stays.",
+]
+
+
+@pytest.mark.parametrize("text", FIXTURES)
+def test_combined_pattern_matches_legacy_output(text):
+    vars = {"optional_line": "", "extra": None, "ctx": "  ", "filled": "yes"}
+    tmpl = {"template": [], "metadata": {"trim_blanks": False}}
+    assert apply_post_render(text, tmpl, PLACEHOLDERS, vars, set()) == _legacy_remove(
+        text, PLACEHOLDERS, vars
+    )
+
+
+def test_randomized_texts_match_legacy_output():
+    rnd = random.Random(7)
+    tokens = ["Optional:", "extra", "EXTRA", "also see", "see", "Context (if any)", "c++ notes",
+              "word", "x", "foo", "a.b", ".", ",", "?", ":", "::", " ", "  ", "\n", "\t"]
+    placeholders = PLACEHOLDERS + [
+        {"name": "nested", "remove_if_empty": ["see"]},
+        {"name": "punct", "remove_if_empty": [":", "foo", "a.b"]},
+    ]
+    for vars in (
+        {"optional_line": "", "ctx": "", "nested": "set", "punct": "set"},
+        {"optional_line": "", "ctx": "", "punct": "set"},
+        {"optional_line": "", "ctx": "", "nested": "set"},
+    ):
+        for _ in range(3000):
+            text = "".join(rnd.choice(tokens) for _ in range(rnd.randint(1, 12)))
+            phrases = post_render._empty_phrases(placeholders, vars)
+            assert post_render._remove_phrases(text, phrases) == _legacy_remove(text, placeholders, vars), text
+
+
+def _sequential_remove(text, phrases):
+    placeholders = [{"name": "p", "remove_if_empty": list(phrases)}]
+    return _legacy_remove(text, placeholders, {"p": ""})
+
+
+@pytest.mark.parametrize(
+    "text, phrases, expected",
+    [
+        ("Please see attached the notes.", ("attached", "see the"), "Please notes."),
+        ("b ab a\n", ("ab", "b a"), ""),
+    ],
+)
+def test_multiword_phrase_joined_by_earlier_removal(text, phrases, expected):
+    assert _sequential_remove(text, phrases) == expected
+    assert post_render._remove_phrases(text, phrases) == expected
+
+
+def test_pattern_compiled_once_per_phrase_set():
+    post_render._phrase_rules.cache_clear()
+    tmpl = {"template": [], "metadata": {"trim_blanks": False}}
+    for _ in range(5):
+        apply_post_render("Optional: x", tmpl, PLACEHOLDERS, {"optional_line": ""}, set())
+    info = post_render._phrase_rules.cache_info()
+    assert (info.misses, info.hits) == (1, 4)
+
+
+def test_no_empty_placeholders_leaves_text_untouched():
+    tmpl = {"template": [], "metadata": {"trim_blanks": False}}
+    vars = {"optional_line": "x", "extra": "x", "ctx": "x", "filled": "x"}
+    text = "Optional: Extra Context (if any)"
+    post_render._phrase_rules.cache_clear()
+    assert apply_post_render(text, tmpl, PLACEHOLDERS, vars, set()) == text
+    assert post_render._phrase_rules.cache_info().misses == 0
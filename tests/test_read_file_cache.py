@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from prompt_automation import file_reader, render_stats
+from prompt_automation.file_reader import clear_file_cache, file_cache_stats, read_file_safe
+
+
+def _write_old(path: Path, text: str, age: float = 60.0) -> None:
+    path.write_text(text, encoding="utf-8")
+    old = time.time() - age
+    os.utime(path, (old, old))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_file_cache()
+    yield
+    clear_file_cache()
+
+
+def test_repeat_reads_hit_until_file_changes(tmp_path, monkeypatch):
+    f = tmp_path / "ref.md"
+    _write_old(f, "first ✓")
+    calls = []
+    real = file_reader._read_file_uncached
+    monkeypatch.setattr(file_reader, "_read_file_uncached", lambda p, path: calls.append(path) or real(p, path))
+    assert read_file_safe(str(f)) == "first ✓"
+    assert read_file_safe(str(f)) == "first ✓"
+    assert len(calls) == 1
+    _write_old(f, "second version", age=30.0)
+    assert read_file_safe(str(f)) == "second version"
+    assert len(calls) == 2
+    stats = file_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+
+
+def test_recently_modified_files_are_not_cached(tmp_path):
+    f = tmp_path / "fresh.txt"
+    f.write_text("aaa", encoding="utf-8")
+    assert read_file_safe(str(f)) == "aaa"
+    f.write_text("bbb", encoding="utf-8")
+    assert read_file_safe(str(f)) == "bbb"
+    assert file_cache_stats()["entries"] == 0
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_reader._CONTENT_CACHE, "max_bytes", 250)
+    files = []
+    for name in "abc":
+        f = tmp_path / f"{name}.txt"
+        _write_old(f, name * 100)
+        files.append(f)
+    read_file_safe(str(files[0]))
+    read_file_safe(str(files[1]))
+    read_file_safe(str(files[0]))  # a becomes most recent
+    read_file_safe(str(files[2]))  # evicts b
+    stats = file_cache_stats()
+    assert stats["entries"] == 2 and stats["bytes"] <= 250 and stats["evictions"] == 1
+    read_file_safe(str(files[0]))
+    assert file_cache_stats()["hits"] == 2
+
+
+def test_missing_files_and_render_stats(tmp_path, monkeypatch):
+    assert read_file_safe(str(tmp_path / "missing.txt")) == ""
+    f = tmp_path / "ref.txt"
+    _write_old(f, "content")
+    monkeypatch.setenv(render_stats.ENV_VAR, str(tmp_path / "stats.jsonl"))
+    with render_stats.collect("t") as stats:
+        with render_stats.span("apply_file_placeholders"):
+            read_file_safe(str(f))
+            read_file_safe(str(f))
+    (stage,) = stats.report()["stages"]
+    assert (stage["cache_hits"], stage["cache_misses"]) == (1, 1)
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from prompt_automation import file_reader
+from prompt_automation.file_reader import _sniff_encoding, read_file_safe
+
+TEXT = "Résumé – naïve café 👍\nSecond line\n" * 20
+
+
+@pytest.mark.parametrize(
+    "encoding,sniffed",
+    [
+        ("utf-8", None),
+        ("utf-8-sig", "utf-8-sig"),
+        ("utf-16", "utf-16"),
+        ("utf-16-le", "utf-16-le"),
+        ("utf-16-be", "utf-16-be"),
+    ],
+)
+def test_unicode_encodings_round_trip(tmp_path, encoding, sniffed):
+    raw = TEXT.encode(encoding)
+    f = tmp_path / f"ref-{encoding}.txt"
+    f.write_bytes(raw)
+    assert _sniff_encoding(raw) == sniffed
+    assert read_file_safe(str(f)) == TEXT
+
+
+def test_cp1252_decoded_without_utf16_misread(tmp_path):
+    text = "Smart “quotes” – and café\n" * 10
+    raw = text.encode("cp1252")
+    assert len(raw) % 2 == 0  # used to decode "successfully" as utf-16 garbage
+    f = tmp_path / "legacy.txt"
+    f.write_bytes(raw)
+    assert _sniff_encoding(raw) is None
+    assert read_file_safe(str(f)) == text
+
+
+def test_large_utf16_file_decoded_once(tmp_path, monkeypatch):
+    f = tmp_path / "big.txt"
+    f.write_bytes(("line of text\n" * 50_000).encode("utf-16-le"))
+    seen = []
+
+    class _Bytes(bytes):
+        def decode(self, encoding="utf-8", errors="strict"):
+            seen.append(encoding)
+            return bytes.decode(self, encoding, errors)
+
+    monkeypatch.setattr(Path, "read_bytes", lambda self: _Bytes(open(self, "rb").read()))
+    assert file_reader._read_file_uncached(f, str(f)).startswith("line of text\n")
+    assert seen == ["utf-16-le"]
+
+
+def test_binary_noise_is_not_sniffed_as_utf16():
+    assert _sniff_encoding(bytes(range(256)) * 8) is None
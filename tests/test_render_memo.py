@@ -0,0 +1,116 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import prompt_automation.menus as menus
+from prompt_automation.menus import render_memo
+
+
+@pytest.fixture
+def memo(tmp_path, monkeypatch):
+    monkeypatch.setenv(render_memo.ENV_VAR, "1")
+    monkeypatch.setattr(render_memo, "CACHE_DIR", tmp_path / "render-cache")
+    monkeypatch.setattr(menus, "PROMPTS_DIR", tmp_path)
+    monkeypatch.setattr(menus, "get_global_reference_file", lambda: None)
+    render_memo.clear()
+    calls = []
+    real = menus._render_template
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(menus, "_render_template", counting)
+    yield calls
+    render_memo.clear()
+
+
+def _tmpl(*lines, **extra):
+    return {"title": "Static", "template": list(lines), "placeholders": [], **extra}
+
+
+def _new_process():
+    render_memo._recent.clear()
+
+
+def test_placeholder_free_render_is_memoized_across_processes(memo, tmp_path):
+    (tmp_path / "globals.json").write_text(json.dumps({"global_placeholders": {"think_deeply": "THINK"}}))
+    first = menus.render_template(_tmpl("Hello", "World"), {})
+    _new_process()
+    second = menus.render_template(_tmpl("Hello", "World"), {})
+    assert first == second == "Hello\nWorld\nTHINK"
+    assert len(memo) == 1
+    assert len(list((tmp_path / "render-cache").glob("*.json"))) == 1
+
+
+def test_inputs_invalidate(memo, tmp_path, monkeypatch):
+    g = tmp_path / "globals.json"
+    g.write_text(json.dumps({"global_placeholders": {"think_deeply": "A"}}))
+    assert menus.render_template(_tmpl("x"), {}).endswith("A")
+    g.write_text(json.dumps({"global_placeholders": {"think_deeply": "BB"}}))
+    assert menus.render_template(_tmpl("x"), {}).endswith("BB")
+    assert menus.render_template(_tmpl("y"), {}).startswith("y")  # template edited
+    monkeypatch.setenv("PROMPT_AUTOMATION_TRIM_BLANKS", "0")
+    menus.render_template(_tmpl("x"), {})
+    assert len(memo) == 4
+
+    ref = tmp_path / "ref.md"
+    ref.write_text("v1")
+    monkeypatch.setattr(menus, "get_global_reference_file", lambda: str(ref))
+    assert menus.render_template(_tmpl("{{reference_file}}"), {}).startswith("v1")
+    ref.write_text("v2!")
+    assert menus.render_template(_tmpl("{{reference_file}}"), {}).startswith("v2!")
+    assert menus.render_template(_tmpl("{{reference_file}}"), {}).startswith("v2!")
+    assert len(memo) == 6
+
+
+def test_hit_restores_globals_and_vars(memo, tmp_path):
+    (tmp_path / "globals.json").write_text(json.dumps({"global_placeholders": {"think_deeply": "T"}}))
+    menus.render_template(_tmpl("a"), return_vars=True)
+    tmpl = _tmpl("a")
+    text, vars = menus.render_template(tmpl, return_vars=True)
+    assert len(memo) == 1
+    assert text == "a\nT" and vars == {}
+    assert tmpl["global_placeholders"]["think_deeply"] == "T"
+
+
+@pytest.mark.parametrize(
+    "tmpl, values",
+    [
+        (_tmpl("{{x}}"), {"x": "1"}),  # caller values
+        ({"template": ["{{x}}"], "placeholders": [{"name": "x"}]}, {"x": "1"}),  # inputs
+        ({"template": ["a"], "placeholders": [{"name": "reminder_x"}]}, None),  # may prompt
+    ],
+)
+def test_not_memoized(memo, tmpl, values):
+    assert render_memo.memo_key(tmpl, values) is None
+
+
+def test_disabled(memo, monkeypatch):
+    monkeypatch.setenv(render_memo.ENV_VAR, "0")
+    menus.render_template(_tmpl("a"), {})
+    menus.render_template(_tmpl("a"), {})
+    assert len(memo) == 2
+
+
+def test_one_file_per_entry_pruned_by_count_and_bytes(memo, tmp_path, monkeypatch):
+    import os
+
+    cache = tmp_path / "render-cache"
+    monkeypatch.setattr(render_memo, "MAX_ENTRIES", 3)
+    for i in range(5):
+        render_memo.store(f"k{i}", f"text {i}", None, None)
+        os.utime(cache / f"k{i}.json", ns=(i * 10**9, i * 10**9))
+    render_memo.store("k5", "text 5", None, None)
+    assert sorted(p.stem for p in cache.glob("*.json")) == ["k3", "k4", "k5"]
+
+    monkeypatch.setattr(render_memo, "MAX_TOTAL_BYTES", 300)
+    render_memo.store("big", "x" * 200, None, None)
+    assert [p.stem for p in cache.glob("*.json")] == ["big"]
+    _new_process()
+    assert render_memo.lookup("big")["text"] == "x" * 200
+    assert render_memo.lookup("k5") is None
@@ -0,0 +1,86 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import prompt_automation.cli as cli_mod
+import prompt_automation.cli.controller as controller
+from prompt_automation import render_stats
+from prompt_automation.menus import render_template
+
+STAGES = [
+    "globals",
+    "context_file",
+    "apply_file_placeholders",
+    "apply_defaults",
+    "apply_global_placeholders",
+    "apply_formatting",
+    "apply_markdown_rendering",
+    "fill_placeholders",
+    "apply_post_render",
+]
+
+
+def _template(ref):
+    return {
+        "id": 9001,
+        "template": ["Title: {{title}}", "{{notes}}", "{{ref}}"],
+        "placeholders": [
+            {"name": "title"},
+            {"name": "notes", "format": "list"},
+            {"name": "ref", "type": "file"},
+        ],
+    }
+
+
+def test_render_records_stage_spans(monkeypatch, tmp_path):
+    ref = tmp_path / "ref.txt"
+    ref.write_text("reference body ✓\n" * 50, encoding="utf-8")
+    out = tmp_path / "stats.jsonl"
+    monkeypatch.setenv(render_stats.ENV_VAR, str(out))
+    rendered = render_template(_template(ref), values={"title": "T", "notes": "a\nb", "ref": str(ref)})
+    report = json.loads(out.read_text().splitlines()[-1])
+    assert report["event"] == "render.stats"
+    assert report["template_id"] == 9001
+    assert [s["name"] for s in report["stages"]] == STAGES
+    stages = {s["name"]: s for s in report["stages"]}
+    assert stages["apply_file_placeholders"]["bytes_out"] > stages["apply_file_placeholders"]["bytes_in"]
+    assert stages["apply_post_render"]["bytes_out"] == len(rendered.encode("utf-8"))
+    assert report["total_ms"] >= sum(s["duration_ms"] for s in report["stages"]) * 0.5
+    assert render_stats.recent()[-1] == report
+
+
+def test_disabled_records_nothing(monkeypatch, capsys):
+    monkeypatch.delenv(render_stats.ENV_VAR, raising=False)
+    before = len(render_stats.recent())
+    render_template({"template": ["{{a}}"], "placeholders": [{"name": "a"}]}, values={"a": "x"})
+    assert len(render_stats.recent()) == before
+    assert capsys.readouterr().err == ""
+
+
+def test_cache_events_attach_to_active_span(monkeypatch):
+    monkeypatch.setenv(render_stats.ENV_VAR, "1")
+    render_stats.cache_hit()  # outside a render: ignored
+    with render_stats.collect("t") as stats:
+        with render_stats.span("outer"):
+            render_stats.cache_miss()
+            with render_stats.span("inner"):
+                render_stats.cache_hit()
+                render_stats.cache_hit()
+    report = stats.report()
+    assert [(s["name"], s["cache_hits"], s["cache_misses"]) for s in report["stages"]] == [
+        ("inner", 2, 0),
+        ("outer", 0, 1),
+    ]
+    assert (report["cache_hits"], report["cache_misses"]) == (2, 1)
+
+
+def test_cli_flag_enables_stats(monkeypatch, tmp_path):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    monkeypatch.delenv(render_stats.ENV_VAR, raising=False)
+    monkeypatch.setattr(controller, "list_styles", lambda: [])
+    monkeypatch.setattr(cli_mod, "ensure_unique_ids", lambda *_: None)
+    cli_mod.PromptCLI().main(["--render-stats", "--list", "--flat"])
+    assert os.environ.pop(render_stats.ENV_VAR) == "1"
@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import prompt_automation.cli as cli_mod
+import prompt_automation.cli.controller as controller
+from prompt_automation import startup_profile
+
+
+def test_profiler_records_phases_and_emits_once(tmp_path):
+    prof = startup_profile.StartupProfiler()
+    with prof.phase("env_file"):
+        pass
+    end = prof.start_phase("first_frame_paint")
+    end()
+    end()  # idempotent
+    assert prof.emit("0") is None
+    target = tmp_path / "profile.jsonl"
+    data = prof.emit(str(target))
+    assert [p["name"] for p in data["phases"]] == ["env_file", "first_frame_paint"]
+    assert prof.emit(str(target)) is None
+    line = json.loads(target.read_text())
+    assert line["event"] == "startup_profile"
+    assert set(line["totals_ms"]) == {"env_file", "first_frame_paint"}
+
+
+def test_cli_flag_prints_phase_timings(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    monkeypatch.delenv(startup_profile.ENV_VAR, raising=False)
+    monkeypatch.setattr(controller, "list_styles", lambda: [])
+    monkeypatch.setattr(cli_mod, "ensure_unique_ids", lambda *_: None)
+    cli_mod.PromptCLI().main(["--profile-startup", "--list", "--flat"])
+    os.environ.pop(startup_profile.ENV_VAR)
+    report = json.loads(capsys.readouterr().err.strip().splitlines()[-1])
+    names = [p["name"] for p in report["phases"]]
+    assert names == ["env_file", "config_discovery", "ensure_unique_ids"]
+    assert all(p["duration_ms"] >= 0 for p in report["phases"])
+
+
+def test_env_var_appends_to_file(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    target = tmp_path / "startup.jsonl"
+    monkeypatch.setenv(startup_profile.ENV_VAR, str(target))
+    monkeypatch.setattr(controller, "list_styles", lambda: [])
+    monkeypatch.setattr(cli_mod, "ensure_unique_ids", lambda *_: None)
+    for _ in range(2):
+        cli_mod.PromptCLI().main(["--list", "--flat"])
+    assert len(target.read_text().splitlines()) == 2
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,89 @@
+import hashlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import prompt_automation.update as update
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def file_server():
+    files = {}
+    stats = {"paths": [], "active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                stats["paths"].append(self.path)
+                stats["active"] += 1
+                stats["peak"] = max(stats["peak"], stats["active"])
+            try:
+                time.sleep(0.05)
+                body = files.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                with lock:
+                    stats["active"] -= 1
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}", files, stats
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_apply_update_skips_matching_and_verifies_downloads(file_server, tmp_path, monkeypatch):
+    base, files, stats = file_server
+    monkeypatch.setattr(update, "ROOT_DIR", tmp_path)
+    monkeypatch.delenv("PROMPT_AUTOMATION_MANIFEST_AUTO", raising=False)
+    (tmp_path / "same.txt").write_bytes(b"unchanged")
+    files.update({"/same.txt": b"unchanged", "/new.txt": b"new", "/bad.txt": b"tampered", "/plain.txt": b"plain"})
+    manifest = {
+        "version": "9",
+        "files": {
+            "same.txt": {"url": f"{base}/same.txt", "sha256": _digest(b"unchanged")},
+            "sub/new.txt": {"url": f"{base}/new.txt", "sha256": _digest(b"new").upper()},
+            "bad.txt": {"url": f"{base}/bad.txt", "sha256": _digest(b"expected")},
+            "plain.txt": f"{base}/plain.txt",
+        },
+    }
+    update.apply_update(manifest)
+    assert "/same.txt" not in stats["paths"]
+    assert (tmp_path / "sub" / "new.txt").read_bytes() == b"new"
+    assert (tmp_path / "plain.txt").read_bytes() == b"plain"
+    assert not (tmp_path / "bad.txt").exists()
+    assert not list(tmp_path.glob("*.bak"))
+
+
+def test_downloads_run_concurrently_within_bound(file_server, tmp_path, monkeypatch):
+    base, files, stats = file_server
+    monkeypatch.setattr(update, "ROOT_DIR", tmp_path)
+    monkeypatch.setattr(update, "DOWNLOAD_WORKERS", 3)
+    manifest = {"version": "9", "files": {}}
+    for i in range(9):
+        files[f"/f{i}.txt"] = f"file {i}".encode()
+        manifest["files"][f"f{i}.txt"] = {"url": f"{base}/f{i}.txt", "sha256": _digest(f"file {i}".encode())}
+    update.apply_update(manifest)
+    assert 1 < stats["peak"] <= 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"f{i}.txt" for i in range(9)]
@@ -56,7 +56,7 @@ def test_windows_opt_in_env_is_required(monkeypatch, tmp_path):
     monkeypatch.setattr(upd, "_current_version", lambda: "0.0.0", raising=True)
     monkeypatch.setattr(upd, "_fetch_latest_version", lambda timeout=2.0: "0.0.1", raising=True)
     monkeypatch.setattr(upd, "_should_rate_limit", lambda last: False, raising=True)
-    monkeypatch.setattr(upd, "_have_pipx", lambda: True, raising=True)
+    monkeypatch.setattr(upd, "have_pipx", lambda: True, raising=True)
 
     # Guard: ensure upgrade is not invoked without opt-in
     called = {"upgrade": 0}
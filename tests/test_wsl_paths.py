@@ -0,0 +1,128 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from prompt_automation import file_reader, wsl_paths
+from prompt_automation.variables.storage import _normalize_reference_path
+
+
+@pytest.fixture
+def wsl(tmp_path, monkeypatch):
+    """Pretend to run under WSL with drive C mounted at ``tmp_path/c``."""
+    root = tmp_path / "mnt"
+    (root / "c").mkdir(parents=True)
+    monkeypatch.setattr(wsl_paths, "is_wsl", lambda: True)
+    monkeypatch.setattr(wsl_paths, "mount_root", lambda: f"{root}/")
+    monkeypatch.setattr(wsl_paths, "_snapshot_dir", lambda: tmp_path / "snapshots")
+    wsl_paths.to_local_path.cache_clear()
+    wsl_paths.clear_stat_cache()
+    file_reader.clear_file_cache()
+    yield root
+    wsl_paths.to_local_path.cache_clear()
+    wsl_paths.clear_stat_cache()
+    file_reader.clear_file_cache()
+
+
+def _old(path, seconds=60):
+    t = os.stat(path).st_mtime - seconds
+    os.utime(path, (t, t))
+
+
+def test_translation(wsl):
+    assert wsl_paths.to_local_path("C:\\Users\\me\\ref.md") == f"{wsl}/c/Users/me/ref.md"
+    assert wsl_paths.to_local_path("d:/Data/x.txt") == f"{wsl}/d/Data/x.txt"
+    assert wsl_paths.to_local_path("E:\\") == f"{wsl}/e"
+    assert wsl_paths.to_local_path("\\\\wsl$\\Ubuntu\\home\\me\\n.md") == "/home/me/n.md"
+    assert wsl_paths.to_local_path("//wsl.localhost/Debian/etc/hosts") == "/etc/hosts"
+    assert wsl_paths.to_local_path("/home/me/n.md") == "/home/me/n.md"
+    assert _normalize_reference_path(' "C:\\Users\\me\\ref.md" ') == f"{wsl}/c/Users/me/ref.md"
+    assert wsl_paths.is_drvfs(f"{wsl}/c/Users") and wsl_paths.is_drvfs(f"{wsl}/c")
+    assert not wsl_paths.is_drvfs(f"{wsl}/wsl/x") and not wsl_paths.is_drvfs("/home/me")
+
+
+def test_translation_is_identity_outside_wsl(monkeypatch):
+    monkeypatch.setattr(wsl_paths, "is_wsl", lambda: False)
+    wsl_paths.to_local_path.cache_clear()
+    try:
+        assert wsl_paths.to_local_path("C:\\Users\\me\\ref.md") == "C:\\Users\\me\\ref.md"
+        assert _normalize_reference_path("C:\\Users\\me\\ref.md") == "C:/Users/me/ref.md"
+    finally:
+        wsl_paths.to_local_path.cache_clear()
+
+
+def test_stat_cached_briefly_on_drvfs(wsl, monkeypatch):
+    f = wsl / "c" / "ref.md"
+    f.write_text("one")
+    assert wsl_paths.stat(f).st_size == 3
+    f.write_text("three")
+    assert wsl_paths.stat(f).st_size == 3  # within the TTL
+    monkeypatch.setenv(wsl_paths.STAT_TTL_ENV, "0")
+    assert wsl_paths.stat(f).st_size == 5
+    missing = wsl / "c" / "missing.md"
+    monkeypatch.delenv(wsl_paths.STAT_TTL_ENV)
+    assert not wsl_paths.exists(missing)
+    missing.write_text("x")
+    assert not wsl_paths.exists(missing)  # negative result cached too
+    wsl_paths.clear_stat_cache()
+    assert wsl_paths.exists(missing)
+
+
+def test_content_cache_ignores_stat_cache(wsl, tmp_path):
+    f = wsl / "c" / "ref.md"
+    f.write_text("v1")
+    _old(f)
+    assert file_reader.read_file_safe(str(f)) == "v1"
+    assert wsl_paths.exists(f)  # stat result now cached for the TTL
+    f.write_text("v2 edited")
+    _old(f, 30)
+    assert file_reader.read_file_safe(str(f)) == "v2 edited"
+    local = tmp_path / "local.md"
+    local.write_text("a")
+    assert wsl_paths.stat(local).st_size == 1
+    local.write_text("abc")
+    assert wsl_paths.stat(local).st_size == 3  # non-drvfs paths are never cached
+
+
+def test_read_file_safe_uses_windows_path_and_snapshot(wsl, tmp_path, monkeypatch):
+    f = wsl / "c" / "Users" / "ref.md"
+    f.parent.mkdir()
+    f.write_text("# Reference\n")
+    _old(f)
+    assert file_reader.read_file_safe("C:\\Users\\ref.md") == "# Reference\n"
+    snaps = list((tmp_path / "snapshots").glob("*.snap"))
+    assert len(snaps) == 1 and snaps[0].read_text() == "# Reference\n"
+
+    # A new process: empty memory caches, unchanged source -> served from the snapshot
+    file_reader.clear_file_cache()
+    wsl_paths.clear_stat_cache()
+    copies = []
+    real_copy = wsl_paths.shutil.copyfile
+    monkeypatch.setattr(wsl_paths.shutil, "copyfile", lambda a, b: copies.append(a) or real_copy(a, b))
+    assert file_reader.read_file_safe(str(f)) == "# Reference\n"
+    assert copies == []
+
+    # Source changed -> snapshot refreshed
+    f.write_text("# Reference v2\n")
+    _old(f, 30)
+    file_reader.clear_file_cache()
+    wsl_paths.clear_stat_cache()
+    assert file_reader.read_file_safe(str(f)) == "# Reference v2\n"
+    assert copies == [str(f)]
+    assert snaps[0].read_text() == "# Reference v2\n"
+
+
+def test_snapshots_skipped_off_drvfs_or_disabled(wsl, tmp_path, monkeypatch):
+    local = tmp_path / "local.md"
+    local.write_text("x")
+    assert wsl_paths.local_snapshot(local) is None
+    f = wsl / "c" / "a.md"
+    f.write_text("x")
+    monkeypatch.setenv(wsl_paths.SNAPSHOTS_ENV, "0")
+    assert wsl_paths.local_snapshot(f) is None
+    monkeypatch.setattr(wsl_paths, "SNAPSHOT_MAX_BYTES", 0)
+    monkeypatch.delenv(wsl_paths.SNAPSHOTS_ENV)
+    assert wsl_paths.local_snapshot(f) is None
@@ -181,3 +181,81 @@ def test_f1_binding_opens_shortcuts_dialog(monkeypatch):
         assert called and called[0][0] == "Shortcuts"
     finally:
         cleanup()
+
+
+def test_first_paint_handler_unbinds_itself(monkeypatch):
+    _install_tk(monkeypatch)
+    controller, cleanup = _load_controller(monkeypatch)
+
+    class Root:
+        """Mimics Tk's binding scripts for ``bind(..., add="+")``."""
+
+        def __init__(self):
+            self.scripts = {"<Expose>": "other_handler %W"}
+            self.commands = {}
+            self.idle = []
+            self.deleted = []
+
+        def bind(self, seq, func=None, add=None):
+            if func is None:
+                return self.scripts.get(seq, "")
+            if isinstance(func, str):
+                self.scripts[seq] = func
+                return None
+            funcid = f"cmd{len(self.commands)}"
+            self.commands[funcid] = func
+            line = f'if {{"[{funcid} %W]" == "break"}} break'
+            self.scripts[seq] = self.scripts.get(seq, "") + "\n" + line if add else line
+            return funcid
+
+        def unbind(self, seq):
+            self.scripts.pop(seq, None)
+
+        def deletecommand(self, name):
+            self.deleted.append(name)
+
+        def after_idle(self, fn):
+            self.idle.append(fn)
+
+        def expose(self):
+            for funcid, fn in list(self.commands.items()):
+                if funcid in self.scripts.get("<Expose>", "") and funcid not in self.deleted:
+                    fn(None)
+            while self.idle:
+                self.idle.pop(0)()
+
+    try:
+        root = Root()
+        app = types.SimpleNamespace(root=root)
+        calls = []
+        controller.SingleWindowApp._after_first_paint(app, lambda: calls.append(1))
+        root.expose()
+        root.expose()
+        assert calls == [1]
+        assert root.deleted == ["cmd0"]
+        assert root.scripts["<Expose>"] == "other_handler %W"
+    finally:
+        cleanup()
+
+
+def test_dead_lettered_todoist_tasks_notify(monkeypatch, tmp_path):
+    _install_tk(monkeypatch)
+    controller, cleanup = _load_controller(monkeypatch)
+    from prompt_automation.gui import notifications, ui_queue
+    from prompt_automation.services import todoist_queue
+
+    queue = todoist_queue.TodoistQueue(tmp_path / "q.json")
+    monkeypatch.setattr(todoist_queue, "get_queue", lambda: queue)
+    monkeypatch.setattr(todoist_queue, "resume", lambda: None)
+    shown = []
+    monkeypatch.setattr(notifications, "_show", lambda root, msg, timeout: shown.append(msg))
+    try:
+        root = types.SimpleNamespace(after=lambda ms, fn: None)
+        app = types.SimpleNamespace(root=root, _log=None)
+        controller.SingleWindowApp._resume_todoist_queue(app)
+        queue.on_dead([{"summary": "Call Bob", "last_error": "401 Unauthorized"}, {"summary": "x"}])
+        assert shown == []  # only queued; runs on the Tk thread
+        getattr(root, ui_queue._ATTR).get_nowait()()
+        assert shown == ['Todoist: could not send "Call Bob" (and 1 more) after retries: 401 Unauthorized']
+    finally:
+        cleanup()
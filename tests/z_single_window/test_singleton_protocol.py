@@ -0,0 +1,131 @@
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from prompt_automation.gui.single_window import singleton
+
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='requires AF_UNIX')
+
+
+def _start(monkeypatch, tmp_path, handlers=None):
+    monkeypatch.setenv('PROMPT_AUTOMATION_SINGLETON_SOCKET', str(tmp_path / 'gui.sock'))
+    monkeypatch.delenv('PROMPT_AUTOMATION_SINGLETON_FORCE_TCP', raising=False)
+    focused = []
+    t = singleton.start_server(lambda: focused.append(True), handlers=handlers)
+    if t is None:
+        pytest.skip('unix sockets unavailable in this sandbox')
+    return focused
+
+
+def _wait_for(pred, timeout=2.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        if pred():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_legacy_focus_still_supported(monkeypatch, tmp_path):
+    focused = _start(monkeypatch, tmp_path)
+    assert singleton.connect_and_focus_if_running()
+    assert _wait_for(lambda: focused)
+
+
+def test_ping_and_unknown_command(monkeypatch, tmp_path):
+    _start(monkeypatch, tmp_path)
+    reply = singleton.send_command('ping')
+    assert reply['ok'] is True
+    assert reply['protocol'] == singleton.PROTOCOL_VERSION
+    bad = singleton.send_command('NOPE')
+    assert bad['ok'] is False and 'unknown command' in bad['error']
+
+
+def test_custom_handler_and_pipelined_requests(monkeypatch, tmp_path):
+    seen = []
+
+    def _show(req):
+        seen.append(req['template'])
+        return {'template': req['template']}
+
+    _start(monkeypatch, tmp_path, handlers={'show': _show})
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(2)
+        s.connect(str(tmp_path / 'gui.sock'))
+        s.sendall(
+            singleton.encode_frame({'cmd': 'SHOW', 'template': 7, 'id': 1})
+            + singleton.encode_frame({'cmd': 'PING', 'id': 2})
+        )
+        buf = b''
+        while buf.count(b'\n') < 2:
+            buf += s.recv(4096)
+    first, second = [json.loads(l) for l in buf.splitlines()]
+    assert first == {'ok': True, 'id': 1, 'template': 7}
+    assert second['id'] == 2 and second['ok'] is True
+    assert seen == [7]
+
+
+def test_render_command_returns_text(monkeypatch, tmp_path):
+    _start(monkeypatch, tmp_path)
+    tmpl_path = tmp_path / 'greet.json'
+    tmpl_path.write_text(json.dumps({
+        'id': 'ipc-greet',
+        'title': 'Greet',
+        'style': 'Unit',
+        'template': ['Hello {{name}}'],
+        'placeholders': [{'name': 'name'}],
+    }))
+    reply = singleton.send_command('RENDER', template=str(tmpl_path), values={'name': 'IPC'})
+    assert reply['ok'] is True
+    assert reply['text'].startswith('Hello IPC')
+    missing = singleton.send_command('RENDER', template=str(tmp_path / 'missing.json'))
+    assert missing['ok'] is False and 'not found' in missing['error']
+
+
+def test_send_command_without_instance(monkeypatch, tmp_path):
+    monkeypatch.setenv('PROMPT_AUTOMATION_SINGLETON_SOCKET', str(tmp_path / 'none.sock'))
+    monkeypatch.setattr('pathlib.Path.home', lambda: tmp_path)
+    assert singleton.send_command('PING') is None
+
+
+def test_slow_render_does_not_block_other_clients(monkeypatch, tmp_path):
+    import threading
+
+    release = threading.Event()
+
+    def _slow_render(req):
+        release.wait(5)
+        return {'text': 'rendered'}
+
+    _start(monkeypatch, tmp_path, handlers={'render': _slow_render})
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s, \
+            socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as half:
+        for conn in (s, half):
+            conn.settimeout(3)
+            conn.connect(str(tmp_path / 'gui.sock'))
+        s.sendall(
+            singleton.encode_frame({'cmd': 'RENDER', 'id': 1})
+            + singleton.encode_frame({'cmd': 'PING', 'id': 2})
+        )
+        half.sendall(b'{"cmd": "RENDER", "id": 3}')
+        half.shutdown(socket.SHUT_WR)  # legacy-style client: no newline, then EOF
+        started = time.time()
+        reply = singleton.send_command('PING')
+        assert reply['ok'] is True and time.time() - started < 2
+        release.set()
+        buf = b''
+        while buf.count(b'\n') < 2:
+            buf += s.recv(4096)
+        late = b''
+        while not late.endswith(b'\n'):
+            late += half.recv(4096)
+    # Replies on one connection keep request order.
+    assert [json.loads(l)['id'] for l in buf.splitlines()] == [1, 2]
+    assert json.loads(late) == {'ok': True, 'id': 3, 'text': 'rendered'}